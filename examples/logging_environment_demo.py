@@ -16,7 +16,7 @@ sys.path.insert(0, str(src_path))
 
 try:
     from src.infrastructure.logging import configure_logging, get_logger
-    from src.infrastructure.logging.config import get_log_config, _is_running_locally
+    from src.infrastructure.logging.config import get_log_config, _is_running_locally, reset_log_config_cache
 except ImportError:
     print("Could not import logging modules. Make sure you're running from the project root.")
     print(f"Tried to import from: {src_path}")
@@ -134,8 +134,7 @@ def demo_different_environments():
             os.environ[key] = value
         
         # Clear the cached detection result
-        if hasattr(get_log_config, '_logged_detection'):
-            delattr(get_log_config, '_logged_detection')
+        reset_log_config_cache()
         
         # Get configuration
         is_local = _is_running_locally()
@@ -169,8 +168,7 @@ def demo_override_behavior():
     })
     
     # Clear cached detection
-    if hasattr(get_log_config, '_logged_detection'):
-        delattr(get_log_config, '_logged_detection')
+    reset_log_config_cache()
     
     config = get_log_config()
     print(f"  Environment: {config.environment}")
@@ -186,8 +184,7 @@ def demo_override_behavior():
     })
     
     # Clear cached detection
-    if hasattr(get_log_config, '_logged_detection'):
-        delattr(get_log_config, '_logged_detection')
+    reset_log_config_cache()
     
     config = get_log_config()
     print(f"  Environment: {config.environment}")
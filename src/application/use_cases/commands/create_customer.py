@@ -1,13 +1,12 @@
 from dataclasses import dataclass
 from typing import Any
-from uuid import uuid4
 
 from src.domain.entities.customer import Customer
 from src.domain.repositories.customer_repository import CustomerRepository
-from src.shared_kernel import CustomerId, Email
+from src.shared_kernel import CustomerId, Email, ResourceAlreadyExistsError, uuid7
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CreateCustomerCommand:
     name: str
     email: str
@@ -19,20 +18,19 @@ class CreateCustomerUseCase:
         self._customer_repo = customer_repository
 
     async def execute(self, command: CreateCustomerCommand) -> Customer:
-        # Check if customer with email already exists
-        existing = await self._customer_repo.find_by_email(command.email)
-        if existing:
-            raise ValueError(f"Customer with email {command.email} already exists")
-
         # Create new customer using factory method
-        customer_id = CustomerId(uuid4())
+        customer_id = CustomerId(uuid7())
         email = Email(command.email)
 
         customer = Customer.create(
             customer_id=customer_id,
             name=command.name,
             email=email,
-            preferences=command.preferences or {},
+            preferences=command.preferences,
         )
 
-        return await self._customer_repo.save(customer)
+        # Email uniqueness is enforced by the repository on save
+        try:
+            return await self._customer_repo.save(customer)
+        except ResourceAlreadyExistsError as e:
+            raise ValueError(f"Customer with email {command.email} already exists") from e
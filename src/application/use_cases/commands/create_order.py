@@ -1,15 +1,15 @@
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from src.domain.entities.order import Order
 from src.domain.repositories.customer_repository import CustomerRepository
 from src.domain.repositories.order_repository import OrderRepository
-from src.shared_kernel import CustomerId, Money, OrderId
+from src.shared_kernel import CustomerId, Money, OrderId, uuid7
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CreateOrderCommand:
     customer_id: UUID
     total_amount: Decimal
@@ -32,7 +32,7 @@ class CreateOrderUseCase:
             raise ValueError("Cannot create order for inactive customer")
 
         # Create new order using factory method
-        order_id = OrderId(uuid4())
+        order_id = OrderId(uuid7())
         customer_id = CustomerId(command.customer_id)
         total_amount = Money(command.total_amount, command.currency)
 
@@ -40,7 +40,7 @@ class CreateOrderUseCase:
             order_id=order_id,
             customer_id=customer_id,
             total_amount=total_amount,
-            details=command.details or {},
+            details=command.details,
         )
 
         return await self._order_repo.save(order)
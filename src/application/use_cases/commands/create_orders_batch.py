@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+
+from src.application.use_cases.commands.create_order import CreateOrderCommand
+from src.domain.entities.order import Order
+from src.domain.repositories.customer_repository import CustomerRepository
+from src.domain.repositories.order_repository import OrderRepository
+from src.shared_kernel import CustomerId, Money, OrderId, uuid7
+
+
+@dataclass(frozen=True, slots=True)
+class CreateOrdersBatchCommand:
+    orders: list[CreateOrderCommand]
+
+
+class CreateOrdersBatchUseCase:
+    def __init__(self, order_repository: OrderRepository, customer_repository: CustomerRepository) -> None:
+        self._order_repo = order_repository
+        self._customer_repo = customer_repository
+
+    async def execute(self, command: CreateOrdersBatchCommand) -> list[Order]:
+        if not command.orders:
+            return []
+
+        # Load every referenced customer in one query instead of one per order
+        customers = await self._customer_repo.find_by_ids({c.customer_id for c in command.orders})
+
+        # Validate the whole batch before creating anything
+        for order_command in command.orders:
+            customer = customers.get(order_command.customer_id)
+            if not customer:
+                raise ValueError(f"Customer with ID {order_command.customer_id} not found")
+
+            if not customer.is_active:
+                raise ValueError("Cannot create order for inactive customer")
+
+        orders = [
+            Order.create(
+                order_id=OrderId(uuid7()),
+                customer_id=CustomerId(order_command.customer_id),
+                total_amount=Money(order_command.total_amount, order_command.currency),
+                details=order_command.details,
+            )
+            for order_command in command.orders
+        ]
+
+        return await self._order_repo.save_many(orders)
@@ -3,10 +3,10 @@
 from dataclasses import dataclass
 
 from src.domain.entities.customer import Customer
-from src.domain.repositories.customer_repository import CustomerRepository
+from src.domain.repositories.customer_repository import CustomerCursor, CustomerRepository
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchCustomersQuery:
     """Query parameters for searching customers."""
 
@@ -14,7 +14,7 @@ class SearchCustomersQuery:
     email_contains: str | None = None
     is_active: bool | None = None
     limit: int = 50
-    offset: int = 0
+    cursor: CustomerCursor | None = None
 
     def __post_init__(self) -> None:
         """Validate query parameters."""
@@ -22,8 +22,6 @@ class SearchCustomersQuery:
             raise ValueError("Limit must be positive")
         if self.limit > 100:
             raise ValueError("Limit cannot exceed 100")
-        if self.offset < 0:
-            raise ValueError("Offset cannot be negative")
 
 
 class SearchCustomersUseCase:
@@ -32,19 +30,19 @@ class SearchCustomersUseCase:
     def __init__(self, customer_repository: CustomerRepository) -> None:
         self._customer_repository = customer_repository
 
-    async def execute(self, query: SearchCustomersQuery) -> list[Customer]:
+    async def execute(self, query: SearchCustomersQuery) -> tuple[list[Customer], CustomerCursor | None]:
         """Execute the search query.
 
         Args:
             query: Search parameters
 
         Returns:
-            List of customers matching the criteria
+            Customers matching the criteria and the cursor for the next page
         """
         return await self._customer_repository.search(
             name_contains=query.name_contains,
             email_contains=query.email_contains,
             is_active=query.is_active,
             limit=query.limit,
-            offset=query.offset,
+            cursor=query.cursor,
         )
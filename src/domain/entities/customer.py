@@ -1,5 +1,7 @@
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from types import MappingProxyType
 from typing import Any
 from uuid import UUID, uuid4
 
@@ -12,8 +14,11 @@ from src.shared_kernel import (
     PhoneNumber,
 )
 
+# Shared read-only default so creating an aggregate without preferences allocates nothing
+_NO_PREFERENCES: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CustomerCreated(DomainEvent):
     """Domain event raised when a customer is created."""
 
@@ -24,7 +29,7 @@ class CustomerCreated(DomainEvent):
     customer_email: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CustomerDeactivated(DomainEvent):
     """Domain event raised when a customer is deactivated."""
 
@@ -34,7 +39,7 @@ class CustomerDeactivated(DomainEvent):
     reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Customer(AggregateRoot):
     """Customer aggregate root with enhanced value objects and domain events."""
 
@@ -44,14 +49,14 @@ class Customer(AggregateRoot):
     address: Address | None = None
     phone: PhoneNumber | None = None
     is_active: bool = True
-    preferences: dict[str, Any] = field(default_factory=dict)
+    preferences: Mapping[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
     def __post_init__(self) -> None:
         """Initialize the aggregate and validate business rules."""
         # Set the entity ID from customer_id for base Entity class
-        object.__setattr__(self, "id", self.customer_id.value)
+        self.id = self.customer_id.value
 
         self._validate_business_rules()
 
@@ -71,9 +76,10 @@ class Customer(AggregateRoot):
         email: Email,
         address: Address | None = None,
         phone: PhoneNumber | None = None,
-        preferences: dict[str, Any] | None = None,
+        preferences: Mapping[str, Any] | None = None,
     ) -> "Customer":
         """Factory method to create a new customer with domain event."""
+        now = datetime.now(UTC)
         customer = cls(
             id=customer_id.value,
             customer_id=customer_id,
@@ -81,17 +87,19 @@ class Customer(AggregateRoot):
             email=email,
             address=address,
             phone=phone,
-            preferences=preferences or {},
+            preferences=preferences if preferences is not None else _NO_PREFERENCES,
+            created_at=now,
+            updated_at=now,
         )
 
         # Raise domain event
         customer.add_domain_event(
             CustomerCreated(
                 event_id=uuid4(),
-                occurred_at=datetime.now(UTC),
+                occurred_at=now,
                 customer_id=customer_id,
                 customer_name=name,
-                customer_email=str(email),
+                customer_email=email.value,
             )
         )
 
@@ -102,25 +110,15 @@ class Customer(AggregateRoot):
         if not self.is_active:
             raise ValueError("Customer is already deactivated")
 
-        deactivated_customer = Customer(
-            id=self.customer_id.value,
-            customer_id=self.customer_id,
-            name=self.name,
-            email=self.email,
-            address=self.address,
-            phone=self.phone,
-            is_active=False,
-            preferences=self.preferences,
-            created_at=self.created_at,
-            updated_at=datetime.now(UTC),
-        )
+        now = datetime.now(UTC)
+        deactivated_customer = self._successor(is_active=False, updated_at=now)
 
-        # Copy domain events and add deactivation event
-        deactivated_customer._domain_events = self._domain_events.copy()
+        # Hand over pending domain events and add deactivation event
+        self._hand_over_domain_events(deactivated_customer)
         deactivated_customer.add_domain_event(
             CustomerDeactivated(
                 event_id=uuid4(),
-                occurred_at=datetime.now(UTC),
+                occurred_at=now,
                 customer_id=self.customer_id,
                 reason=reason,
             )
@@ -130,30 +128,8 @@ class Customer(AggregateRoot):
 
     def update_address(self, address: Address) -> "Customer":
         """Update customer address."""
-        return Customer(
-            id=self.customer_id.value,
-            customer_id=self.customer_id,
-            name=self.name,
-            email=self.email,
-            address=address,
-            phone=self.phone,
-            is_active=self.is_active,
-            preferences=self.preferences,
-            created_at=self.created_at,
-            updated_at=datetime.now(UTC),
-        )
+        return self._successor(address=address, updated_at=datetime.now(UTC))
 
     def update_phone(self, phone: PhoneNumber) -> "Customer":
         """Update customer phone number."""
-        return Customer(
-            id=self.customer_id.value,
-            customer_id=self.customer_id,
-            name=self.name,
-            email=self.email,
-            address=self.address,
-            phone=phone,
-            is_active=self.is_active,
-            preferences=self.preferences,
-            created_at=self.created_at,
-            updated_at=datetime.now(UTC),
-        )
+        return self._successor(phone=phone, updated_at=datetime.now(UTC))
@@ -1,7 +1,9 @@
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from decimal import Decimal
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 from uuid import UUID, uuid4
 
@@ -14,6 +16,11 @@ from src.shared_kernel import (
     OrderId,
 )
 
+# Read-only empty details shared by every order created without any
+_NO_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
+_ZERO = Decimal("0")
+
 
 class OrderStatus(Enum):
     PENDING = "PENDING"
@@ -23,7 +30,11 @@ class OrderStatus(Enum):
     CANCELLED = "CANCELLED"
 
 
-@dataclass(frozen=True)
+# Statuses from which an order may still be cancelled
+_CANCELLABLE_STATUSES = frozenset({OrderStatus.PENDING, OrderStatus.CONFIRMED})
+
+
+@dataclass(frozen=True, slots=True)
 class OrderCreated(DomainEvent):
     """Domain event raised when an order is created."""
 
@@ -34,7 +45,7 @@ class OrderCreated(DomainEvent):
     total_amount: Money
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderCancelled(DomainEvent):
     """Domain event raised when an order is cancelled."""
 
@@ -46,7 +57,7 @@ class OrderCancelled(DomainEvent):
     reason: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderStatusChanged(DomainEvent):
     """Domain event raised when order status changes."""
 
@@ -58,7 +69,7 @@ class OrderStatusChanged(DomainEvent):
     new_status: OrderStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class Order(AggregateRoot):
     """Order aggregate root with enhanced value objects and domain events."""
 
@@ -66,20 +77,20 @@ class Order(AggregateRoot):
     customer_id: CustomerId
     total_amount: Money
     status: OrderStatus = OrderStatus.PENDING
-    details: dict[str, Any] = field(default_factory=dict)
+    details: Mapping[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
     def __post_init__(self) -> None:
         """Initialize the aggregate and validate business rules."""
         # Set the entity ID from order_id for base Entity class
-        object.__setattr__(self, "id", self.order_id.value)
+        self.id = self.order_id.value
 
         self._validate_business_rules()
 
     def _validate_business_rules(self) -> None:
         """Validate order business rules."""
-        if self.total_amount.amount <= Decimal("0"):
+        if self.total_amount.amount <= _ZERO:
             raise BusinessRuleViolationError(
                 "Order total amount must be greater than zero",
                 rule_name="MinimumOrderAmount",
@@ -91,22 +102,25 @@ class Order(AggregateRoot):
         order_id: OrderId,
         customer_id: CustomerId,
         total_amount: Money,
-        details: dict[str, Any] | None = None,
+        details: Mapping[str, Any] | None = None,
     ) -> "Order":
         """Factory method to create a new order with domain event."""
+        now = datetime.now(UTC)
         order = cls(
             id=order_id.value,
             order_id=order_id,
             customer_id=customer_id,
             total_amount=total_amount,
-            details=details or {},
+            details=details if details is not None else _NO_DETAILS,
+            created_at=now,
+            updated_at=now,
         )
 
         # Raise domain event
         order.add_domain_event(
             OrderCreated(
                 event_id=uuid4(),
-                occurred_at=datetime.now(UTC),
+                occurred_at=now,
                 order_id=order_id,
                 customer_id=customer_id,
                 total_amount=total_amount,
@@ -117,7 +131,7 @@ class Order(AggregateRoot):
 
     def can_be_cancelled(self) -> bool:
         """Check if order can be cancelled based on business rules."""
-        return self.status in [OrderStatus.PENDING, OrderStatus.CONFIRMED]
+        return self.status in _CANCELLABLE_STATUSES
 
     def cancel(self, reason: str = "Customer request") -> "Order":
         """Cancel the order and raise domain event."""
@@ -127,23 +141,15 @@ class Order(AggregateRoot):
                 rule_name="OrderCancellationRule",
             )
 
-        cancelled_order = Order(
-            id=self.order_id.value,
-            order_id=self.order_id,
-            customer_id=self.customer_id,
-            total_amount=self.total_amount,
-            status=OrderStatus.CANCELLED,
-            details=self.details,
-            created_at=self.created_at,
-            updated_at=datetime.now(UTC),
-        )
+        now = datetime.now(UTC)
+        cancelled_order = self._successor(status=OrderStatus.CANCELLED, updated_at=now)
 
-        # Copy domain events and add cancellation event
-        cancelled_order._domain_events = self._domain_events.copy()
+        # Hand over pending domain events and add cancellation event
+        self._hand_over_domain_events(cancelled_order)
         cancelled_order.add_domain_event(
             OrderCancelled(
                 event_id=uuid4(),
-                occurred_at=datetime.now(UTC),
+                occurred_at=now,
                 order_id=self.order_id,
                 customer_id=self.customer_id,
                 previous_status=self.status,
@@ -185,23 +191,15 @@ class Order(AggregateRoot):
 
     def _change_status(self, new_status: OrderStatus) -> "Order":
         """Internal method to change order status and raise domain event."""
-        updated_order = Order(
-            id=self.order_id.value,
-            order_id=self.order_id,
-            customer_id=self.customer_id,
-            total_amount=self.total_amount,
-            status=new_status,
-            details=self.details,
-            created_at=self.created_at,
-            updated_at=datetime.now(UTC),
-        )
+        now = datetime.now(UTC)
+        updated_order = self._successor(status=new_status, updated_at=now)
 
-        # Copy domain events and add status change event
-        updated_order._domain_events = self._domain_events.copy()
+        # Hand over pending domain events and add status change event
+        self._hand_over_domain_events(updated_order)
         updated_order.add_domain_event(
             OrderStatusChanged(
                 event_id=uuid4(),
-                occurred_at=datetime.now(UTC),
+                occurred_at=now,
                 order_id=self.order_id,
                 customer_id=self.customer_id,
                 old_status=self.status,
@@ -1,24 +1,46 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Collection
+from datetime import datetime
 from uuid import UUID
 
 from src.domain.entities.customer import Customer
 
+# Keyset pagination position: (created_at, id) of the last customer on a page
+CustomerCursor = tuple[datetime, UUID]
+
 
 class CustomerRepository(ABC):
     @abstractmethod
     async def find_by_id(self, customer_id: UUID) -> Customer | None:
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, customer_ids: Collection[UUID]) -> dict[UUID, Customer]:
+        """Load several customers in one round-trip, keyed by id; unknown ids are omitted."""
+        pass
+
     @abstractmethod
     async def find_by_email(self, email: str) -> Customer | None:
         pass
 
     @abstractmethod
     async def save(self, customer: Customer) -> Customer:
+        """Persist a customer.
+
+        Raises:
+            ResourceAlreadyExistsError: If another customer already uses the email
+        """
         pass
 
+    async def save_many(self, customers: list[Customer]) -> list[Customer]:
+        """Persist several customers; implementations should do so in a single round-trip."""
+        for customer in customers:
+            await self.save(customer)
+        return customers
+
     @abstractmethod
-    async def list_all(self) -> list[Customer]:
+    def list_all(self) -> AsyncIterator[Customer]:
+        """Stream all customers without materializing the full result set."""
         pass
 
     @abstractmethod
@@ -28,7 +50,11 @@ class CustomerRepository(ABC):
         email_contains: str | None = None,
         is_active: bool | None = None,
         limit: int = 50,
-        offset: int = 0,
-    ) -> list[Customer]:
-        """Search customers with optional filters."""
+        cursor: CustomerCursor | None = None,
+    ) -> tuple[list[Customer], CustomerCursor | None]:
+        """Search customers with optional filters using keyset pagination.
+
+        Results are ordered newest first by (created_at, id). Pass the returned
+        cursor back in to fetch the next page; it is None on the last page.
+        """
         pass
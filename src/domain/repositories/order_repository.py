@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 from uuid import UUID
 
 from src.domain.entities.order import Order
 
+# Keyset pagination position: (created_at, id) of the last order on a page
+OrderCursor = tuple[datetime, UUID]
+
 
 class OrderRepository(ABC):
     @abstractmethod
@@ -13,10 +18,27 @@ class OrderRepository(ABC):
     async def save(self, order: Order) -> Order:
         pass
 
+    async def save_many(self, orders: list[Order]) -> list[Order]:
+        """Persist several orders; implementations should do so in a single round-trip."""
+        for order in orders:
+            await self.save(order)
+        return orders
+
     @abstractmethod
-    async def find_by_customer(self, customer_id: UUID) -> list[Order]:
+    async def find_by_customer(
+        self,
+        customer_id: UUID,
+        limit: int | None = None,
+        cursor: OrderCursor | None = None,
+    ) -> list[Order]:
+        """Find orders for a customer, newest first by (created_at, id).
+
+        Without a limit every order is returned. To page, pass the
+        (created_at, id) of the last order received as the cursor.
+        """
         pass
 
     @abstractmethod
-    async def list_all(self) -> list[Order]:
+    def list_all(self) -> AsyncIterator[Order]:
+        """Stream all orders without materializing the full result set."""
         pass
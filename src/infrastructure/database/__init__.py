@@ -1,8 +1,17 @@
-# Database models exports
-try:
+# Database models exports, resolved lazily so importing this package does not load SQLAlchemy
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
     from .models import CustomerModel, OrderModel
 
-    __all__ = ["CustomerModel", "OrderModel"]
-except ImportError:
-    # Handle cases where SQLAlchemy models aren't available
-    pass
+__all__ = ["CustomerModel", "OrderModel"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        from . import models
+
+        value = getattr(models, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
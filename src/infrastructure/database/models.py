@@ -1,34 +0,0 @@
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Numeric, String
-from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
-
-Base = declarative_base()
-
-
-class CustomerModel(Base):
-    __tablename__ = "customers"
-
-    id = Column(UUID(as_uuid=True), primary_key=True)
-    name = Column(String(100), nullable=False)
-    email = Column(String(255), unique=True, nullable=False, index=True)
-    is_active = Column(Boolean, default=True)
-    preferences = Column(JSONB, default={})
-    created_at = Column(DateTime, nullable=False)
-    updated_at = Column(DateTime, nullable=False)
-
-    orders = relationship("OrderModel", back_populates="customer")
-
-
-class OrderModel(Base):
-    __tablename__ = "orders"
-
-    id = Column(UUID(as_uuid=True), primary_key=True)
-    customer_id = Column(UUID(as_uuid=True), ForeignKey("customers.id"), nullable=False)
-    total_amount = Column(Numeric(10, 2), nullable=False)
-    status = Column(String(20), nullable=False, index=True)
-    details = Column(JSONB, default={})
-    created_at = Column(DateTime, nullable=False)
-    updated_at = Column(DateTime, nullable=False)
-
-    customer = relationship("CustomerModel", back_populates="orders")
@@ -1,19 +1,26 @@
-from sqlalchemy import Boolean, Column, DateTime, String
+from sqlalchemy import Boolean, Column, DateTime, Index, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 Base = declarative_base()
 
 
 class CustomerModel(Base):
     __tablename__ = "customers"
+    # Trigram GIN indexes serve infix ILIKE searches (requires CREATE EXTENSION pg_trgm)
+    __table_args__ = (
+        Index("ix_customers_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_customers_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+        # Serves keyset pagination ordered by (created_at, id)
+        Index("ix_customers_created_id", "created_at", "id"),
+    )
 
     id = Column(PGUUID(as_uuid=True), primary_key=True)
     name = Column(String(255), nullable=False)
     email = Column(String(255), nullable=False, unique=True)
     is_active = Column(Boolean, default=True, nullable=False)
-    preferences = Column(JSONB, default=dict)
+    preferences = Column(JSONB, default=dict, server_default=text("'{}'::jsonb"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -1,19 +1,21 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Numeric, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Numeric, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 Base = declarative_base()
 
 
 class OrderModel(Base):
     __tablename__ = "orders"
+    # Postgres does not index foreign keys; this serves per-customer lookups and their keyset ordering
+    __table_args__ = (Index("ix_orders_customer_created", "customer_id", "created_at", "id"),)
 
     id = Column(PGUUID(as_uuid=True), primary_key=True)
     customer_id = Column(PGUUID(as_uuid=True), ForeignKey("customers.id"), nullable=False)
     total_amount = Column(Numeric(precision=10, scale=2), nullable=False)
     status = Column(String(50), nullable=False, default="pending")
-    details = Column(JSONB, default=dict)
+    details = Column(JSONB, default=dict, server_default=text("'{}'::jsonb"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
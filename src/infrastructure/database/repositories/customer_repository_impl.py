@@ -1,71 +1,248 @@
+import functools
+import operator
+from collections.abc import AsyncIterator, Collection
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+import orjson
+from asyncpg.exceptions import UniqueViolationError
+from sqlalchemy import Row, any_, bindparam, insert, select, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.customer import Customer
-from src.domain.repositories.customer_repository import CustomerRepository
+from src.domain.repositories.customer_repository import CustomerCursor, CustomerRepository
 from src.infrastructure.database.models import CustomerModel
+from src.shared_kernel import CustomerId, Email, ResourceAlreadyExistsError
+
+# Rows fetched per round-trip when streaming large result sets
+_STREAM_BATCH_SIZE = 500
+
+# Batches at least this large are written with COPY instead of a multi-row INSERT
+_COPY_THRESHOLD = 50
+
+# Reads select plain columns and build entities from rows, skipping ORM identity-map bookkeeping
+_COLUMNS = (
+    CustomerModel.id,
+    CustomerModel.name,
+    CustomerModel.email,
+    CustomerModel.is_active,
+    CustomerModel.preferences,
+    CustomerModel.created_at,
+    CustomerModel.updated_at,
+)
+_SELECT = select(*_COLUMNS)
+# Reads a loaded model's attributes in _COLUMNS order, so models and rows share one mapper
+_model_values = operator.attrgetter(*(column.key for column in _COLUMNS))
+
+# Hot lookups built once so every call reuses the same compiled SQL and prepared statement
+# = ANY(array) keeps one statement text for any batch size, unlike an expanding IN list
+_SELECT_BY_IDS = _SELECT.where(
+    CustomerModel.id == any_(bindparam("customer_ids", type_=ARRAY(PGUUID(as_uuid=True))))  # type: ignore
+)
+_SELECT_BY_EMAIL = _SELECT.where(CustomerModel.email == bindparam("email"))  # type: ignore
+
+# Postgres' default name for the column-level unique constraint on customers.email
+_EMAIL_UNIQUE_CONSTRAINT = "customers_email_key"
+
+
+def _is_email_conflict(error: Exception) -> bool:
+    """
+    Check whether a constraint error comes from the unique email constraint.
+
+    SQLAlchemy wraps the driver's adapted error in IntegrityError.orig; the adapted
+    error is raised from asyncpg's own exception, which carries the constraint name.
+    A bare asyncpg error (as raised by COPY) carries it directly.
+    """
+    cause: BaseException | None = getattr(error, "orig", error)
+    while cause is not None:
+        if getattr(cause, "constraint_name", None) == _EMAIL_UNIQUE_CONSTRAINT:
+            return True
+        cause = cause.__cause__
+    return False
+
+
+# Value objects are immutable, so rows with a recently seen email share one validated instance
+_email = functools.lru_cache(maxsize=4096)(Email)
 
 
 class PostgresCustomerRepository(CustomerRepository):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        # Session-scoped read cache; repeated lookups within a unit of work skip the round-trip
+        self._by_id_cache: dict[UUID, Customer] = {}
+        self._by_email_cache: dict[str, UUID] = {}
 
     async def find_by_id(self, customer_id: UUID) -> Customer | None:
-        stmt = select(CustomerModel).where(CustomerModel.id == customer_id)  # type: ignore
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
+        cached = self._by_id_cache.get(customer_id)
+        if cached is not None:
+            return cached
+
+        # Primary-key get checks the session identity map before issuing its SELECT
+        model = await self._session.get(CustomerModel, customer_id)
 
-        if not model:
+        if model is None:
             return None
 
-        return self._model_to_entity(model)
+        return self._remember(self._row_to_entity(_model_values(model)))
+
+    async def find_by_ids(self, customer_ids: Collection[UUID]) -> dict[UUID, Customer]:
+        found = {cid: self._by_id_cache[cid] for cid in customer_ids if cid in self._by_id_cache}
+        missing = [cid for cid in customer_ids if cid not in found]
+        if not missing:
+            return found
+
+        result = await self._session.execute(_SELECT_BY_IDS, {"customer_ids": missing})
+        for row in result:
+            found[row.id] = self._remember(self._row_to_entity(row))
+
+        return found
 
     async def find_by_email(self, email: str) -> Customer | None:
-        stmt = select(CustomerModel).where(CustomerModel.email == email)  # type: ignore
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
+        cached_id = self._by_email_cache.get(email)
+        if cached_id is not None:
+            return self._by_id_cache[cached_id]
+
+        result = await self._session.execute(_SELECT_BY_EMAIL, {"email": email})
+        row = result.one_or_none()
 
-        if not model:
+        if not row:
             return None
 
-        return self._model_to_entity(model)
+        return self._remember(self._row_to_entity(row))
 
     async def save(self, customer: Customer) -> Customer:
+        self._forget(customer)
         model = self._entity_to_model(customer)
         self._session.add(model)
-        await self._session.commit()
-        return customer
+        try:
+            await self._session.commit()
+        except IntegrityError as e:
+            # Unique constraint on email is the source of truth for duplicates; other
+            # violations (such as a primary key clash) are not about the email
+            await self._session.rollback()
+            if not _is_email_conflict(e):
+                raise
+            raise ResourceAlreadyExistsError("Customer", "email", str(customer.email)) from e
+        return self._remember(customer)
+
+    async def save_many(self, customers: list[Customer]) -> list[Customer]:
+        if not customers:
+            return customers
+
+        for customer in customers:
+            self._forget(customer)
+        values = [self._entity_to_values(customer) for customer in customers]
+        try:
+            if len(values) >= _COPY_THRESHOLD:
+                await self._copy(values)
+            else:
+                await self._session.execute(insert(CustomerModel), values)
+            await self._session.commit()
+        except (IntegrityError, UniqueViolationError) as e:
+            # The whole batch is rolled back; the constraint error does not say which email clashed
+            await self._session.rollback()
+            if not _is_email_conflict(e):
+                raise
+            emails = ", ".join(str(customer.email) for customer in customers)
+            raise ResourceAlreadyExistsError("Customer", "email", emails) from e
+        for customer in customers:
+            self._remember(customer)
+        return customers
+
+    async def list_all(self) -> AsyncIterator[Customer]:
+        stmt = _SELECT.execution_options(yield_per=_STREAM_BATCH_SIZE)
+        result = await self._session.stream(stmt)
+
+        async for row in result:
+            yield self._row_to_entity(row)
+
+    async def search(
+        self,
+        name_contains: str | None = None,
+        email_contains: str | None = None,
+        is_active: bool | None = None,
+        limit: int = 50,
+        cursor: CustomerCursor | None = None,
+    ) -> tuple[list[Customer], CustomerCursor | None]:
+        """Search customers with all filters and keyset pagination pushed down to SQL."""
+        stmt = _SELECT
+        if name_contains:
+            stmt = stmt.where(CustomerModel.name.ilike(_contains_pattern(name_contains)))  # type: ignore
+        if email_contains:
+            stmt = stmt.where(CustomerModel.email.ilike(_contains_pattern(email_contains)))  # type: ignore
+        if is_active is not None:
+            stmt = stmt.where(CustomerModel.is_active == is_active)  # type: ignore
+        if cursor:
+            stmt = stmt.where(tuple_(CustomerModel.created_at, CustomerModel.id) < cursor)  # type: ignore
+        # Fetch one extra row to know whether another page exists
+        stmt = stmt.order_by(CustomerModel.created_at.desc(), CustomerModel.id.desc()).limit(limit + 1)  # type: ignore
 
-    async def list_all(self) -> list[Customer]:
-        stmt = select(CustomerModel)
         result = await self._session.execute(stmt)
-        models = result.scalars().all()
 
-        return [self._model_to_entity(model) for model in models]
+        # Map straight off the result; the look-ahead row is dropped after mapping
+        customers = [self._row_to_entity(row) for row in result]
+        if len(customers) <= limit:
+            return customers, None
+
+        del customers[limit:]
+        return customers, (customers[-1].created_at, customers[-1].id)
 
-    def _model_to_entity(self, model: CustomerModel) -> Customer:  # type: ignore
-        from src.shared_kernel import CustomerId, Email
+    def _remember(self, customer: Customer) -> Customer:
+        """Cache a customer loaded or saved through this session."""
+        self._by_id_cache[customer.id] = customer
+        self._by_email_cache[customer.email.value] = customer.id
+        return customer
+
+    def _forget(self, customer: Customer) -> None:
+        """Drop cached entries for a customer about to be written."""
+        previous = self._by_id_cache.pop(customer.id, None)
+        if previous is not None:
+            self._by_email_cache.pop(previous.email.value, None)
+        self._by_email_cache.pop(customer.email.value, None)
+
+    def _row_to_entity(self, row: Row | tuple) -> Customer:
+        id_, name, email, is_active, preferences, created_at, updated_at = row
 
         return Customer(
-            id=model.id,  # type: ignore # Will be overridden by __post_init__
-            customer_id=CustomerId(model.id),  # type: ignore
-            name=model.name,  # type: ignore
-            email=Email(model.email),  # type: ignore
-            is_active=model.is_active,  # type: ignore
-            preferences=model.preferences or {},  # type: ignore
-            created_at=model.created_at,  # type: ignore
-            updated_at=model.updated_at,  # type: ignore
+            id=id_,  # Will be overridden by __post_init__
+            customer_id=CustomerId(id_),
+            name=name,
+            email=_email(email),
+            is_active=is_active,
+            preferences=preferences,
+            created_at=created_at,
+            updated_at=updated_at,
         )
 
-    def _entity_to_model(self, entity: Customer) -> CustomerModel:  # type: ignore
-        return CustomerModel(
-            id=entity.id,  # type: ignore
-            name=entity.name,  # type: ignore
-            email=entity.email,  # type: ignore
-            is_active=entity.is_active,  # type: ignore
-            preferences=entity.preferences,  # type: ignore
-            created_at=entity.created_at,  # type: ignore
-            updated_at=entity.updated_at,  # type: ignore
+    async def _copy(self, values: list[dict[str, Any]]) -> None:
+        """Stream rows into the customers table with COPY on the session's connection."""
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        # COPY bypasses SQLAlchemy's JSONB bind processing, so serialize preferences here
+        records = [tuple({**row, "preferences": orjson.dumps(row["preferences"]).decode()}.values()) for row in values]
+        await raw_connection.driver_connection.copy_records_to_table(  # type: ignore
+            CustomerModel.__tablename__, columns=list(values[0]), records=records
         )
+
+    def _entity_to_values(self, entity: Customer) -> dict[str, Any]:
+        return {
+            "id": entity.id,
+            "name": entity.name,
+            "email": entity.email.value,
+            "is_active": entity.is_active,
+            "preferences": dict(entity.preferences),
+            "created_at": entity.created_at,
+            "updated_at": entity.updated_at,
+        }
+
+    def _entity_to_model(self, entity: Customer) -> CustomerModel:  # type: ignore
+        return CustomerModel(**self._entity_to_values(entity))
+
+
+def _contains_pattern(value: str) -> str:
+    """Build an ILIKE infix pattern, escaping LIKE wildcards in the search term."""
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
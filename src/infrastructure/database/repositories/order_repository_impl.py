@@ -1,11 +1,46 @@
+import functools
+import operator
+from collections.abc import AsyncIterator
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+import orjson
+from sqlalchemy import Row, bindparam, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.entities.order import Order, OrderStatus
-from src.domain.repositories.order_repository import OrderRepository
+from src.domain.repositories.order_repository import OrderCursor, OrderRepository
 from src.infrastructure.database.models import OrderModel
+from src.shared_kernel import CustomerId, Money, OrderId
+
+# Rows fetched per round-trip when streaming large result sets
+_STREAM_BATCH_SIZE = 500
+
+# Batches at least this large are written with COPY instead of a multi-row INSERT
+_COPY_THRESHOLD = 50
+
+# Column-only reads: rows map straight onto Order without loading ORM instances
+_COLUMNS = (
+    OrderModel.id,
+    OrderModel.customer_id,
+    OrderModel.total_amount,
+    OrderModel.status,
+    OrderModel.details,
+    OrderModel.created_at,
+    OrderModel.updated_at,
+)
+_SELECT = select(*_COLUMNS)
+# Reads a loaded model's attributes in _COLUMNS order, so models and rows share one mapper
+_model_values = operator.attrgetter(*(column.key for column in _COLUMNS))
+
+# Hot lookups built once so every call reuses the same compiled SQL and prepared statement
+_SELECT_BY_CUSTOMER = _SELECT.where(OrderModel.customer_id == bindparam("customer_id")).order_by(  # type: ignore
+    OrderModel.created_at.desc(),  # type: ignore
+    OrderModel.id.desc(),  # type: ignore
+)
+
+# Orders are usually read per customer, so consecutive rows share one immutable CustomerId
+_customer_id = functools.lru_cache(maxsize=4096)(CustomerId)
 
 
 class PostgresOrderRepository(OrderRepository):
@@ -13,14 +48,13 @@ class PostgresOrderRepository(OrderRepository):
         self._session = session
 
     async def find_by_id(self, order_id: UUID) -> Order | None:
-        stmt = select(OrderModel).where(OrderModel.id == order_id)  # type: ignore
-        result = await self._session.execute(stmt)
-        model = result.scalar_one_or_none()
+        # Primary-key get checks the session identity map before issuing its SELECT
+        model = await self._session.get(OrderModel, order_id)
 
-        if not model:
+        if model is None:
             return None
 
-        return self._model_to_entity(model)
+        return self._row_to_entity(_model_values(model))
 
     async def save(self, order: Order) -> Order:
         model = self._entity_to_model(order)
@@ -28,41 +62,77 @@ class PostgresOrderRepository(OrderRepository):
         await self._session.commit()
         return order
 
-    async def find_by_customer(self, customer_id: UUID) -> list[Order]:
-        stmt = select(OrderModel).where(OrderModel.customer_id == customer_id)  # type: ignore
-        result = await self._session.execute(stmt)
-        models = result.scalars().all()
+    async def save_many(self, orders: list[Order]) -> list[Order]:
+        if not orders:
+            return orders
+
+        values = [self._entity_to_values(order) for order in orders]
+        if len(values) >= _COPY_THRESHOLD:
+            await self._copy(values)
+        else:
+            await self._session.execute(insert(OrderModel), values)
+        await self._session.commit()
+        return orders
+
+    async def find_by_customer(
+        self,
+        customer_id: UUID,
+        limit: int | None = None,
+        cursor: OrderCursor | None = None,
+    ) -> list[Order]:
+        stmt = _SELECT_BY_CUSTOMER
+
+        # Keyset pagination: continue strictly after the last order of the previous page
+        if cursor:
+            stmt = stmt.where(tuple_(OrderModel.created_at, OrderModel.id) < cursor)  # type: ignore
+        if limit is not None:
+            stmt = stmt.limit(limit)
 
-        return [self._model_to_entity(model) for model in models]
+        result = await self._session.execute(stmt, {"customer_id": customer_id})
 
-    async def list_all(self) -> list[Order]:
-        stmt = select(OrderModel)
-        result = await self._session.execute(stmt)
-        models = result.scalars().all()
+        return [self._row_to_entity(row) for row in result]
 
-        return [self._model_to_entity(model) for model in models]
+    async def list_all(self) -> AsyncIterator[Order]:
+        stmt = _SELECT.execution_options(yield_per=_STREAM_BATCH_SIZE)
+        result = await self._session.stream(stmt)
 
-    def _model_to_entity(self, model: OrderModel) -> Order:  # type: ignore
-        from src.shared_kernel import CustomerId, Money, OrderId
+        async for row in result:
+            yield self._row_to_entity(row)
+
+    def _row_to_entity(self, row: Row | tuple) -> Order:
+        id_, customer_id, total_amount, status, details, created_at, updated_at = row
 
         return Order(
-            id=model.id,  # type: ignore # Will be overridden by __post_init__
-            order_id=OrderId(model.id),  # type: ignore
-            customer_id=CustomerId(model.customer_id),  # type: ignore
-            total_amount=Money(amount=model.total_amount, currency="USD"),  # type: ignore  # TODO: Store currency
-            status=OrderStatus(model.status),  # type: ignore
-            details=model.details or {},  # type: ignore
-            created_at=model.created_at,  # type: ignore
-            updated_at=model.updated_at,  # type: ignore
+            id=id_,  # Will be overridden by __post_init__
+            order_id=OrderId(id_),
+            customer_id=_customer_id(customer_id),
+            total_amount=Money(amount=total_amount, currency="USD"),  # TODO: Store currency
+            status=OrderStatus(status),
+            details=details,
+            created_at=created_at,
+            updated_at=updated_at,
         )
 
-    def _entity_to_model(self, entity: Order) -> OrderModel:  # type: ignore
-        return OrderModel(
-            id=entity.id,  # type: ignore
-            customer_id=entity.customer_id,  # type: ignore
-            total_amount=entity.total_amount,  # type: ignore
-            status=entity.status.value,  # type: ignore
-            details=entity.details,  # type: ignore
-            created_at=entity.created_at,  # type: ignore
-            updated_at=entity.updated_at,  # type: ignore
+    async def _copy(self, values: list[dict[str, Any]]) -> None:
+        """Stream rows into the orders table with COPY on the session's connection."""
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        # COPY bypasses SQLAlchemy's JSONB bind processing, so serialize details here
+        records = [tuple({**row, "details": orjson.dumps(row["details"]).decode()}.values()) for row in values]
+        await raw_connection.driver_connection.copy_records_to_table(  # type: ignore
+            OrderModel.__tablename__, columns=list(values[0]), records=records
         )
+
+    def _entity_to_values(self, entity: Order) -> dict[str, Any]:
+        return {
+            "id": entity.id,
+            "customer_id": entity.customer_id.value,
+            "total_amount": entity.total_amount.amount,
+            "status": entity.status.value,
+            "details": dict(entity.details),
+            "created_at": entity.created_at,
+            "updated_at": entity.updated_at,
+        }
+
+    def _entity_to_model(self, entity: Order) -> OrderModel:  # type: ignore
+        return OrderModel(**self._entity_to_values(entity))
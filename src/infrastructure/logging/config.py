@@ -1,9 +1,11 @@
 """Logging configuration for AWS environments."""
 
+import functools
+import logging
 import os
+from dataclasses import dataclass
 from enum import Enum
-
-from pydantic import BaseModel, Field
+from typing import Final
 
 
 class LogLevel(str, Enum):
@@ -33,96 +35,89 @@ class Environment(str, Enum):
     PRODUCTION = "production"
 
 
-class LogConfig(BaseModel):
-    """Centralized logging configuration."""
+@dataclass(slots=True, frozen=True)
+class LogConfig:
+    """
+    Centralized logging configuration.
+
+    Built once per process and read on every log call, so it is a frozen slotted
+    dataclass: enum fields are validated and stored as their plain string values
+    in __post_init__, and attribute reads are simple slot lookups.
+    """
 
-    level: LogLevel = Field(default=LogLevel.INFO, description="Global log level")
-    format: LogFormat = Field(default=LogFormat.JSON, description="Log output format")
-    environment: Environment = Field(default=Environment.LOCAL, description="Deployment environment")
-    service_name: str = Field(default="clean-py", description="Service identifier for logs")
-    version: str = Field(default="1.0.0", description="Service version")
+    level: str = LogLevel.INFO.value  # Global log level
+    format: str = LogFormat.JSON.value  # Log output format
+    environment: str = Environment.LOCAL.value  # Deployment environment
+    service_name: str = "clean-py"  # Service identifier for logs
+    version: str = "1.0.0"  # Service version
 
     # AWS CloudWatch settings
-    cloudwatch_enabled: bool = Field(default=False, description="Enable CloudWatch logging")
-    cloudwatch_log_group: str | None = Field(default=None, description="CloudWatch log group name")
-    cloudwatch_log_stream: str | None = Field(default=None, description="CloudWatch log stream name")
-    cloudwatch_region: str = Field(default="us-east-1", description="AWS region for CloudWatch")
-
-    # Performance settings
-    log_request_body: bool = Field(default=False, description="Log request bodies (be careful with sensitive data)")
-    log_response_body: bool = Field(default=False, description="Log response bodies (be careful with sensitive data)")
-    slow_request_threshold_ms: int = Field(
-        default=1000, description="Threshold for slow request warnings (milliseconds)"
-    )
-
-    # Sampling settings for high-volume environments
-    sampling_rate: float = Field(default=1.0, ge=0.0, le=1.0, description="Sampling rate for debug logs (0.0-1.0)")
+    cloudwatch_enabled: bool = False
+    cloudwatch_log_group: str | None = None
+    cloudwatch_log_stream: str | None = None
+    cloudwatch_region: str = "us-east-1"
+    # Probe credentials with an AWS call when the handler is created (adds a round-trip to startup)
+    verify_cloudwatch_credentials: bool = False
+
+    # Performance settings (be careful with sensitive data in bodies)
+    log_request_body: bool = False
+    log_response_body: bool = False
+    slow_request_threshold_ms: int = 1000  # Threshold for slow request warnings
+    # Format and write logs on a background listener thread instead of the caller's
+    # (off in Lambda, where the process is frozen between invocations)
+    async_logging: bool = False
+
+    # Sampling rate for debug logs in high-volume environments (0.0-1.0)
+    sampling_rate: float = 1.0
 
     # Additional metadata
-    include_hostname: bool = Field(default=True, description="Include hostname in logs")
-    include_process_info: bool = Field(default=True, description="Include process ID and thread ID")
+    include_hostname: bool = True
+    include_process_info: bool = True  # Include process ID and thread ID
 
-    class Config:
-        """Pydantic config."""
+    def __post_init__(self) -> None:
+        # Accept enum members or raw strings; invalid values raise ValueError here, once
+        object.__setattr__(self, "level", LogLevel(self.level).value)
+        object.__setattr__(self, "format", LogFormat(self.format).value)
+        object.__setattr__(self, "environment", Environment(self.environment).value)
+        if not 0.0 <= self.sampling_rate <= 1.0:
+            raise ValueError(f"sampling_rate must be between 0.0 and 1.0, got {self.sampling_rate}")
 
-        use_enum_values = True
+
+_TRUTHY: Final[frozenset[str]] = frozenset({"true", "1", "yes", "on", "enabled"})
 
 
 def _parse_bool(value: str | None, default: bool = False) -> bool:
     """Parse string to boolean with various truthy/falsy values."""
     if value is None:
         return default
+    return value.strip().lower() in _TRUTHY
+
 
-    value = value.lower().strip()
-    return value in ("true", "1", "yes", "on", "enabled")
+# Environment variables indicating an AWS runtime, most common first
+_AWS_INDICATORS: Final[tuple[str, ...]] = (
+    "AWS_LAMBDA_FUNCTION_NAME",  # Lambda
+    "AWS_EXECUTION_ENV",  # Lambda/ECS execution environment
+    "ECS_CONTAINER_METADATA_URI_V4",  # ECS Fargate
+    "AWS_BATCH_JOB_ID",  # AWS Batch
+    "AWS_REGION",  # Often set in AWS environments
+)
 
 
+@functools.lru_cache(maxsize=1)
 def _is_running_locally() -> bool:
     """
     Detect if the application is running locally vs in AWS.
 
+    Any non-empty AWS indicator means AWS; everything else (Docker Compose,
+    ENVIRONMENT=dev, a developer machine) is treated as local. The result is
+    cached for the lifetime of the process; call reset_log_config_cache()
+    after changing environment variables.
+
     Returns:
         bool: True if running locally, False if in AWS
     """
-    # Check for AWS environment indicators
-    aws_indicators = [
-        "AWS_LAMBDA_FUNCTION_NAME",  # Lambda
-        "ECS_CONTAINER_METADATA_URI_V4",  # ECS Fargate
-        "AWS_EXECUTION_ENV",  # Lambda/ECS execution environment
-        "AWS_BATCH_JOB_ID",  # AWS Batch
-        "AWS_REGION",  # Often set in AWS environments
-    ]
-
-    # If any AWS indicator is present, we're likely in AWS
-    if any(os.getenv(indicator) for indicator in aws_indicators):
-        return False
-
-    # Check for local development indicators
-    local_indicators = [
-        "DOCKER_COMPOSE_PROJECT_NAME",  # Docker Compose
-        "COMPOSE_PROJECT_NAME",  # Docker Compose alternative
-    ]
-
-    # Check if running in Docker locally
-    if any(os.getenv(indicator) for indicator in local_indicators):
-        return True
-
-    # Check for development-specific environment variables
-    env = os.getenv("ENVIRONMENT", "").lower()
-    if env in ["local", "development", "dev"]:
-        return True
-
-    # Check if we can detect Docker environment (but not in AWS)
-    if os.path.exists("/.dockerenv") and not any(os.getenv(indicator) for indicator in aws_indicators):
-        return True
-
-    # Check for common local development patterns
-    if os.getenv("HOME") and not os.getenv("AWS_EXECUTION_ENV"):
-        # Likely running on a local machine
-        return True
-
-    # Default to local if we can't determine
-    return True
+    # Single C-level pass over the indicators, stopping at the first non-empty one
+    return not any(map(os.environ.get, _AWS_INDICATORS))
 
 
 def _get_local_config() -> LogConfig:
@@ -137,6 +132,7 @@ def _get_local_config() -> LogConfig:
         log_request_body=_parse_bool(os.getenv("LOG_REQUEST_BODY"), True),  # More debugging info
         log_response_body=_parse_bool(os.getenv("LOG_RESPONSE_BODY"), True),
         slow_request_threshold_ms=int(os.getenv("SLOW_REQUEST_THRESHOLD_MS", "500")),  # Lower threshold
+        async_logging=_parse_bool(os.getenv("LOG_ASYNC"), False),  # Keep output ordered with prints locally
         sampling_rate=1.0,  # No sampling locally
         include_hostname=True,
         include_process_info=True,
@@ -151,17 +147,20 @@ def _get_aws_config() -> LogConfig:
         default_log_format = LogFormat.CLOUDWATCH
         default_cloudwatch_enabled = False  # Lambda logs automatically
         default_include_process_info = False
+        default_async_logging = False
     elif os.getenv("ECS_CONTAINER_METADATA_URI_V4"):
         env = Environment(os.getenv("ENVIRONMENT", "production"))
         default_log_format = LogFormat.JSON
         default_cloudwatch_enabled = True
         default_include_process_info = True
+        default_async_logging = True
     else:
         # Generic AWS environment
         env = Environment(os.getenv("ENVIRONMENT", "production"))
         default_log_format = LogFormat.JSON
         default_cloudwatch_enabled = True
         default_include_process_info = True
+        default_async_logging = True
 
     # Allow format override via environment variable
     log_format = LogFormat(os.getenv("LOG_FORMAT", default_log_format.value))
@@ -180,33 +179,60 @@ def _get_aws_config() -> LogConfig:
         cloudwatch_log_group=os.getenv("CLOUDWATCH_LOG_GROUP"),
         cloudwatch_log_stream=os.getenv("CLOUDWATCH_LOG_STREAM"),
         cloudwatch_region=os.getenv("AWS_REGION", "us-east-1"),
+        verify_cloudwatch_credentials=_parse_bool(os.getenv("CLOUDWATCH_VERIFY_CREDENTIALS"), False),
         log_request_body=_parse_bool(os.getenv("LOG_REQUEST_BODY"), False),  # Conservative in production
         log_response_body=_parse_bool(os.getenv("LOG_RESPONSE_BODY"), False),
         slow_request_threshold_ms=int(os.getenv("SLOW_REQUEST_THRESHOLD_MS", "1000")),
+        async_logging=_parse_bool(os.getenv("LOG_ASYNC"), default_async_logging),
         sampling_rate=float(os.getenv("LOG_SAMPLING_RATE", "0.1")),  # Sample debug logs in production
         include_hostname=_parse_bool(os.getenv("LOG_INCLUDE_HOSTNAME"), True),
         include_process_info=include_process_info,
     )
 
 
+@functools.lru_cache(maxsize=1)
 def get_log_config() -> LogConfig:
     """
     Get logging configuration automatically detecting local vs AWS environments.
 
+    The configuration is built once and cached for the lifetime of the process.
+    Use reset_log_config_cache() to force re-detection.
+
     Returns:
         LogConfig: Environment-appropriate logging configuration
     """
+    return _get_local_config() if _is_running_locally() else _get_aws_config()
+
+
+def log_environment_detection(config: LogConfig) -> None:
+    """
+    Log which environment get_log_config() detected.
+
+    Called by configure_logging() once its handlers are installed; logging
+    from inside get_log_config() would run before any handler exists.
+
+    Args:
+        config: Configuration returned by get_log_config()
+    """
+    detection_logger = logging.getLogger("infrastructure.logging")
     if _is_running_locally():
-        config = _get_local_config()
-        # Log the detection for debugging (but only once)
-        if not hasattr(get_log_config, "_logged_detection"):
-            print(f"🏠 Local environment detected - using console logging (Level: {config.level})")
-            get_log_config._logged_detection = True
+        detection_logger.info("Local environment detected - using console logging (Level: %s)", config.level)
     else:
-        config = _get_aws_config()
-        # Log the detection for debugging (but only once)
-        if not hasattr(get_log_config, "_logged_detection"):
-            print(f"☁️ AWS environment detected - using structured logging (CloudWatch: {config.cloudwatch_enabled})")
-            get_log_config._logged_detection = True
+        detection_logger.info(
+            "AWS environment detected - using structured logging (CloudWatch: %s)", config.cloudwatch_enabled
+        )
+
+
+def reset_log_config_cache() -> None:
+    """
+    Clear the cached environment detection and logging configuration.
+
+    Useful in tests and demos that modify environment variables at runtime.
+    Default-config loggers are set up again on their next lookup.
+    """
+    # Imported here: the logger module imports this one
+    from .logger import clear_default_logger_cache
 
-    return config
+    get_log_config.cache_clear()
+    _is_running_locally.cache_clear()
+    clear_default_logger_cache()
@@ -1,16 +1,20 @@
 """Correlation ID management for distributed tracing."""
 
-import uuid
+import logging
+import os
 from contextvars import ContextVar
 from typing import Any
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Context variable for storing correlation ID throughout the request lifecycle
 correlation_id_var: ContextVar[str | None] = ContextVar("correlation_id", default=None)
 
+# AWS request ID of the Lambda invocation being handled; empty outside an invocation
+lambda_request_id_var: ContextVar[str] = ContextVar("lambda_request_id", default="")
+
 
 class CorrelationContext:
     """Manages correlation IDs for request tracing."""
@@ -48,10 +52,14 @@ class CorrelationContext:
         """
         Generate a new correlation ID.
 
+        Uses 128 random bits hex-encoded directly, avoiding the UUID object and
+        its hyphenated formatting. Incoming IDs in UUID form are passed through
+        unchanged, so both formats are valid correlation IDs.
+
         Returns:
-            str: New UUID-based correlation ID
+            str: New 32-character hex correlation ID
         """
-        return str(uuid.uuid4())
+        return os.urandom(16).hex()
 
     @staticmethod
     def extract_from_request(request: Request) -> str | None:
@@ -66,21 +74,7 @@ class CorrelationContext:
         Returns:
             Optional[str]: Extracted correlation ID or None
         """
-        # Check various header names in order of preference
-        headers_to_check = [
-            CorrelationContext.CORRELATION_ID_HEADER,
-            CorrelationContext.REQUEST_ID_HEADER,
-            CorrelationContext.TRACE_ID_HEADER,
-            CorrelationContext.AWS_TRACE_ID_HEADER,
-            CorrelationContext.AWS_REQUEST_ID_HEADER,
-        ]
-
-        for header in headers_to_check:
-            correlation_id = request.headers.get(header)
-            if correlation_id:
-                return correlation_id
-
-        return None
+        return _extract_from_raw_headers(request.headers.raw)
 
     @staticmethod
     def inject_to_response(response: Response, correlation_id: str) -> None:
@@ -94,43 +88,140 @@ class CorrelationContext:
         response.headers[CorrelationContext.CORRELATION_ID_HEADER] = correlation_id
 
 
-class CorrelationMiddleware(BaseHTTPMiddleware):
+class CorrelationFilter(logging.Filter):
+    """
+    Stamp log records with the current correlation ID.
+
+    Installed on every handler: the first handler to see a record reads the
+    context variable and later handlers (and their formatters) reuse the
+    stamped value instead of reading it again.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Attach the correlation ID to the record if it has none yet.
+
+        Args:
+            record: Log record being handled
+
+        Returns:
+            bool: Always True; records are never dropped
+        """
+        if not hasattr(record, "correlation_id"):
+            record.correlation_id = correlation_id_var.get()
+        return True
+
+
+class LambdaContextFilter(logging.Filter):
+    """
+    Stamp log records with the AWS request ID of the current Lambda invocation.
+
+    The attribute is always set (empty outside an invocation), so formatters
+    read it directly instead of probing for it on every record. An ID passed
+    explicitly in extra is kept.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Attach the Lambda request ID to the record if it has none yet.
+
+        Args:
+            record: Log record being handled
+
+        Returns:
+            bool: Always True; records are never dropped
+        """
+        if not hasattr(record, "aws_request_id"):
+            record.aws_request_id = lambda_request_id_var.get()
+        return True
+
+
+# Lowercased header names mapped to their preference (lower is preferred)
+_HEADER_PRIORITY: dict[bytes, int] = {
+    name.lower().encode("latin-1"): priority
+    for priority, name in enumerate(
+        (
+            CorrelationContext.CORRELATION_ID_HEADER,
+            CorrelationContext.REQUEST_ID_HEADER,
+            CorrelationContext.TRACE_ID_HEADER,
+            CorrelationContext.AWS_TRACE_ID_HEADER,
+            CorrelationContext.AWS_REQUEST_ID_HEADER,
+        )
+    )
+}
+
+
+# Response header name as raw ASGI bytes
+_CORRELATION_HEADER_NAME = CorrelationContext.CORRELATION_ID_HEADER.lower().encode("latin-1")
+
+
+def _extract_from_raw_headers(raw_headers: Any) -> str | None:
+    """
+    Find the preferred correlation header in a single pass over raw ASGI headers.
+
+    Args:
+        raw_headers: Iterable of (name, value) byte pairs with lowercased names
+
+    Returns:
+        Optional[str]: Value of the highest-priority non-empty header or None
+    """
+    best_priority = len(_HEADER_PRIORITY)
+    best_value: bytes | None = None
+
+    for name, value in raw_headers:
+        priority = _HEADER_PRIORITY.get(name)
+        if priority is not None and priority < best_priority and value:
+            best_priority, best_value = priority, value
+            if priority == 0:
+                break
+
+    return best_value.decode("latin-1") if best_value is not None else None
+
+
+class CorrelationMiddleware:
     """
     Middleware for managing correlation IDs across HTTP requests.
 
     Automatically extracts or generates correlation IDs for each request
-    and ensures they're propagated through the response.
+    and ensures they're propagated through the response. Implemented as
+    plain ASGI middleware to avoid BaseHTTPMiddleware's response streaming
+    overhead.
     """
 
-    async def dispatch(self, request: Request, call_next: Any) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process the request with correlation ID management.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware in the chain
-
-        Returns:
-            Response with correlation ID header
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Extract or generate correlation ID
-        correlation_id = CorrelationContext.extract_from_request(request)
-        if not correlation_id:
-            correlation_id = CorrelationContext.generate()
+        correlation_id = _extract_from_raw_headers(scope["headers"]) or CorrelationContext.generate()
 
         # Set correlation ID in context
         CorrelationContext.set(correlation_id)
 
         # Store in request state for access in route handlers
-        request.state.correlation_id = correlation_id
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
 
-        # Process request
-        response = await call_next(request)
+        header = (_CORRELATION_HEADER_NAME, correlation_id.encode("latin-1"))
 
-        # Add correlation ID to response headers
-        CorrelationContext.inject_to_response(response, correlation_id)
+        async def send_with_correlation_id(message: Message) -> None:
+            # Add correlation ID to response headers; only this middleware sets it
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), header]
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_correlation_id)
 
 
 # Convenience function for FastAPI dependency injection
@@ -1,6 +1,7 @@
 """Decorators for automatic logging of function execution and performance."""
 
 import functools
+import logging
 import time
 from collections.abc import Callable
 from typing import Any, TypeVar, cast
@@ -9,6 +10,38 @@ from .logger import get_logger
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+_NS_PER_MS = 1_000_000
+
+# Level names mapped to their numeric values, e.g. "INFO" -> logging.INFO
+_LEVELS: dict[str, int] = logging.getLevelNamesMapping()
+
+
+def _level_number(log_level: str) -> int:
+    """Resolve a level name such as "INFO" to its numeric value."""
+    try:
+        return _LEVELS[log_level.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown log level: {log_level}") from None
+
+
+def _deferred_logger(name: str) -> Callable[[], logging.Logger]:
+    """
+    Return a getter that looks the logger up on its first call.
+
+    Decorators are usually applied at import time, before configure_logging()
+    has run; deferring the lookup to the first decorated call lets the logger
+    pick up the configuration that is in place by then.
+    """
+    logger: logging.Logger | None = None
+
+    def resolve() -> logging.Logger:
+        nonlocal logger
+        if logger is None:
+            logger = get_logger(name)
+        return logger
+
+    return resolve
+
 
 def log_execution(
     logger_name: str | None = None,
@@ -31,33 +64,49 @@ def log_execution(
         Decorated function
     """
 
+    log_level_num = _level_number(log_level)
+
     def decorator(func: F) -> F:
+        # Resolved once per decorated function rather than on every call
+        func_name = func.__name__
+        func_module = func.__module__
+        resolve_logger = _deferred_logger(logger_name or func_module)
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Get logger
-            logger = get_logger(logger_name or func.__module__)
-            log_level_num = getattr(logger, log_level.lower())
+            logger = resolve_logger()
+            # Fast path: nothing below would be emitted, so skip context and timing
+            if not logger.isEnabledFor(log_level_num):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    logger.error(
+                        f"Error in {func_name}: {e}",
+                        extra={"function": func_name, "function_module": func_module, "error": str(e)},
+                        exc_info=True,
+                    )
+                    raise
 
             # Prepare log context
             log_context: dict[str, Any] = {
-                "function": func.__name__,
-                "module": func.__module__,
+                "function": func_name,
+                "function_module": func_module,
             }
 
             # Log arguments if requested
             if log_args:
                 log_context.update(
                     {
-                        "args": args,
-                        "kwargs": kwargs,
+                        "call_args": args,
+                        "call_kwargs": kwargs,
                     }
                 )
 
             # Log function entry
-            logger.log(log_level_num, f"Executing {func.__name__}", extra=log_context)
+            logger.log(log_level_num, f"Executing {func_name}", extra=log_context)
 
             # Execute function with timing
-            start_time = time.perf_counter()
+            start_ns = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
                 success = True
@@ -65,20 +114,19 @@ def log_execution(
                 success = False
                 result = None
                 log_context["error"] = str(e)
-                logger.error(f"Error in {func.__name__}: {e}", extra=log_context, exc_info=True)
+                logger.error(f"Error in {func_name}: {e}", extra=log_context, exc_info=True)
                 raise
             finally:
                 # Log performance metrics
                 if log_performance:
-                    execution_time = time.perf_counter() - start_time
-                    log_context["execution_time_ms"] = round(execution_time * 1000, 2)
+                    log_context["execution_time_ms"] = round((time.perf_counter_ns() - start_ns) / _NS_PER_MS, 2)
                     log_context["success"] = success
 
                     # Log completion
                     if success:
                         if log_result and result is not None:
                             log_context["result"] = result
-                        logger.log(log_level_num, f"Completed {func.__name__}", extra=log_context)
+                        logger.log(log_level_num, f"Completed {func_name}", extra=log_context)
 
             return result
 
@@ -103,18 +151,22 @@ def log_error(
     Returns:
         Decorated function
     """
+    log_level_num = _level_number(log_level)
 
     def decorator(func: F) -> F:
+        func_name = func.__name__
+        func_module = func.__module__
+        resolve_logger = _deferred_logger(logger_name or func_module)
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            logger = get_logger(logger_name or func.__module__)
-
+            logger = resolve_logger()
             try:
                 return func(*args, **kwargs)
             except Exception as e:
                 log_context = {
-                    "function": func.__name__,
-                    "module": func.__module__,
+                    "function": func_name,
+                    "function_module": func_module,
                     "error_type": type(e).__name__,
                     "error_message": str(e),
                     "args_count": len(args),
@@ -122,8 +174,8 @@ def log_error(
                 }
 
                 logger.log(
-                    getattr(logger, log_level.lower()),
-                    f"Error in {func.__name__}: {e}",
+                    log_level_num,
+                    f"Error in {func_name}: {e}",
                     extra=log_context,
                     exc_info=True,
                 )
@@ -154,26 +206,38 @@ def log_performance(
         Decorated function
     """
 
+    log_level_num = _level_number(log_level)
+    threshold_ns = threshold_ms * _NS_PER_MS
+
     def decorator(func: F) -> F:
+        func_name = func.__name__
+        func_module = func.__module__
+        resolve_logger = _deferred_logger(logger_name or func_module)
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.perf_counter()
+            logger = resolve_logger()
+            # Timing is only worth taking if a slow call could actually be logged
+            if not logger.isEnabledFor(log_level_num):
+                return func(*args, **kwargs)
+
+            start_ns = time.perf_counter_ns()
             result = func(*args, **kwargs)
-            execution_time = time.perf_counter() - start_time
-            execution_time_ms = execution_time * 1000
+            elapsed_ns = time.perf_counter_ns() - start_ns
 
-            if execution_time_ms > threshold_ms:
-                logger = get_logger(logger_name or func.__module__)
+            # Integer comparison on the common path; milliseconds are only derived for the log record
+            if elapsed_ns > threshold_ns:
+                execution_time_ms = elapsed_ns / _NS_PER_MS
                 log_context = {
-                    "function": func.__name__,
-                    "module": func.__module__,
+                    "function": func_name,
+                    "function_module": func_module,
                     "execution_time_ms": round(execution_time_ms, 2),
                     "threshold_ms": threshold_ms,
                 }
 
                 logger.log(
-                    getattr(logger, log_level.lower()),
-                    f"Slow execution detected: {func.__name__} took {execution_time_ms:.2f}ms",
+                    log_level_num,
+                    f"Slow execution detected: {func_name} took {execution_time_ms:.2f}ms",
                     extra=log_context,
                 )
 
@@ -207,17 +271,32 @@ def log_async_execution(
         Decorated async function
     """
 
+    log_level_num = _level_number(log_level)
+
     def decorator(func: F) -> F:
+        func_name = func.__name__
+        func_module = func.__module__
+        resolve_logger = _deferred_logger(logger_name or func_module)
+
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Get logger
-            logger = get_logger(logger_name or func.__module__)
-            log_level_num = getattr(logger, log_level.lower())
+            logger = resolve_logger()
+            # Fast path: nothing below would be emitted, so skip context and timing
+            if not logger.isEnabledFor(log_level_num):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    logger.error(
+                        f"Error in async {func_name}: {e}",
+                        extra={"function": func_name, "function_module": func_module, "async": True, "error": str(e)},
+                        exc_info=True,
+                    )
+                    raise
 
             # Prepare log context
             log_context: dict[str, Any] = {
-                "function": func.__name__,
-                "module": func.__module__,
+                "function": func_name,
+                "function_module": func_module,
                 "async": True,
             }
 
@@ -225,16 +304,16 @@ def log_async_execution(
             if log_args:
                 log_context.update(
                     {
-                        "args": args,
-                        "kwargs": kwargs,
+                        "call_args": args,
+                        "call_kwargs": kwargs,
                     }
                 )
 
             # Log function entry
-            logger.log(log_level_num, f"Executing async {func.__name__}", extra=log_context)
+            logger.log(log_level_num, f"Executing async {func_name}", extra=log_context)
 
             # Execute function with timing
-            start_time = time.perf_counter()
+            start_ns = time.perf_counter_ns()
             try:
                 result = await func(*args, **kwargs)
                 success = True
@@ -242,20 +321,19 @@ def log_async_execution(
                 success = False
                 result = None
                 log_context["error"] = str(e)
-                logger.error(f"Error in async {func.__name__}: {e}", extra=log_context, exc_info=True)
+                logger.error(f"Error in async {func_name}: {e}", extra=log_context, exc_info=True)
                 raise
             finally:
                 # Log performance metrics
                 if log_performance:
-                    execution_time = time.perf_counter() - start_time
-                    log_context["execution_time_ms"] = round(execution_time * 1000, 2)
+                    log_context["execution_time_ms"] = round((time.perf_counter_ns() - start_ns) / _NS_PER_MS, 2)
                     log_context["success"] = success
 
                     # Log completion
                     if success:
                         if log_result and result is not None:
                             log_context["result"] = result
-                        logger.log(log_level_num, f"Completed async {func.__name__}", extra=log_context)
+                        logger.log(log_level_num, f"Completed async {func_name}", extra=log_context)
 
             return result
 
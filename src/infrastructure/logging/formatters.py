@@ -1,15 +1,143 @@
 """Custom log formatters for different output targets."""
 
+import contextlib
 import json
 import logging
 import socket
 import sys
+import time
 import traceback
-from datetime import UTC, datetime
+from json.encoder import encode_basestring as _json_string  # C-accelerated string escaping
 from typing import Any
 
+import orjson
+
 from .correlation import CorrelationContext
 
+# Non-string keys (e.g. ints in extra dicts) are stringified, matching the stdlib json behaviour
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# LogRecord attributes that are part of the record itself rather than caller-supplied extras,
+# taken from a throwaway record so attributes added by newer Pythons (e.g. taskName) are covered
+_RESERVED_LOG_ATTRS: frozenset[str] = frozenset(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {
+    "message",  # Set by Formatter.format
+    "correlation_id",  # Stamped by CorrelationFilter and emitted as a top-level field
+}
+
+# Record attributes forwarded as top-level CloudWatch fields
+_CLOUDWATCH_FIELD_PREFIXES = ("custom_", "metric_")
+
+# Last formatted whole second as (epoch second, text); records logged within the same
+# second reuse the text instead of formatting the date and time again
+_utc_second: tuple[int, str] = (-1, "")
+_local_second: tuple[int, str] = (-1, "")
+
+
+def _format_struct_time(tm: time.struct_time, separator: str) -> str:
+    """Render YYYY-MM-DD<separator>HH:MM:SS with plain integer formatting, no strftime."""
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}{separator}{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+    )
+
+
+def _iso_timestamp(created: float) -> str:
+    """Format an epoch timestamp as ISO 8601 UTC with microseconds."""
+    global _utc_second  # pylint: disable=global-statement
+    # Round to whole microseconds first, as datetime does, so a carry rolls into the second
+    second, microsecond = divmod(round(created * 1_000_000), 1_000_000)
+    cached_second, text = _utc_second
+    if second != cached_second:
+        text = _format_struct_time(time.gmtime(second), "T")
+        _utc_second = (second, text)
+    return f"{text}.{microsecond:06d}+00:00"
+
+
+def _local_timestamp(created: float) -> str:
+    """Format an epoch timestamp as local wall-clock time to the second."""
+    global _local_second  # pylint: disable=global-statement
+    second = int(created)
+    cached_second, text = _local_second
+    if second != cached_second:
+        text = _format_struct_time(time.localtime(second), " ")
+        _local_second = (second, text)
+    return text
+
+
+def _json_safe(value: Any) -> Any:
+    """Stringify dict keys the json module cannot encode, such as tuples, at any depth."""
+    if isinstance(value, dict):
+        return {
+            key if isinstance(key, str | int | float | bool) or key is None else str(key): _json_safe(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list | tuple):
+        return [_json_safe(item) for item in value]
+    return value
+
+
+def _dumps(log_obj: dict[str, Any], static_suffix: bytes = b"") -> str:
+    """
+    Encode a log record dict with orjson, falling back to str() for unknown types.
+
+    Values orjson rejects outright (integers beyond 64 bits, dict keys such as
+    tuples) send the record through the json module instead, so it is never dropped.
+
+    Args:
+        log_obj: Per-record fields (must not be empty)
+        static_suffix: Pre-encoded members (see _encode_members) appended to the object
+    """
+    try:
+        encoded = orjson.dumps(log_obj, default=str, option=_ORJSON_OPTIONS)
+    except TypeError:  # orjson.JSONEncodeError is a TypeError
+        encoded = json.dumps(_json_safe(log_obj), default=str, ensure_ascii=False, separators=(",", ":")).encode()
+    if static_suffix:
+        encoded = encoded[:-1] + b"," + static_suffix + b"}"
+    return encoded.decode()
+
+
+def _encode_members(fields: dict[str, Any]) -> bytes:
+    """Encode fields that never change for a formatter once, as JSON members without braces."""
+    return orjson.dumps(fields, option=_ORJSON_OPTIONS)[1:-1]
+
+
+def _format_traceback(exc_info: Any) -> list[str]:
+    """
+    Format an exception's traceback, reusing the result across formatters.
+
+    With several handlers attached, each formatter would otherwise walk the same
+    traceback. The text is cached on the exception together with the traceback
+    it was built from, so a re-raised exception (new traceback) is formatted again.
+    """
+    exc_type, exc, tb = exc_info
+    cached = getattr(exc, "_formatted_traceback", None)
+    if cached is not None and cached[0] is tb:
+        return cached[1]
+
+    lines = traceback.format_exception(exc_type, exc, tb)
+    # None, or an exception type without an instance __dict__, simply isn't cached
+    with contextlib.suppress(AttributeError):
+        exc._formatted_traceback = (tb, lines)
+    return lines
+
+
+def _correlation_id(record: logging.LogRecord) -> str | None:
+    """Correlation ID stamped by CorrelationFilter, or read from the context if no filter ran."""
+    try:
+        return record.correlation_id  # type: ignore[attr-defined]
+    except AttributeError:
+        return CorrelationContext.get()
+
+
+def _extra_fields(record: logging.LogRecord) -> dict[str, Any]:
+    """
+    Collect caller-supplied extras in insertion order.
+
+    Values are passed through as-is: _dumps encodes the whole record in one
+    orjson call, and its default=str hook stringifies only the (possibly nested)
+    values orjson cannot encode.
+    """
+    return {key: value for key, value in record.__dict__.items() if key not in _RESERVED_LOG_ATTRS}
+
 
 class StructuredFormatter(logging.Formatter):
     """
@@ -45,6 +173,16 @@ class StructuredFormatter(logging.Formatter):
         self.include_process_info = include_process_info
         self.hostname = socket.gethostname() if include_hostname else None
 
+        # Identity fields are the same on every record, so they are encoded once here
+        static_fields: dict[str, Any] = {
+            "service": service_name,
+            "version": version,
+            "environment": environment,
+        }
+        if self.hostname:
+            static_fields["hostname"] = self.hostname
+        self._static_suffix = _encode_members(static_fields)
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record as JSON.
@@ -57,24 +195,17 @@ class StructuredFormatter(logging.Formatter):
         """
         # Build base log structure
         log_obj: dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+            "timestamp": _iso_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
-            "service": self.service_name,
-            "version": self.version,
-            "environment": self.environment,
         }
 
         # Add correlation ID if available
-        correlation_id = CorrelationContext.get()
+        correlation_id = _correlation_id(record)
         if correlation_id:
             log_obj["correlation_id"] = correlation_id
 
-        # Add hostname if configured
-        if self.hostname:
-            log_obj["hostname"] = self.hostname
-
         # Add process info if configured
         if self.include_process_info:
             log_obj["process"] = {
@@ -96,46 +227,15 @@ class StructuredFormatter(logging.Formatter):
             log_obj["exception"] = {
                 "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
                 "message": str(record.exc_info[1]) if record.exc_info[1] else None,
-                "traceback": traceback.format_exception(*record.exc_info),
+                "traceback": _format_traceback(record.exc_info),
             }
 
-        # Add extra fields from record
-        extra_fields = {}
-        for key, value in record.__dict__.items():
-            if key not in [
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "message",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-            ]:
-                try:
-                    # Attempt to serialize the value
-                    json.dumps(value)
-                    extra_fields[key] = value
-                except (TypeError, ValueError):
-                    extra_fields[key] = str(value)
-
-        if extra_fields:
-            log_obj["extra"] = extra_fields
-
-        return json.dumps(log_obj, default=str)
+        # Add extra fields from record; most records have none, which a C-level set difference
+        # detects without walking every attribute in Python
+        if record.__dict__.keys() - _RESERVED_LOG_ATTRS:
+            log_obj["extra"] = _extra_fields(record)
+
+        return _dumps(log_obj, self._static_suffix)
 
 
 class CloudWatchFormatter(logging.Formatter):
@@ -156,6 +256,9 @@ class CloudWatchFormatter(logging.Formatter):
         super().__init__()
         self.service_name = service_name
         self.environment = environment
+        self._static_suffix = _encode_members({"service": service_name, "env": environment})
+        # Same members as text, closing the object, for the f-string fast path
+        self._static_tail = f",{self._static_suffix.decode()}}}"
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -167,18 +270,34 @@ class CloudWatchFormatter(logging.Formatter):
         Returns:
             str: CloudWatch-optimized JSON log entry
         """
+        timestamp = _iso_timestamp(record.created)
+        message = record.getMessage()
+        correlation_id = _correlation_id(record)
+        # Stamped by LambdaContextFilter; records from handlers without it may lack the attribute
+        request_id = getattr(record, "aws_request_id", "")
+        custom_fields = {
+            key: value for key, value in record.__dict__.items() if key.startswith(_CLOUDWATCH_FIELD_PREFIXES)
+        }
+
+        # Fast path: the common record has a fixed shape of string fields, so it is
+        # assembled directly instead of building and encoding a dict
+        if not (record.exc_info or custom_fields or request_id):
+            correlation = f',"@correlationId":{_json_string(correlation_id)}' if correlation_id else ""
+            return (
+                f'{{"@timestamp":"{timestamp}","@level":{_json_string(record.levelname)},'
+                f'"@logger":{_json_string(record.name)},"@message":{_json_string(message)}'
+                f"{correlation}{self._static_tail}"
+            )
+
         # Build CloudWatch-optimized structure
         log_obj: dict[str, Any] = {
-            "@timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+            "@timestamp": timestamp,
             "@level": record.levelname,
             "@logger": record.name,
-            "@message": record.getMessage(),
-            "service": self.service_name,
-            "env": self.environment,
+            "@message": message,
         }
 
         # Add correlation ID for tracing
-        correlation_id = CorrelationContext.get()
         if correlation_id:
             log_obj["@correlationId"] = correlation_id
 
@@ -187,19 +306,17 @@ class CloudWatchFormatter(logging.Formatter):
             log_obj["@exception"] = {
                 "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
                 "message": str(record.exc_info[1]) if record.exc_info[1] else None,
-                "stack": "".join(traceback.format_exception(*record.exc_info)),
+                "stack": "".join(_format_traceback(record.exc_info)),
             }
 
         # Add Lambda context if available
-        if hasattr(record, "aws_request_id"):
-            log_obj["@requestId"] = record.aws_request_id
+        if request_id:
+            log_obj["@requestId"] = request_id
 
         # Add any custom fields
-        for key, value in record.__dict__.items():
-            if key.startswith("custom_") or key.startswith("metric_"):
-                log_obj[key] = value
+        log_obj.update(custom_fields)
 
-        return json.dumps(log_obj, default=str)
+        return _dumps(log_obj, self._static_suffix)
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -228,6 +345,11 @@ class ConsoleFormatter(logging.Formatter):
         """
         super().__init__()
         self.use_colors = use_colors
+        # Terminal support is checked once; each known level gets its final padded (and colored) label
+        colorize = use_colors and sys.stderr.isatty()
+        self._level_labels = {
+            level: f"{color}{level:8}{self.RESET}" if colorize else f"{level:8}" for level, color in self.COLORS.items()
+        }
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -240,26 +362,23 @@ class ConsoleFormatter(logging.Formatter):
             str: Human-readable log entry
         """
         # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = _local_timestamp(record.created)
 
         # Get correlation ID if available
-        correlation_id = CorrelationContext.get()
+        correlation_id = _correlation_id(record)
         correlation_str = f"[{correlation_id[:8]}] " if correlation_id else ""
 
-        # Apply color if enabled and supported
-        if self.use_colors and sys.stderr.isatty():
-            level_color = self.COLORS.get(record.levelname, "")
-            level_str = f"{level_color}{record.levelname:8}{self.RESET}"
-        else:
-            level_str = f"{record.levelname:8}"
+        # Custom level names fall back to an uncolored label
+        level_str = self._level_labels.get(record.levelname) or f"{record.levelname:8}"
 
-        # Build the message
-        location = f"{record.name}:{record.funcName}:{record.lineno}"
-        message = f"{timestamp} | {level_str} | {correlation_str}{location} | {record.getMessage()}"
+        # Build the message in one f-string, which CPython assembles in a single pass
+        message = (
+            f"{timestamp} | {level_str} | {correlation_str}"
+            f"{record.name}:{record.funcName}:{record.lineno} | {record.getMessage()}"
+        )
 
         # Add exception info if present
         if record.exc_info:
-            exception_text = "".join(traceback.format_exception(*record.exc_info))
-            message += f"\n{exception_text}"
+            return f"{message}\n{''.join(_format_traceback(record.exc_info))}"
 
         return message
@@ -1,12 +1,25 @@
 """Log handlers for different output targets."""
 
+import atexit
+import copy
 import logging
 import os
+import queue
+import random
 import sys
+from collections import deque
+from datetime import timedelta
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
 
 from .config import LogConfig, LogFormat
+from .correlation import CorrelationFilter, LambdaContextFilter
 from .formatters import CloudWatchFormatter, ConsoleFormatter, StructuredFormatter
 
+# Shared by every handler built here; stateless, so one instance suffices
+_CORRELATION_FILTER = CorrelationFilter()
+_LAMBDA_CONTEXT_FILTER = LambdaContextFilter()
+
 
 def get_console_handler(config: LogConfig) -> logging.StreamHandler:
     """
@@ -35,12 +48,97 @@ def get_console_handler(config: LogConfig) -> logging.StreamHandler:
         )
 
     handler.setFormatter(formatter)
-    level_value = config.level.value if hasattr(config.level, "value") else config.level
-    handler.setLevel(level_value)
+    handler.addFilter(_CORRELATION_FILTER)
+    if config.format == LogFormat.CLOUDWATCH:
+        handler.addFilter(_LAMBDA_CONTEXT_FILTER)
+    handler.setLevel(config.level)
 
     return handler
 
 
+# Listeners started by get_queue_handler, stopped at shutdown or interpreter exit
+_queue_listeners: list[QueueListener] = []
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves formatting to the handlers behind the listener.
+
+    The stock QueueHandler formats the record into its message before queueing,
+    which drops exc_info and suits only a single target. Here only the message
+    arguments are merged, on the calling thread, so each listener-side handler
+    formats the record with its own formatter.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Arguments may be mutated by the caller once the log call returns
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+def get_queue_handler(handlers: list[logging.Handler]) -> QueueHandler:
+    """
+    Put handlers behind a queue drained by a background listener thread.
+
+    The caller only stamps the correlation ID and enqueues the record; formatting
+    and I/O happen on the listener thread. Not suited to AWS Lambda, where the
+    process may be frozen before the listener drains its queue.
+
+    Args:
+        handlers: Handlers to run on the listener thread
+
+    Returns:
+        QueueHandler: Handler feeding a started QueueListener
+    """
+    queue_handler = _RecordQueueHandler(queue.SimpleQueue())
+    # Stamp the correlation ID on the calling thread; the listener thread has no request context
+    queue_handler.addFilter(_CORRELATION_FILTER)
+
+    listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _queue_listeners.append(listener)
+    queue_handler.listener = listener  # type: ignore[attr-defined]
+    return queue_handler
+
+
+def retarget_queue_handler(queue_handler: QueueHandler, handlers: list[logging.Handler]) -> None:
+    """
+    Swap the handlers behind a handler built by get_queue_handler.
+
+    Loggers keep the same queue handler, so records they log after a
+    reconfiguration reach the new handlers. A stopped listener is restarted.
+
+    Args:
+        queue_handler: Handler returned by get_queue_handler
+        handlers: Handlers to run on the listener thread from now on
+    """
+    listener: QueueListener = queue_handler.listener  # type: ignore[attr-defined]
+    listener.handlers = tuple(handlers)
+    if listener not in _queue_listeners:
+        listener.start()
+        _queue_listeners.append(listener)
+
+
+def stop_queue_handler(queue_handler: QueueHandler) -> None:
+    """Drain and stop the listener behind a handler built by get_queue_handler."""
+    listener: QueueListener = queue_handler.listener  # type: ignore[attr-defined]
+    if listener in _queue_listeners:
+        _queue_listeners.remove(listener)
+        listener.stop()
+
+
+def stop_queue_listeners() -> None:
+    """Drain and stop every listener started by the queue handler factories."""
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
+
+
+atexit.register(stop_queue_listeners)
+
+
 def get_cloudwatch_handler(
     config: LogConfig,
     batch_size: int = 100,
@@ -73,32 +171,38 @@ def get_cloudwatch_handler(
         import boto3
         from watchtower import CloudWatchLogHandler
 
-        # Test AWS credentials availability
+        # Credential problems otherwise surface on watchtower's first send; the up-front
+        # probe is an extra AWS round-trip on every cold start, so it is opt-in
         try:
             cloudwatch_client = boto3.client("logs", region_name=config.cloudwatch_region)
-            # Quick test to verify credentials work
-            cloudwatch_client.describe_log_groups(limit=1)
+            if config.verify_cloudwatch_credentials:
+                cloudwatch_client.describe_log_groups(limit=1)
         except Exception as cred_error:
             logging.warning(
                 f"CloudWatch credentials not available or invalid: {cred_error}. Falling back to console logging."
             )
             return None
 
-        # Create handler
-        handler = CloudWatchLogHandler(
-            log_group=config.cloudwatch_log_group,
-            stream_name=config.cloudwatch_log_stream,
-            boto3_client=cloudwatch_client,
-            batch_size=batch_size,
-            max_batch_time=flush_interval,
-            create_log_group=False,  # Should be created via infrastructure
-        )
+        # watchtower queues formatted records and a background thread sends them in
+        # PutLogEvents batches of up to batch_size events or every flush_interval
+        handler_options: dict[str, Any] = {
+            "log_group_name": config.cloudwatch_log_group,
+            "boto3_client": cloudwatch_client,
+            "use_queues": True,
+            "max_batch_count": batch_size,
+            "send_interval": timedelta(milliseconds=flush_interval),
+            "create_log_group": False,  # Should be created via infrastructure
+        }
+        if config.cloudwatch_log_stream:
+            handler_options["log_stream_name"] = config.cloudwatch_log_stream
+        handler = CloudWatchLogHandler(**handler_options)
 
         # Use CloudWatch-optimized formatter
         formatter = CloudWatchFormatter(service_name=config.service_name, environment=config.environment)
         handler.setFormatter(formatter)
-        level_value = config.level.value if hasattr(config.level, "value") else config.level
-        handler.setLevel(level_value)
+        handler.addFilter(_CORRELATION_FILTER)
+        handler.addFilter(_LAMBDA_CONTEXT_FILTER)
+        handler.setLevel(config.level)
 
         return handler
 
@@ -149,8 +253,8 @@ def get_file_handler(
     )
 
     handler.setFormatter(formatter)
-    level_value = config.level.value if hasattr(config.level, "value") else config.level
-    handler.setLevel(level_value)
+    handler.addFilter(_CORRELATION_FILTER)
+    handler.setLevel(config.level)
 
     return handler
 
@@ -174,7 +278,8 @@ class SamplingHandler(logging.Handler):
         super().__init__()
         self.handler = handler
         self.sampling_rate = sampling_rate
-        self._counter = 0
+        # Bound once so each sampling decision is a single call
+        self._random = random.random
 
     def emit(self, record: logging.LogRecord) -> None:
         """
@@ -183,15 +288,13 @@ class SamplingHandler(logging.Handler):
         Args:
             record: Log record to potentially emit
         """
-        import random
-
         # Always emit errors and above
         if record.levelno >= logging.ERROR:
             self.handler.emit(record)
             return
 
-        # Sample other levels
-        if random.random() < self.sampling_rate:
+        # Sample other levels; a full rate never needs a random draw
+        if self.sampling_rate >= 1.0 or self._random() < self.sampling_rate:
             self.handler.emit(record)
 
 
@@ -199,7 +302,9 @@ class BufferingHandler(logging.Handler):
     """
     Handler that buffers log messages and flushes them periodically.
 
-    Useful for reducing I/O overhead in high-throughput scenarios.
+    Useful for reducing I/O overhead in high-throughput scenarios. On flush the
+    whole batch is handed over at once: to the wrapped handler's emit_batch()
+    if it has one, or as a single write for a plain StreamHandler.
     """
 
     def __init__(
@@ -220,7 +325,7 @@ class BufferingHandler(logging.Handler):
         self.handler = handler
         self.buffer_size = buffer_size
         self.flush_level = flush_level
-        self.buffer = []
+        self.buffer: deque[logging.LogRecord] = deque()
 
     def emit(self, record: logging.LogRecord) -> None:
         """
@@ -237,9 +342,37 @@ class BufferingHandler(logging.Handler):
 
     def flush(self) -> None:
         """Flush buffered records to underlying handler."""
-        for record in self.buffer:
-            self.handler.emit(record)
-        self.buffer.clear()
+        # Handler.lock is re-entrant: emit() already holds it when a flush is triggered from there
+        with self.lock:  # type: ignore[union-attr]
+            if not self.buffer:
+                return
+            records = list(self.buffer)
+            self.buffer.clear()
+
+            emit_batch = getattr(self.handler, "emit_batch", None)
+            if callable(emit_batch):
+                emit_batch(records)
+            elif type(self.handler) is logging.StreamHandler:
+                self._write_batch(self.handler, records)
+            else:
+                for record in records:
+                    self.handler.emit(record)
+            self.handler.flush()
+
+    @staticmethod
+    def _write_batch(handler: logging.StreamHandler, records: list[logging.LogRecord]) -> None:
+        """Format a batch and write it to the stream in one call."""
+        lines = []
+        for record in records:
+            try:
+                lines.append(handler.format(record) + handler.terminator)
+            except Exception:
+                handler.handleError(record)
+        try:
+            with handler.lock:  # type: ignore[union-attr]
+                handler.stream.write("".join(lines))
+        except Exception:
+            handler.handleError(records[-1])
 
     def close(self) -> None:
         """Close handler and flush remaining records."""
@@ -1,13 +1,20 @@
 """Lambda-specific logging utilities and helpers."""
 
-import json
 import os
+from collections.abc import Callable
+from contextvars import Token
 from typing import Any
 
+import orjson
+
 from .config import Environment, LogConfig, LogFormat, LogLevel
-from .correlation import CorrelationContext
+from .correlation import CorrelationContext, lambda_request_id_var
 from .logger import configure_logging, get_logger
 
+# Restores the request ID in effect before the current invocation; a warm container
+# handles one invocation at a time, so a single pending token is enough
+_request_id_token: Token[str] | None = None
+
 
 def configure_lambda_logging(
     service_name: str | None = None,
@@ -66,8 +73,15 @@ def lambda_request_logger(
         context: Lambda context object
         logger_name: Logger name to use
     """
+    global _request_id_token  # pylint: disable=global-statement
+
     logger = get_logger(logger_name)
 
+    # Every record logged during this invocation is stamped with its request ID,
+    # until the response or error logger ends it
+    _end_invocation()
+    _request_id_token = lambda_request_id_var.set(context.aws_request_id)
+
     # Extract correlation ID from various event sources
     correlation_id = _extract_correlation_id_from_event(event)
     if correlation_id:
@@ -135,16 +149,15 @@ def lambda_response_logger(
 
     # Add response size estimation
     try:
-        if isinstance(response, dict):
-            response_size = len(json.dumps(response, default=str))
+        response_size = _response_size(response)
+        if response_size is not None:
             response_context["response_size_bytes"] = response_size
-        elif isinstance(response, str):
-            response_context["response_size_bytes"] = len(response.encode())
     except Exception:
         pass  # Don't fail if we can't estimate size
 
     # Log response
     logger.info(f"Lambda request completed: {context.function_name}", extra=response_context)
+    _end_invocation()
 
 
 def lambda_error_logger(
@@ -188,6 +201,92 @@ def lambda_error_logger(
 
     # Log error
     logger.error(f"Lambda error in {context.function_name}: {error}", extra=error_context, exc_info=True)
+    _end_invocation()
+
+
+def _end_invocation() -> None:
+    """Reset the Lambda request ID so a warm container does not carry it into the next invocation."""
+    global _request_id_token  # pylint: disable=global-statement
+
+    if _request_id_token is not None:
+        lambda_request_id_var.reset(_request_id_token)
+        _request_id_token = None
+
+
+def _response_size(response: Any) -> int | None:
+    """
+    Size a Lambda response in bytes without re-serializing it where avoidable.
+
+    API Gateway/ALB proxy responses carry their payload as a pre-serialized
+    "body" string, so only that string is measured. Other dicts are encoded
+    with orjson.
+    """
+    if isinstance(response, str):
+        return len(response.encode())
+    if not isinstance(response, dict):
+        return None
+    body = response.get("body")
+    if isinstance(body, str):
+        return len(body.encode())
+    return len(orjson.dumps(response, default=str, option=orjson.OPT_NON_STR_KEYS))
+
+
+def _sqs_correlation_id(record: dict[str, Any]) -> str | None:
+    attribute = record.get("messageAttributes", {}).get("correlationId")
+    return attribute["stringValue"] if attribute else None
+
+
+def _sns_correlation_id(record: dict[str, Any]) -> str | None:
+    attribute = record.get("Sns", {}).get("MessageAttributes", {}).get("correlationId")
+    return attribute["Value"] if attribute else None
+
+
+def _sqs_source_info(event: dict[str, Any], record: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "event_source": "sqs",
+        "queue_url": record.get("eventSourceARN"),
+        "message_count": len(event["Records"]),
+    }
+
+
+def _sns_source_info(event: dict[str, Any], record: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "event_source": "sns",
+        "topic_arn": record["Sns"]["TopicArn"],
+        "message_count": len(event["Records"]),
+    }
+
+
+def _s3_source_info(_event: dict[str, Any], record: dict[str, Any]) -> dict[str, Any]:
+    s3_info = record["s3"]
+    return {
+        "event_source": "s3",
+        "bucket_name": s3_info["bucket"]["name"],
+        "object_key": s3_info["object"]["key"],
+        "event_name": record["eventName"],
+    }
+
+
+# Record-based events are told apart by their first record's source marker
+# (SNS spells the key "EventSource", SQS and S3 use "eventSource")
+_RECORD_CORRELATION_EXTRACTORS: dict[str, Callable[[dict[str, Any]], str | None]] = {
+    "aws:sqs": _sqs_correlation_id,
+    "aws:sns": _sns_correlation_id,
+}
+_RECORD_SOURCE_INFO: dict[str, Callable[[dict[str, Any], dict[str, Any]], dict[str, Any]]] = {
+    "aws:sqs": _sqs_source_info,
+    "aws:sns": _sns_source_info,
+    "aws:s3": _s3_source_info,
+}
+
+
+def _record_source(event: dict[str, Any]) -> tuple[dict[str, Any] | None, str]:
+    """Return the first record of a record-based event and its source marker."""
+    records = event.get("Records")
+    if not records:
+        return None, ""
+    record = records[0]
+    return record, record.get("eventSource") or record.get("EventSource") or ""
 
 
 def _extract_correlation_id_from_event(event: dict[str, Any]) -> str | None:
@@ -200,36 +299,28 @@ def _extract_correlation_id_from_event(event: dict[str, Any]) -> str | None:
     Returns:
         Optional[str]: Extracted correlation ID
     """
-    # API Gateway events
-    if "headers" in event:
-        headers = event.get("headers", {})
+    # API Gateway events (headers may be null when the request carried none)
+    headers = event.get("headers")
+    if headers:
         correlation_id = headers.get("X-Correlation-ID") or headers.get("X-Request-ID") or headers.get("X-Trace-ID")
         if correlation_id:
             return correlation_id
 
     # ALB events
-    if "requestContext" in event and "requestId" in event["requestContext"]:
-        return event["requestContext"]["requestId"]
-
-    # SQS events
-    if "Records" in event and event["Records"]:
-        record = event["Records"][0]
-        if "messageAttributes" in record:
-            attrs = record["messageAttributes"]
-            if "correlationId" in attrs:
-                return attrs["correlationId"]["stringValue"]
-
-    # SNS events
-    if "Records" in event and event["Records"]:
-        record = event["Records"][0]
-        if record.get("EventSource") == "aws:sns" and "MessageAttributes" in record.get("Sns", {}):
-            attrs = record["Sns"]["MessageAttributes"]
-            if "correlationId" in attrs:
-                return attrs["correlationId"]["Value"]
+    request_context = event.get("requestContext")
+    if request_context and "requestId" in request_context:
+        return request_context["requestId"]
+
+    # SQS and SNS events
+    record, source = _record_source(event)
+    if record is not None:
+        extractor = _RECORD_CORRELATION_EXTRACTORS.get(source)
+        return extractor(record) if extractor else None
 
     # EventBridge events
-    if "detail" in event and isinstance(event["detail"], dict):
-        return event["detail"].get("correlationId")
+    detail = event.get("detail")
+    if isinstance(detail, dict):
+        return detail.get("correlationId")
 
     return None
 
@@ -244,18 +335,14 @@ def _get_event_source_info(event: dict[str, Any]) -> dict[str, Any] | None:
     Returns:
         Optional[Dict[str, Any]]: Event source information
     """
-    info = {}
-
     # API Gateway
     if "httpMethod" in event and "path" in event:
-        info.update(
-            {
-                "event_source": "api_gateway",
-                "http_method": event.get("httpMethod"),
-                "path": event.get("path"),
-                "query_string_parameters": event.get("queryStringParameters"),
-            }
-        )
+        info = {
+            "event_source": "api_gateway",
+            "http_method": event.get("httpMethod"),
+            "path": event.get("path"),
+            "query_string_parameters": event.get("queryStringParameters"),
+        }
         if "requestContext" in event:
             request_context = event["requestContext"]
             info.update(
@@ -265,63 +352,31 @@ def _get_event_source_info(event: dict[str, Any]) -> dict[str, Any] | None:
                     "api_id": request_context.get("apiId"),
                 }
             )
+        return info
 
     # ALB
-    elif "requestContext" in event and "elb" in event["requestContext"]:
-        info.update(
-            {
-                "event_source": "alb",
-                "http_method": event.get("httpMethod"),
-                "path": event.get("path"),
-                "target_group_arn": event["requestContext"]["elb"]["targetGroupArn"],
-            }
-        )
-
-    # SQS
-    elif "Records" in event and event["Records"] and event["Records"][0].get("eventSource") == "aws:sqs":
-        record = event["Records"][0]
-        info.update(
-            {
-                "event_source": "sqs",
-                "queue_url": record.get("eventSourceARN"),
-                "message_count": len(event["Records"]),
-            }
-        )
-
-    # SNS
-    elif "Records" in event and event["Records"] and event["Records"][0].get("EventSource") == "aws:sns":
-        record = event["Records"][0]
-        info.update(
-            {
-                "event_source": "sns",
-                "topic_arn": record["Sns"]["TopicArn"],
-                "message_count": len(event["Records"]),
-            }
-        )
+    if "requestContext" in event and "elb" in event["requestContext"]:
+        return {
+            "event_source": "alb",
+            "http_method": event.get("httpMethod"),
+            "path": event.get("path"),
+            "target_group_arn": event["requestContext"]["elb"]["targetGroupArn"],
+        }
+
+    # SQS, SNS and S3
+    record, source = _record_source(event)
+    if record is not None:
+        source_info = _RECORD_SOURCE_INFO.get(source)
+        return source_info(event, record) if source_info else None
 
     # EventBridge
-    elif "source" in event and "detail-type" in event:
-        info.update(
-            {
-                "event_source": "eventbridge",
-                "source": event["source"],
-                "detail_type": event["detail-type"],
-                "account": event.get("account"),
-                "region": event.get("region"),
-            }
-        )
-
-    # S3
-    elif "Records" in event and event["Records"] and event["Records"][0].get("eventSource") == "aws:s3":
-        record = event["Records"][0]
-        s3_info = record["s3"]
-        info.update(
-            {
-                "event_source": "s3",
-                "bucket_name": s3_info["bucket"]["name"],
-                "object_key": s3_info["object"]["key"],
-                "event_name": record["eventName"],
-            }
-        )
-
-    return info if info else None
+    if "source" in event and "detail-type" in event:
+        return {
+            "event_source": "eventbridge",
+            "source": event["source"],
+            "detail_type": event["detail-type"],
+            "account": event.get("account"),
+            "region": event.get("region"),
+        }
+
+    return None
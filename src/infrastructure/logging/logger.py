@@ -1,15 +1,42 @@
 """Main logging configuration and factory functions."""
 
+import functools
 import logging
-
-from .config import LogConfig, get_log_config
-from .handlers import get_cloudwatch_handler, get_console_handler
+from logging.handlers import QueueHandler
+
+from .config import LogConfig, get_log_config, log_environment_detection
+from .handlers import (
+    get_cloudwatch_handler,
+    get_console_handler,
+    get_queue_handler,
+    retarget_queue_handler,
+    stop_queue_listeners,
+)
+
+# Queue handler installed on the root logger by configure_logging when async logging is
+# enabled; loggers created with the default config share it and its listener thread. It
+# lives for the whole process: reconfiguring only swaps the handlers behind the listener
+_shared_queue_handler: QueueHandler | None = None
+
+
+def _build_handlers(config: LogConfig) -> list[logging.Handler]:
+    """Create the console handler and, if enabled, the CloudWatch handler."""
+    handlers: list[logging.Handler] = [get_console_handler(config)]
+    cloudwatch_handler = get_cloudwatch_handler(config)
+    if cloudwatch_handler:
+        handlers.append(cloudwatch_handler)
+    return handlers
 
 
 def get_logger(name: str, config: LogConfig | None = None) -> logging.Logger:
     """
     Get a configured logger instance.
 
+    Loggers using the default configuration are set up once per name and then
+    served from a cache until configure_logging() or reset_log_config_cache()
+    runs. An explicit config always applies its level; handlers
+    are only added to a logger that has none.
+
     Args:
         name: Logger name (typically __name__)
         config: Optional logging configuration (uses default if not provided)
@@ -18,27 +45,37 @@ def get_logger(name: str, config: LogConfig | None = None) -> logging.Logger:
         logging.Logger: Configured logger instance
     """
     if config is None:
-        config = get_log_config()
+        return _default_logger(name)
+    return _setup_logger(logging.getLogger(name), config, None)
+
+
+@functools.cache
+def _default_logger(name: str) -> logging.Logger:
+    """Set up a logger with the default configuration, once per name."""
+    return _setup_logger(logging.getLogger(name), get_log_config(), _shared_queue_handler)
+
+
+def clear_default_logger_cache() -> None:
+    """Forget which default-config loggers were set up so they pick up the current config."""
+    _default_logger.cache_clear()
 
-    logger = logging.getLogger(name)
+
+def _setup_logger(logger: logging.Logger, config: LogConfig, shared_handler: QueueHandler | None) -> logging.Logger:
+    """Apply a config's level to a logger and attach handlers if it has none yet."""
+    logger.setLevel(config.level)
 
     # Avoid duplicate handlers if logger already configured
     if logger.handlers:
         return logger
 
-    # Configure logger level
-    level_value = config.level.value if hasattr(config.level, "value") else config.level
-    logger.setLevel(level_value)
     logger.propagate = False  # Prevent duplicate logs
 
-    # Add console handler
-    console_handler = get_console_handler(config)
-    logger.addHandler(console_handler)
-
-    # Add CloudWatch handler if enabled
-    cloudwatch_handler = get_cloudwatch_handler(config)
-    if cloudwatch_handler:
-        logger.addHandler(cloudwatch_handler)
+    # Add console and CloudWatch handlers, through the shared queue if there is one
+    if shared_handler is not None:
+        logger.addHandler(shared_handler)
+    else:
+        for handler in _build_handlers(config):
+            logger.addHandler(handler)
 
     return logger
 
@@ -53,29 +90,43 @@ def configure_logging(config: LogConfig | None = None) -> None:
     Args:
         config: Optional logging configuration (uses default if not provided)
     """
+    detected = config is None
     if config is None:
         config = get_log_config()
 
     # Configure root logger
     root_logger = logging.getLogger()
-    level_value = config.level.value if hasattr(config.level, "value") else config.level
-    root_logger.setLevel(level_value)
+    root_logger.setLevel(config.level)
 
     # Clear existing handlers to avoid duplicates
     root_logger.handlers.clear()
 
-    # Add console handler
-    console_handler = get_console_handler(config)
-    root_logger.addHandler(console_handler)
-
-    # Add CloudWatch handler if enabled
-    cloudwatch_handler = get_cloudwatch_handler(config)
-    if cloudwatch_handler:
-        root_logger.addHandler(cloudwatch_handler)
+    # Add console handler and CloudWatch handler if enabled, behind one queue when
+    # async logging is on so callers only enqueue records. Loggers already holding the
+    # queue handler keep it, so it is pointed at the new handlers even when async
+    # logging is now off
+    global _shared_queue_handler  # pylint: disable=global-statement
+    handlers = _build_handlers(config)
+    if _shared_queue_handler is not None:
+        retarget_queue_handler(_shared_queue_handler, handlers)
+    elif config.async_logging:
+        _shared_queue_handler = get_queue_handler(handlers)
+    if config.async_logging and _shared_queue_handler is not None:
+        root_logger.addHandler(_shared_queue_handler)
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+
+    # Default-config loggers are set up again, with the new level, on their next lookup
+    clear_default_logger_cache()
 
     # Configure third-party loggers
     _configure_third_party_loggers(config)
 
+    # Report environment detection now that there are handlers to write it
+    if detected:
+        log_environment_detection(config)
+
     # Log configuration for debugging
     logger = get_logger(__name__, config)
     logger.info(
@@ -133,6 +184,7 @@ def shutdown_logging() -> None:
     This should be called during application shutdown to ensure
     all log messages are flushed and handlers are closed properly.
     """
+    stop_queue_listeners()
     logging.shutdown()
 
 
@@ -1,23 +1,54 @@
 """FastAPI middleware for request/response logging."""
 
+import logging
 import time
-from collections.abc import Callable
+from collections.abc import Iterable
+from typing import Any
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .config import get_log_config
-from .correlation import CorrelationContext
 from .logger import get_logger
 
-
-class LoggingMiddleware(BaseHTTPMiddleware):
+_HEALTH_CHECK_PATHS: frozenset[str] = frozenset(
+    {
+        "/health",
+        "/healthz",
+        "/health/ready",
+        "/health/live",
+        "/ping",
+        "/status",
+        "/metrics",
+    }
+)
+
+# Methods whose request bodies are captured when request body logging is on
+_BODY_METHODS: frozenset[str] = frozenset({"POST", "PUT", "PATCH"})
+
+_DEFAULT_SENSITIVE_HEADERS: frozenset[str] = frozenset(
+    {
+        "authorization",
+        "cookie",
+        "x-api-key",
+        "x-auth-token",
+        "x-access-token",
+        "x-csrf-token",
+    }
+)
+
+
+class LoggingMiddleware:
     """
     FastAPI middleware for comprehensive request/response logging.
 
-    Provides structured logging of HTTP requests with performance metrics,
-    correlation tracking, and configurable data logging.
+    Provides structured logging of HTTP requests with performance metrics and
+    correlation tracking; the correlation ID is stamped on each record by
+    CorrelationFilter rather than passed in extra. Implemented as plain ASGI
+    middleware that only observes the messages it forwards, so responses are
+    streamed through untouched. Request bodies (POST/PUT/PATCH) and error
+    response bodies can be captured, by copying at most max_body_size bytes of
+    each as they pass.
     """
 
     def __init__(
@@ -26,9 +57,10 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         logger_name: str = "api.requests",
         skip_paths: set[str] | None = None,
         skip_health_checks: bool = True,
+        sensitive_headers: set[str] | None = None,
+        skip_path_prefixes: tuple[str, ...] = (),
         log_request_body: bool = False,
         log_response_body: bool = False,
-        sensitive_headers: set[str] | None = None,
         max_body_size: int = 10000,
     ) -> None:
         """
@@ -39,308 +71,274 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             logger_name: Logger name for request logs
             skip_paths: Set of paths to skip logging (exact matches)
             skip_health_checks: Skip common health check endpoints
-            log_request_body: Log request body content
-            log_response_body: Log response body content
-            sensitive_headers: Headers to redact from logs
+            sensitive_headers: Headers to redact from logs (case-insensitive)
+            skip_path_prefixes: Path prefixes to skip logging (e.g. "/docs")
+            log_request_body: Log the body of POST/PUT/PATCH requests
+            log_response_body: Log the body of error (4xx/5xx) responses
             max_body_size: Maximum body size to log (bytes)
         """
-        super().__init__(app)
+        self.app = app
         self.logger = get_logger(logger_name)
         self.config = get_log_config()
-
-        # Configure which paths to skip
-        self.skip_paths = skip_paths or set()
-        if skip_health_checks:
-            self.skip_paths.update(
-                {
-                    "/health",
-                    "/healthz",
-                    "/health/ready",
-                    "/health/live",
-                    "/ping",
-                    "/status",
-                    "/metrics",
-                }
-            )
+        # Read on every response; kept as a plain attribute in the unit durations are measured in
+        self._slow_request_threshold_us = self.config.slow_request_threshold_ms * 1000
 
         # Configure data logging
         self.log_request_body = log_request_body or self.config.log_request_body
         self.log_response_body = log_response_body or self.config.log_response_body
         self.max_body_size = max_body_size
 
-        # Configure header filtering
-        default_sensitive_headers = {
-            "authorization",
-            "cookie",
-            "x-api-key",
-            "x-auth-token",
-            "x-access-token",
-            "x-csrf-token",
-        }
-        self.sensitive_headers = (sensitive_headers or set()) | default_sensitive_headers
+        # Configure which paths to skip; frozen so per-request checks are plain hash lookups
+        self.skip_paths = frozenset(skip_paths or ()) | (_HEALTH_CHECK_PATHS if skip_health_checks else frozenset())
+        self.skip_path_prefixes = tuple(skip_path_prefixes)
+
+        # Configure header filtering (ASGI header names are lowercase)
+        self.sensitive_headers = _DEFAULT_SENSITIVE_HEADERS | {header.lower() for header in sensitive_headers or ()}
+        self._sensitive_header_bytes = frozenset(header.encode("latin-1") for header in self.sensitive_headers)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process HTTP request with comprehensive logging.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware in chain
-
-        Returns:
-            Response: HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Skip logging for configured paths
-        if request.url.path in self.skip_paths:
-            return await call_next(request)
+        # Skip non-HTTP traffic and configured paths
+        if scope["type"] != "http" or self._is_skipped(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
         # Start timing
-        start_time = time.perf_counter()
-
-        # Get or generate correlation ID
-        correlation_id = CorrelationContext.get() or request.state.__dict__.get("correlation_id")
+        start_ns = time.perf_counter_ns()
 
-        # Prepare request context
-        request_context = await self._build_request_context(request, correlation_id)
+        request_context = self._build_request_context(scope)
+        summary = f"{scope['method']} {scope['path']}"
 
         # Log request
-        self.logger.info(
-            f"{request.method} {request.url.path}",
-            extra={
-                "event_type": "request_started",
-                **request_context,
-            },
-        )
+        self.logger.info(summary, extra={"event_type": "request_started", **request_context})
+
+        max_body_size = self.max_body_size
+
+        # The request body is copied as the app reads it, when request body logging is on
+        request_body = bytearray()
+        request_body_size = 0
+
+        async def receive_wrapper() -> Message:
+            nonlocal request_body_size
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                request_body_size += len(chunk)
+                if len(request_body) < max_body_size:
+                    request_body.extend(chunk[: max_body_size - len(request_body)])
+            return message
+
+        capture_request = self.log_request_body and scope["method"] in _BODY_METHODS
+
+        response_start: Message | None = None
+        # Only error responses get a capture buffer, and only when body logging is on
+        body: bytearray | None = None
+        body_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_start, body, body_size
+            if message["type"] == "http.response.start":
+                response_start = message
+                if self.log_response_body and message["status"] >= 400:
+                    body = bytearray()
+            elif body is not None and message["type"] == "http.response.body":
+                chunk = message.get("body", b"")
+                body_size += len(chunk)
+                if len(body) < max_body_size:
+                    body += chunk[: max_body_size - len(body)]
+            await send(message)
 
         # Process request
         try:
-            response = await call_next(request)
+            await self.app(scope, receive_wrapper if capture_request else receive, send_wrapper)
         except Exception as e:
             # Log error but let it propagate
-            self.logger.error(
-                f"Request failed: {request.method} {request.url.path}",
-                extra={
-                    "event_type": "request_error",
-                    "error": str(e),
-                    **request_context,
-                },
-                exc_info=True,
-            )
+            error_context = {"event_type": "request_error", "error": str(e), **request_context}
+            if request_body:
+                error_context["request_body"] = self._decode_body(request_body, request_body_size)
+            self.logger.error(f"Request failed: {summary}", extra=error_context, exc_info=True)
             raise
 
+        if response_start is None:
+            return
+
         # Calculate timing
-        duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+        # Integer microseconds: no float rounding, and exact for histogram buckets
+        duration_us = (time.perf_counter_ns() - start_ns) // 1000
 
         # Build response context
-        response_context = await self._build_response_context(response, duration_ms, request_context)
+        status_code = response_start["status"]
+        response_context = self._build_response_context(
+            status_code, response_start.get("headers", []), duration_us, request_context
+        )
+        if request_body:
+            response_context["request_body"] = self._decode_body(request_body, request_body_size)
+        if body:
+            response_context["response_body"] = self._decode_body(body, body_size)
 
         # Log response
-        log_level = self._get_response_log_level(response.status_code, duration_ms)
+        log_level = self._get_response_log_level(status_code, duration_us)
         self.logger.log(
             log_level,
-            f"{request.method} {request.url.path} - {response.status_code}",
-            extra={
-                "event_type": "request_completed",
-                **response_context,
-            },
+            f"{summary} - {status_code}",
+            extra={"event_type": "request_completed", **response_context},
         )
 
-        return response
+    def _is_skipped(self, path: str) -> bool:
+        """
+        Check whether a path is excluded from request logging.
 
-    async def _build_request_context(self, request: Request, correlation_id: str | None) -> dict:
+        Args:
+            path: Request path
+
+        Returns:
+            bool: True if the path matches a skipped path or prefix
+        """
+        # An empty prefix tuple never matches, so no separate emptiness check is needed
+        return path in self.skip_paths or path.startswith(self.skip_path_prefixes)
+
+    def _build_request_context(self, scope: Scope) -> dict[str, Any]:
         """
         Build structured context for request logging.
 
+        Reads the ASGI scope directly; the filtered header dict is built in one
+        pass and also serves the individual header lookups.
+
         Args:
-            request: HTTP request
-            correlation_id: Request correlation ID
+            scope: ASGI connection scope
 
         Returns:
             Dict: Request logging context
         """
+        headers = self._filter_headers(scope["headers"])
+        query_string = scope["query_string"]
+
         # Basic request info
-        context = {
-            "method": request.method,
-            "path": request.url.path,
-            "query_params": dict(request.query_params),
-            "client_ip": self._get_client_ip(request),
-            "user_agent": request.headers.get("user-agent"),
-            "content_type": request.headers.get("content-type"),
-            "content_length": request.headers.get("content-length"),
+        context: dict[str, Any] = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "query_params": dict(QueryParams(query_string)) if query_string else {},
+            "client_ip": self._get_client_ip(headers, scope.get("client")),
+            "user_agent": headers.get("user-agent"),
+            "content_type": headers.get("content-type"),
+            "content_length": headers.get("content-length"),
         }
 
-        # Add correlation ID
-        if correlation_id:
-            context["correlation_id"] = correlation_id
-
         # Add filtered headers
-        context["headers"] = self._filter_headers(dict(request.headers))
-
-        # Add request body if configured
-        if self.log_request_body and request.method in {"POST", "PUT", "PATCH"}:
-            body = await self._get_request_body(request)
-            if body:
-                context["request_body"] = body
+        context["headers"] = headers
 
         return context
 
-    async def _build_response_context(self, response: Response, duration_ms: float, request_context: dict) -> dict:
+    def _build_response_context(
+        self,
+        status_code: int,
+        raw_headers: list[tuple[bytes, bytes]],
+        duration_us: int,
+        request_context: dict[str, Any],
+    ) -> dict[str, Any]:
         """
         Build structured context for response logging.
 
         Args:
-            response: HTTP response
-            duration_ms: Request duration in milliseconds
+            status_code: HTTP status code
+            raw_headers: Response headers as ASGI (name, value) byte pairs
+            duration_us: Request duration in microseconds
             request_context: Original request context
 
         Returns:
             Dict: Response logging context
         """
+        headers = self._filter_headers(raw_headers)
+
         # Merge request context with response info
-        context = {
+        return {
             **request_context,
-            "status_code": response.status_code,
-            "duration_ms": duration_ms,
-            "response_size": response.headers.get("content-length"),
+            "status_code": status_code,
+            "duration_us": duration_us,
+            "response_size": headers.get("content-length"),
+            "response_headers": headers,
         }
 
-        # Add response headers
-        context["response_headers"] = self._filter_headers(dict(response.headers))
-
-        # Add response body if configured and appropriate
-        if (
-            self.log_response_body
-            and response.status_code >= 400  # Only log error responses by default
-            and hasattr(response, "body")
-        ):
-            body = await self._get_response_body(response)
-            if body:
-                context["response_body"] = body
-
-        return context
-
-    def _get_client_ip(self, request: Request) -> str | None:
+    def _get_client_ip(self, headers: dict[str, str], client: tuple[str, int] | None) -> str | None:
         """
         Extract client IP address from request.
 
         Args:
-            request: HTTP request
+            headers: Filtered request headers
+            client: ASGI client (host, port) pair
 
         Returns:
             Optional[str]: Client IP address
         """
-        # Check common proxy headers
-        forwarded_for = request.headers.get("x-forwarded-for")
+        # Check common proxy headers (X-Forwarded-For is also what the AWS ALB sets)
+        forwarded_for = headers.get("x-forwarded-for")
         if forwarded_for:
             return forwarded_for.split(",")[0].strip()
 
-        real_ip = request.headers.get("x-real-ip")
+        real_ip = headers.get("x-real-ip")
         if real_ip:
             return real_ip
 
-        # AWS ALB header
-        forwarded = request.headers.get("x-forwarded-for")
-        if forwarded:
-            return forwarded.split(",")[0].strip()
-
         # Fallback to client address if available
-        if hasattr(request, "client") and request.client:
-            return request.client.host
-
-        return None
+        return client[0] if client else None
 
-    def _filter_headers(self, headers: dict[str, str]) -> dict[str, str]:
+    def _filter_headers(self, raw_headers: Iterable[tuple[bytes, bytes]]) -> dict[str, str]:
         """
-        Filter sensitive headers from logs.
+        Decode raw ASGI headers for logging, redacting sensitive ones.
 
         Args:
-            headers: Raw headers dictionary
+            raw_headers: (name, value) byte pairs with lowercase names
 
         Returns:
             Dict[str, str]: Filtered headers
         """
-        filtered = {}
-        for key, value in headers.items():
-            if key.lower() in self.sensitive_headers:
-                filtered[key] = "[REDACTED]"
-            else:
-                filtered[key] = value
-        return filtered
-
-    async def _get_request_body(self, request: Request) -> str | None:
-        """
-        Extract request body for logging.
-
-        Args:
-            request: HTTP request
-
-        Returns:
-            Optional[str]: Request body content (truncated if too large)
-        """
-        try:
-            body = await request.body()
-            if not body:
-                return None
-
-            # Check size limit
-            if len(body) > self.max_body_size:
-                return f"[TRUNCATED - {len(body)} bytes]"
-
-            # Try to decode as text
-            try:
-                return body.decode("utf-8")
-            except UnicodeDecodeError:
-                return f"[BINARY DATA - {len(body)} bytes]"
-
-        except Exception as e:
-            self.logger.debug(f"Failed to read request body: {e}")
-            return None
+        sensitive = self._sensitive_header_bytes
+        return {
+            name.decode("latin-1"): "[REDACTED]" if name in sensitive else value.decode("latin-1")
+            for name, value in raw_headers
+        }
 
-    async def _get_response_body(self, response: Response) -> str | None:
+    def _decode_body(self, body: bytearray, body_size: int) -> str:
         """
-        Extract response body for logging.
+        Render a captured request or response body for logging.
 
         Args:
-            response: HTTP response
+            body: Captured prefix of the body (at most max_body_size bytes)
+            body_size: Total size of the body received or sent
 
         Returns:
-            Optional[str]: Response body content (truncated if too large)
+            str: Body text, marked when truncated or not valid UTF-8
         """
         try:
-            if not hasattr(response, "body") or not response.body:
-                return None
-
-            body = response.body
-            if isinstance(body, bytes):
-                # Check size limit
-                if len(body) > self.max_body_size:
-                    return f"[TRUNCATED - {len(body)} bytes]"
-
-                # Try to decode as text
-                try:
-                    return body.decode("utf-8")
-                except UnicodeDecodeError:
-                    return f"[BINARY DATA - {len(body)} bytes]"
-
-            return str(body)
-
-        except Exception as e:
-            self.logger.debug(f"Failed to read response body: {e}")
-            return None
-
-    def _get_response_log_level(self, status_code: int, duration_ms: float) -> int:
+            text = body.decode("utf-8")
+        except UnicodeDecodeError:
+            # A multi-byte character may have been cut at the size limit
+            if body_size <= len(body):
+                return f"[BINARY DATA - {body_size} bytes]"
+            text = body.decode("utf-8", errors="ignore")
+
+        if body_size > len(body):
+            return f"{text}[TRUNCATED - {body_size} bytes]"
+        return text
+
+    def _get_response_log_level(self, status_code: int, duration_us: int) -> int:
         """
         Determine appropriate log level for response.
 
         Args:
             status_code: HTTP status code
-            duration_ms: Request duration in milliseconds
+            duration_us: Request duration in microseconds
 
         Returns:
             int: Python logging level
         """
-        import logging
-
         # Errors get ERROR level
         if status_code >= 500:
             return logging.ERROR
@@ -350,7 +348,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             return logging.WARNING
 
         # Slow requests get WARNING level
-        if duration_ms > self.config.slow_request_threshold_ms:
+        if duration_us > self._slow_request_threshold_us:
             return logging.WARNING
 
         # Everything else gets INFO level
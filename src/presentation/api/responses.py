@@ -0,0 +1,24 @@
+"""Response classes shared by the API routers."""
+
+from collections.abc import Sequence
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+# UTC datetimes end in "Z" and Decimals are written as strings, matching Pydantic's JSON output
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class ModelListResponse(ORJSONResponse):
+    """
+    JSON response for a list of response schemas, encoded directly with orjson.
+
+    Endpoints returning this skip FastAPI's response-model validation and
+    serialization; the route's response_model still documents the schema.
+    Models must be flat (as built by the from_domain constructors): their
+    field values are encoded as-is.
+    """
+
+    def render(self, content: Sequence[BaseModel]) -> bytes:
+        return orjson.dumps([model.__dict__ for model in content], default=str, option=_ORJSON_OPTIONS)
@@ -1,3 +1,7 @@
+import base64
+import binascii
+import functools
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -10,26 +14,53 @@ from src.application.use_cases.queries.search_customers import (
     SearchCustomersQuery,
     SearchCustomersUseCase,
 )
-from src.domain.repositories.customer_repository import CustomerRepository
+from src.domain.repositories.customer_repository import CustomerCursor, CustomerRepository
+from src.presentation.api.responses import ModelListResponse
 from src.presentation.repositories import get_customer_repository
 from src.presentation.schemas.customer_schemas import (
     CreateCustomerRequest,
     CustomerResponse,
 )
 
-router = APIRouter(prefix="/api/v1/customers", tags=["customers"])
+router = APIRouter(prefix="/customers", tags=["customers"])
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_cursor(cursor: CustomerCursor) -> str:
+    """Encode a keyset cursor as an opaque URL-safe token."""
+    created_at, customer_id = cursor
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{customer_id}".encode()).decode()
+
+
+def _decode_cursor(token: str) -> CustomerCursor:
+    """Decode a cursor token produced by _encode_cursor."""
+    try:
+        created_at, customer_id = base64.urlsafe_b64decode(token.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(customer_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from e
+
+
+# Use cases only hold the shared repositories, so one instance serves every request
+@functools.lru_cache(maxsize=1)
+def _create_customer_use_case() -> CreateCustomerUseCase:
+    return CreateCustomerUseCase(get_customer_repository())
+
+
+@functools.lru_cache(maxsize=1)
+def _search_customers_use_case() -> SearchCustomersUseCase:
+    return SearchCustomersUseCase(get_customer_repository())
 
 
 async def get_create_customer_use_case() -> CreateCustomerUseCase:
     """Get create customer use case dependency."""
-    repo = get_customer_repository()
-    return CreateCustomerUseCase(repo)
+    return _create_customer_use_case()
 
 
 async def get_search_customers_use_case() -> SearchCustomersUseCase:
     """Get search customers use case dependency."""
-    repo = get_customer_repository()
-    return SearchCustomersUseCase(repo)
+    return _search_customers_use_case()
 
 
 @router.post("/", response_model=CustomerResponse, status_code=status.HTTP_201_CREATED)
@@ -38,73 +69,45 @@ async def create_customer(
     use_case: CreateCustomerUseCase = Depends(get_create_customer_use_case),
 ) -> CustomerResponse:
     """Create a new customer."""
-    try:
-        command = CreateCustomerCommand(name=request.name, email=request.email, preferences=request.preferences)
-        customer = await use_case.execute(command)
-
-        return CustomerResponse(
-            id=customer.id,
-            name=customer.name,
-            email=str(customer.email),
-            is_active=customer.is_active,
-            preferences=customer.preferences,
-            created_at=customer.created_at,
-            updated_at=customer.updated_at,
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
-
-
-@router.get("/", response_model=list[CustomerResponse])
+    command = CreateCustomerCommand(name=request.name, email=request.email, preferences=request.preferences)
+    customer = await use_case.execute(command)
+
+    return CustomerResponse.from_domain(customer)
+
+
+@router.get("/", response_model=list[CustomerResponse], response_class=ModelListResponse)
 async def list_customers(
     repo: CustomerRepository = Depends(get_customer_repository),
-) -> list[CustomerResponse]:
+) -> ModelListResponse:
     """List all customers."""
-    customers = await repo.list_all()
-    return [
-        CustomerResponse(
-            id=c.id,
-            name=c.name,
-            email=str(c.email),
-            is_active=c.is_active,
-            preferences=c.preferences,
-            created_at=c.created_at,
-            updated_at=c.updated_at,
-        )
-        for c in customers
-    ]
-
-
-@router.get("/search", response_model=list[CustomerResponse])
+    return ModelListResponse([CustomerResponse.from_domain(c) async for c in repo.list_all()])
+
+
+@router.get("/search", response_model=list[CustomerResponse], response_class=ModelListResponse)
 async def search_customers(
     name_contains: str | None = Query(None, description="Filter by name containing this text"),
     email_contains: str | None = Query(None, description="Filter by email containing this text"),
     is_active: bool | None = Query(None, description="Filter by active status"),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of results"),
-    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    cursor: str | None = Query(None, description=f"Pagination cursor from the {NEXT_CURSOR_HEADER} response header"),
     use_case: SearchCustomersUseCase = Depends(get_search_customers_use_case),
-) -> list[CustomerResponse]:
-    """Search customers with optional filters."""
+) -> ModelListResponse:
+    """Search customers with optional filters, newest first.
+
+    When more results exist, the cursor for the next page is returned in the
+    X-Next-Cursor response header.
+    """
     query = SearchCustomersQuery(
         name_contains=name_contains,
         email_contains=email_contains,
         is_active=is_active,
         limit=limit,
-        offset=offset,
+        cursor=_decode_cursor(cursor) if cursor else None,
     )
-    customers = await use_case.execute(query)
-    return [
-        CustomerResponse(
-            id=c.id,
-            name=c.name,
-            email=str(c.email),
-            is_active=c.is_active,
-            preferences=c.preferences,
-            created_at=c.created_at,
-            updated_at=c.updated_at,
-        )
-        for c in customers
-    ]
+    customers, next_cursor = await use_case.execute(query)
+    headers = {NEXT_CURSOR_HEADER: _encode_cursor(next_cursor)} if next_cursor else None
+
+    return ModelListResponse([CustomerResponse.from_domain(c) for c in customers], headers=headers)
 
 
 @router.get("/{customer_id}", response_model=CustomerResponse)
@@ -117,12 +120,4 @@ async def get_customer(
     if not customer:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Customer not found")
 
-    return CustomerResponse(
-        id=customer.id,
-        name=customer.name,
-        email=str(customer.email),
-        is_active=customer.is_active,
-        preferences=customer.preferences,
-        created_at=customer.created_at,
-        updated_at=customer.updated_at,
-    )
+    return CustomerResponse.from_domain(customer)
@@ -1,5 +1,6 @@
 """Orders API endpoints."""
 
+import functools
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -10,20 +11,35 @@ from src.application.use_cases.commands.create_order import (
 )
 from src.application.use_cases.queries.get_customer_orders import GetCustomerOrdersQuery
 from src.domain.repositories.order_repository import OrderRepository
+from src.presentation.api.responses import ModelListResponse
 from src.presentation.repositories import get_customer_repository, get_order_repository
 from src.presentation.schemas.order_schemas import (
     CreateOrderRequest,
     OrderResponse,
 )
 
-router = APIRouter(prefix="/api/v1/orders", tags=["orders"])
+router = APIRouter(prefix="/orders", tags=["orders"])
+
+
+# Use cases only hold the shared repositories, so one instance serves every request
+@functools.lru_cache(maxsize=1)
+def _create_order_use_case() -> CreateOrderUseCase:
+    return CreateOrderUseCase(get_order_repository(), get_customer_repository())
+
+
+@functools.lru_cache(maxsize=1)
+def _customer_orders_query() -> GetCustomerOrdersQuery:
+    return GetCustomerOrdersQuery(get_order_repository())
 
 
 async def get_create_order_use_case() -> CreateOrderUseCase:
     """Get create order use case dependency."""
-    order_repo = get_order_repository()
-    customer_repo = get_customer_repository()
-    return CreateOrderUseCase(order_repo, customer_repo)
+    return _create_order_use_case()
+
+
+async def get_customer_orders_query() -> GetCustomerOrdersQuery:
+    """Get customer orders query dependency."""
+    return _customer_orders_query()
 
 
 @router.post("/", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
@@ -32,48 +48,23 @@ async def create_order(
     use_case: CreateOrderUseCase = Depends(get_create_order_use_case),
 ) -> OrderResponse:
     """Create a new order."""
-    try:
-        command = CreateOrderCommand(
-            customer_id=request.customer_id,
-            total_amount=request.total_amount,
-            currency=request.currency,
-            details=request.details,
-        )
-        order = await use_case.execute(command)
-
-        return OrderResponse(
-            id=order.id,
-            customer_id=UUID(str(order.customer_id)),
-            total_amount=order.total_amount.amount,
-            currency=order.total_amount.currency,
-            status=order.status.value,
-            details=order.details,
-            created_at=order.created_at,
-            updated_at=order.updated_at,
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
-
-
-@router.get("/", response_model=list[OrderResponse])
+    command = CreateOrderCommand(
+        customer_id=request.customer_id,
+        total_amount=request.total_amount,
+        currency=request.currency,
+        details=request.details,
+    )
+    order = await use_case.execute(command)
+
+    return OrderResponse.from_domain(order)
+
+
+@router.get("/", response_model=list[OrderResponse], response_class=ModelListResponse)
 async def list_orders(
     repo: OrderRepository = Depends(get_order_repository),
-) -> list[OrderResponse]:
+) -> ModelListResponse:
     """List all orders."""
-    orders = await repo.list_all()
-    return [
-        OrderResponse(
-            id=o.id,
-            customer_id=UUID(str(o.customer_id)),
-            total_amount=o.total_amount.amount,
-            currency=o.total_amount.currency,
-            status=o.status.value,
-            details=o.details,
-            created_at=o.created_at,
-            updated_at=o.updated_at,
-        )
-        for o in orders
-    ]
+    return ModelListResponse([OrderResponse.from_domain(o) async for o in repo.list_all()])
 
 
 @router.get("/{order_id}", response_model=OrderResponse)
@@ -86,37 +77,15 @@ async def get_order(
     if not order:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Order not found")
 
-    return OrderResponse(
-        id=order.id,
-        customer_id=UUID(str(order.customer_id)),
-        total_amount=order.total_amount.amount,
-        currency=order.total_amount.currency,
-        status=order.status.value,
-        details=order.details,
-        created_at=order.created_at,
-        updated_at=order.updated_at,
-    )
+    return OrderResponse.from_domain(order)
 
 
-@router.get("/customer/{customer_id}", response_model=list[OrderResponse])
+@router.get("/customer/{customer_id}", response_model=list[OrderResponse], response_class=ModelListResponse)
 async def get_customer_orders(
     customer_id: UUID,
-    repo: OrderRepository = Depends(get_order_repository),
-) -> list[OrderResponse]:
+    query: GetCustomerOrdersQuery = Depends(get_customer_orders_query),
+) -> ModelListResponse:
     """Get all orders for a specific customer."""
-    query = GetCustomerOrdersQuery(repo)
     orders = await query.execute(customer_id)
 
-    return [
-        OrderResponse(
-            id=o.id,
-            customer_id=UUID(str(o.customer_id)),
-            total_amount=o.total_amount.amount,
-            currency=o.total_amount.currency,
-            status=o.status.value,
-            details=o.details,
-            created_at=o.created_at,
-            updated_at=o.updated_at,
-        )
-        for o in orders
-    ]
+    return ModelListResponse([OrderResponse.from_domain(o) for o in orders])
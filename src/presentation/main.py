@@ -3,8 +3,9 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.infrastructure.logging import (
     LoggingMiddleware,
@@ -37,6 +38,11 @@ async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
     shutdown_logging()
 
 
+async def value_error_handler(_request: Request, exc: Exception) -> ORJSONResponse:
+    """Report validation errors raised by use cases and domain objects as 400 Bad Request."""
+    return ORJSONResponse({"detail": str(exc)}, status_code=status.HTTP_400_BAD_REQUEST)
+
+
 app = FastAPI(
     title="Clean Architecture Python",
     description="Clean Architecture Python demonstration API",
@@ -44,27 +50,36 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Add logging middleware (order matters!)
-app.add_middleware(correlation_middleware)
-app.add_middleware(
-    LoggingMiddleware,
-    skip_paths={"/health", "/docs", "/redoc", "/openapi.json"},
-    log_request_body=False,  # Will be overridden by environment detection
-    log_response_body=False,
+# Versioned API mounted as its own app so request logging wraps only API routes;
+# health checks and the docs never reach LoggingMiddleware. Its docs are served at /api/v1/docs.
+api_v1 = FastAPI(
+    title="Clean Architecture Python API v1",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
+api_v1.add_exception_handler(ValueError, value_error_handler)
+api_v1.add_middleware(LoggingMiddleware, skip_paths={"/api/v1/docs", "/api/v1/redoc", "/api/v1/openapi.json"})
+api_v1.include_router(customers_router)
+api_v1.include_router(orders_router)
+app.mount("/api/v1", api_v1)
+
+# Add correlation middleware (runs before request logging in the mounted API)
+app.add_middleware(correlation_middleware)
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
+    # No cookie auth: a static "*" origin header is sent instead of echoing each request's Origin
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Browsers only let scripts read non-safelisted response headers that are exposed
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include routers
 app.include_router(health_router)
-app.include_router(customers_router)
-app.include_router(orders_router)
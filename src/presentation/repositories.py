@@ -1,33 +1,68 @@
 """Shared repository instances for the demo."""
 
+from bisect import bisect_left, insort
+from collections.abc import AsyncIterator, Collection
 from uuid import UUID
 
 from src.domain.entities.customer import Customer
 from src.domain.entities.order import Order
-from src.domain.repositories.customer_repository import CustomerRepository
-from src.domain.repositories.order_repository import OrderRepository
+from src.domain.repositories.customer_repository import CustomerCursor, CustomerRepository
+from src.domain.repositories.order_repository import OrderCursor, OrderRepository
+from src.shared_kernel import ResourceAlreadyExistsError
 
 
 class InMemoryCustomerRepository(CustomerRepository):
     """In-memory customer repository for demos."""
 
     def __init__(self) -> None:
-        self._customers: list[Customer] = []
+        # Customers by ID in insertion order, plus a unique email index and the
+        # (created_at, id) keys in ascending order for keyset pagination
+        self._by_id: dict[UUID, Customer] = {}
+        self._by_email: dict[str, UUID] = {}
+        self._keys: list[CustomerCursor] = []
+        # Case-folded name and email per customer for the search filters
+        self._name_folded: dict[UUID, str] = {}
+        self._email_folded: dict[UUID, str] = {}
 
     async def find_by_id(self, customer_id: UUID) -> Customer | None:
-        return next((c for c in self._customers if c.id == customer_id), None)
+        return self._by_id.get(customer_id)
+
+    async def find_by_ids(self, customer_ids: Collection[UUID]) -> dict[UUID, Customer]:
+        by_id = self._by_id
+        return {customer_id: by_id[customer_id] for customer_id in customer_ids if customer_id in by_id}
 
     async def find_by_email(self, email: str) -> Customer | None:
-        return next((c for c in self._customers if str(c.email) == email), None)
+        customer_id = self._by_email.get(email)
+        return self._by_id.get(customer_id) if customer_id else None
 
     async def save(self, customer: Customer) -> Customer:
-        # Remove existing customer with same ID if it exists
-        self._customers = [c for c in self._customers if c.id != customer.id]
-        self._customers.append(customer)
+        # Mirror the database unique constraint on email
+        email = str(customer.email)
+        owner = self._by_email.get(email)
+        if owner is not None and owner != customer.id:
+            raise ResourceAlreadyExistsError("Customer", "email", email)
+
+        # Update an existing customer in place, touching the email and key indexes
+        # only when those values changed
+        key = (customer.created_at, customer.id)
+        previous = self._by_id.get(customer.id)
+        if previous is None:
+            insort(self._keys, key)
+        else:
+            if previous.email != customer.email:
+                del self._by_email[str(previous.email)]
+            if previous.created_at != customer.created_at:
+                del self._keys[bisect_left(self._keys, (previous.created_at, previous.id))]
+                insort(self._keys, key)
+        self._by_id[customer.id] = customer
+        self._by_email[email] = customer.id
+        self._name_folded[customer.id] = customer.name.casefold()
+        self._email_folded[customer.id] = email.casefold()
         return customer
 
-    async def list_all(self) -> list[Customer]:
-        return self._customers.copy()
+    async def list_all(self) -> AsyncIterator[Customer]:
+        for customer in list(self._by_id.values()):
+            yield customer
 
     async def search(
         self,
@@ -35,41 +70,74 @@ class InMemoryCustomerRepository(CustomerRepository):
         email_contains: str | None = None,
         is_active: bool | None = None,
         limit: int = 50,
-        offset: int = 0,
-    ) -> list[Customer]:
-        """Search customers with optional filters."""
-        filtered = self._customers.copy()
-
-        if name_contains:
-            filtered = [c for c in filtered if name_contains.lower() in c.name.lower()]
-        if email_contains:
-            filtered = [c for c in filtered if email_contains.lower() in str(c.email).lower()]
-        if is_active is not None:
-            filtered = [c for c in filtered if c.is_active == is_active]
-
-        return filtered[offset : offset + limit]
+        cursor: CustomerCursor | None = None,
+    ) -> tuple[list[Customer], CustomerCursor | None]:
+        """Search customers with optional filters using keyset pagination."""
+        name = name_contains.casefold() if name_contains else None
+        email = email_contains.casefold() if email_contains else None
+
+        # Walk the sorted keys newest-first from just before the cursor, stopping
+        # once one match beyond the page is found
+        keys = self._keys
+        end = bisect_left(keys, cursor) if cursor else len(keys)
+        matches: list[Customer] = []
+        for index in range(end - 1, -1, -1):
+            customer_id = keys[index][1]
+            if name and name not in self._name_folded[customer_id]:
+                continue
+            if email and email not in self._email_folded[customer_id]:
+                continue
+            customer = self._by_id[customer_id]
+            if is_active is not None and customer.is_active != is_active:
+                continue
+            matches.append(customer)
+            if len(matches) > limit:
+                break
+
+        page = matches[:limit]
+        next_cursor = (page[-1].created_at, page[-1].id) if len(matches) > limit else None
+        return page, next_cursor
 
 
 class InMemoryOrderRepository(OrderRepository):
     """In-memory order repository for demos."""
 
     def __init__(self) -> None:
-        self._orders: list[Order] = []
+        # Orders by ID in insertion order, plus the order IDs of each customer
+        self._by_id: dict[UUID, Order] = {}
+        self._by_customer: dict[UUID, set[UUID]] = {}
 
     async def find_by_id(self, order_id: UUID) -> Order | None:
-        return next((o for o in self._orders if o.id == order_id), None)
+        return self._by_id.get(order_id)
 
     async def save(self, order: Order) -> Order:
-        # Remove existing order with same ID if it exists
-        self._orders = [o for o in self._orders if o.id != order.id]
-        self._orders.append(order)
+        # Update an existing order in place, moving it between customers only if
+        # its customer changed
+        previous = self._by_id.get(order.id)
+        if previous is None or previous.customer_id != order.customer_id:
+            if previous is not None:
+                self._by_customer[previous.customer_id.value].discard(order.id)
+            self._by_customer.setdefault(order.customer_id.value, set()).add(order.id)
+        self._by_id[order.id] = order
         return order
 
-    async def find_by_customer(self, customer_id: UUID) -> list[Order]:
-        return [o for o in self._orders if o.customer_id == customer_id]
-
-    async def list_all(self) -> list[Order]:
-        return self._orders.copy()
+    async def find_by_customer(
+        self,
+        customer_id: UUID,
+        limit: int | None = None,
+        cursor: OrderCursor | None = None,
+    ) -> list[Order]:
+        # Apply the cursor while gathering so only one list is built and sorted
+        by_id = self._by_id
+        candidates = (by_id[order_id] for order_id in self._by_customer.get(customer_id, ()))
+        if cursor:
+            candidates = (o for o in candidates if (o.created_at, o.id) < cursor)
+        orders = sorted(candidates, key=lambda o: (o.created_at, o.id), reverse=True)
+        return orders if limit is None else orders[:limit]
+
+    async def list_all(self) -> AsyncIterator[Order]:
+        for order in list(self._by_id.values()):
+            yield order
 
 
 # Global shared repository instances
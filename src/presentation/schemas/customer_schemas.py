@@ -4,6 +4,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from src.domain.entities.customer import Customer
+
 
 class CreateCustomerRequest(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
@@ -22,3 +24,16 @@ class CustomerResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+    @classmethod
+    def from_domain(cls, customer: Customer) -> "CustomerResponse":
+        """Build a response from a customer aggregate without re-validating its fields."""
+        return cls.model_construct(
+            id=customer.id,
+            name=customer.name,
+            email=customer.email.value,
+            is_active=customer.is_active,
+            preferences=dict(customer.preferences),
+            created_at=customer.created_at,
+            updated_at=customer.updated_at,
+        )
@@ -5,6 +5,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from src.domain.entities.order import Order
+
 
 class CreateOrderRequest(BaseModel):
     """Request schema for creating an order."""
@@ -41,3 +43,17 @@ class OrderResponse(BaseModel):
                 "updated_at": "2024-01-01T12:00:00Z",
             }
         }
+
+    @classmethod
+    def from_domain(cls, order: Order) -> "OrderResponse":
+        """Build a response from an order aggregate without re-validating its fields."""
+        return cls.model_construct(
+            id=order.id,
+            customer_id=order.customer_id.value,
+            total_amount=order.total_amount.amount,
+            currency=order.total_amount.currency,
+            status=order.status.value,
+            details=dict(order.details),
+            created_at=order.created_at,
+            updated_at=order.updated_at,
+        )
@@ -1,49 +1,49 @@
 """Application startup initialization."""
 
-from uuid import uuid4
+from contextlib import aclosing
 
 from src.domain.entities.customer import Customer
 from src.presentation.repositories import get_customer_repository
-from src.shared_kernel import CustomerId, Email
+from src.shared_kernel import CustomerId, Email, uuid7
 
 
 async def initialize_sample_data() -> None:
     """Initialize the application with sample data for demo purposes."""
     customer_repo = get_customer_repository()
 
-    # Check if data already exists
-    existing_customers = await customer_repo.list_all()
-    if existing_customers:
-        return  # Data already initialized
+    # Check if data already exists; aclosing ends the stream (and its cursor) after one row
+    async with aclosing(customer_repo.list_all()) as customers:
+        if await anext(customers, None) is not None:
+            return  # Data already initialized
 
     # Create sample customers
     sample_customers = [
         Customer.create(
-            customer_id=CustomerId(uuid4()),
+            customer_id=CustomerId(uuid7()),
             name="Alice Johnson",
             email=Email("alice@example.com"),
             preferences={"theme": "light", "notifications": True, "newsletter": True},
         ),
         Customer.create(
-            customer_id=CustomerId(uuid4()),
+            customer_id=CustomerId(uuid7()),
             name="Bob Smith",
             email=Email("bob@example.com"),
             preferences={"theme": "dark", "notifications": False, "newsletter": False},
         ),
         Customer.create(
-            customer_id=CustomerId(uuid4()),
+            customer_id=CustomerId(uuid7()),
             name="Carol Davis",
             email=Email("carol@example.com"),
             preferences={"theme": "light", "notifications": True, "newsletter": True},
         ).deactivate("Demo inactive customer"),
         Customer.create(
-            customer_id=CustomerId(uuid4()),
+            customer_id=CustomerId(uuid7()),
             name="David Wilson",
             email=Email("david@example.com"),
             preferences={"theme": "auto", "notifications": True, "newsletter": False},
         ),
         Customer.create(
-            customer_id=CustomerId(uuid4()),
+            customer_id=CustomerId(uuid7()),
             name="Emma Brown",
             email=Email("emma@example.com"),
             preferences={"theme": "light", "notifications": False, "newsletter": True},
@@ -11,11 +11,12 @@ from .base.value_object import ValueObject
 from .exceptions.domain_exceptions import (
     BusinessRuleViolationError,
     DomainError,
+    ResourceAlreadyExistsError,
     ResourceNotFoundError,
 )
 
 # Common types
-from .types.identifiers import CustomerId, OrderId, ProductId
+from .types.identifiers import CustomerId, OrderId, ProductId, uuid7
 from .value_objects.address import Address
 
 # Common value objects
@@ -39,8 +40,10 @@ __all__ = [
     "CustomerId",
     "OrderId",
     "ProductId",
+    "uuid7",
     # Common exceptions
     "DomainError",
     "BusinessRuleViolationError",
     "ResourceNotFoundError",
+    "ResourceAlreadyExistsError",
 ]
@@ -1,7 +1,9 @@
 """Base Aggregate Root class."""
 
+import copy
+from collections import deque
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Self
 
 from .entity import Entity
 
@@ -9,7 +11,7 @@ if TYPE_CHECKING:
     from .domain_event import DomainEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregateRoot(Entity):
     """
     Base class for aggregate roots.
@@ -18,7 +20,7 @@ class AggregateRoot(Entity):
     boundaries. They can raise domain events.
     """
 
-    _domain_events: list["DomainEvent"] = field(default_factory=list, init=False, repr=False)
+    _domain_events: deque["DomainEvent"] = field(default_factory=deque, init=False, repr=False)
 
     def add_domain_event(self, event: "DomainEvent") -> None:
         """Add a domain event to this aggregate."""
@@ -30,10 +32,35 @@ class AggregateRoot(Entity):
 
         Used by infrastructure to get events for publishing after persistence.
         """
-        events = self._domain_events.copy()
+        events = list(self._domain_events)
         self._domain_events.clear()
         return events
 
+    def _successor(self, **changes: Any) -> Self:
+        """
+        Copy this aggregate with some fields changed, without running __init__.
+
+        State transitions of an already-validated aggregate use this instead of
+        dataclasses.replace, so the successor is not revalidated and no caller
+        can skip validation by passing a flag to the constructor.
+        """
+        successor = copy.copy(self)
+        # Pending events stay with this aggregate unless explicitly handed over
+        successor._domain_events = deque()
+        for name, value in changes.items():
+            setattr(successor, name, value)
+        return successor
+
+    def _hand_over_domain_events(self, successor: "AggregateRoot") -> None:
+        """
+        Move pending domain events to a successor aggregate.
+
+        State transitions return a new aggregate; the pending events travel with
+        it instead of being copied, and this superseded instance is left empty.
+        """
+        successor._domain_events = self._domain_events
+        self._domain_events = deque()
+
     def clear_domain_events(self) -> None:
         """Clear domain events without collecting."""
         self._domain_events.clear()
@@ -1,12 +1,12 @@
 """Base Domain Event class."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from typing import Any
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DomainEvent:
     """
     Base class for domain events.
@@ -24,5 +24,5 @@ class DomainEvent:
             "event_type": self.__class__.__name__,
             "event_id": str(self.event_id),
             "occurred_at": self.occurred_at.isoformat(),
-            **{k: v for k, v in self.__dict__.items() if k not in ["event_id", "occurred_at"]},
+            **{f.name: getattr(self, f.name) for f in fields(self) if f.name not in ("event_id", "occurred_at")},
         }
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity(ABC):
     """
     Base class for all entities.
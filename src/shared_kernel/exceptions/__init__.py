@@ -3,6 +3,7 @@
 from .domain_exceptions import (
     BusinessRuleViolationError,
     DomainError,
+    ResourceAlreadyExistsError,
     ResourceNotFoundError,
 )
 
@@ -10,4 +11,5 @@ __all__ = [
     "DomainError",
     "BusinessRuleViolationError",
     "ResourceNotFoundError",
+    "ResourceAlreadyExistsError",
 ]
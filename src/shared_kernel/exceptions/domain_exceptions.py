@@ -26,3 +26,14 @@ class ResourceNotFoundError(DomainError):
         super().__init__(message, "RESOURCE_NOT_FOUND")
         self.resource_type = resource_type
         self.resource_id = resource_id
+
+
+class ResourceAlreadyExistsError(DomainError):
+    """Raised when a resource conflicts with an existing one on a unique attribute."""
+
+    def __init__(self, resource_type: str, attribute: str, value: str) -> None:
+        message = f"{resource_type} with {attribute} {value} already exists"
+        super().__init__(message, "RESOURCE_ALREADY_EXISTS")
+        self.resource_type = resource_type
+        self.attribute = attribute
+        self.value = value
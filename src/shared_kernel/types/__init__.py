@@ -1,5 +1,5 @@
 """Common types for the shared kernel."""
 
-from .identifiers import CustomerId, OrderId, ProductId
+from .identifiers import CustomerId, OrderId, ProductId, uuid7
 
-__all__ = ["CustomerId", "OrderId", "ProductId"]
+__all__ = ["CustomerId", "OrderId", "ProductId", "uuid7"]
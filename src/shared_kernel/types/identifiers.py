@@ -1,12 +1,30 @@
 """Strongly typed identifiers."""
 
+import os
+import time
 from dataclasses import dataclass
 from uuid import UUID
 
 from ..base.value_object import ValueObject
 
+_UUID7_VERSION_BITS = 0x7 << 76
+_UUID7_VARIANT_BITS = 0x2 << 62
+_UUID7_RANDOM_MASK = ~((0xF << 76) | (0x3 << 62))
 
-@dataclass(frozen=True)
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits hold the Unix timestamp in milliseconds, so new
+    identifiers sort after older ones and primary key inserts land on the
+    rightmost B-tree page instead of random ones.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10))
+    return UUID(int=value & _UUID7_RANDOM_MASK | _UUID7_VERSION_BITS | _UUID7_VARIANT_BITS)
+
+
+@dataclass(frozen=True, slots=True)
 class CustomerId(ValueObject):
     """Strongly typed customer identifier."""
 
@@ -21,7 +39,7 @@ class CustomerId(ValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderId(ValueObject):
     """Strongly typed order identifier."""
 
@@ -36,7 +54,7 @@ class OrderId(ValueObject):
         return str(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProductId(ValueObject):
     """Strongly typed product identifier."""
 
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from ..base.value_object import ValueObject
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Address(ValueObject):
     """Physical address value object."""
 
@@ -5,8 +5,11 @@ from dataclasses import dataclass
 
 from ..base.value_object import ValueObject
 
+# Basic email validation regex
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Email(ValueObject):
     """Email address value object with validation."""
 
@@ -17,9 +20,7 @@ class Email(ValueObject):
         if not self.value:
             raise ValueError("Email cannot be empty")
 
-        # Basic email validation regex
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(email_pattern, self.value):
+        if not _EMAIL_RE.match(self.value):
             raise ValueError(f"Invalid email format: {self.value}")
 
     @property
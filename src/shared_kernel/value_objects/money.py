@@ -6,7 +6,7 @@ from decimal import Decimal
 from ..base.value_object import ValueObject
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Money(ValueObject):
     """Money value object with currency and amount."""
 
@@ -1,17 +1,26 @@
 """Phone number value object."""
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ..base.value_object import ValueObject
 
+_NON_DIGIT = re.compile(r"\D")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PhoneNumber(ValueObject):
     """Phone number value object with validation."""
 
     value: str
     country_code: str = "+1"  # Default to US
+    _digits: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self) -> None:
+        # Strip non-digits once; the value is immutable so the result never changes
+        object.__setattr__(self, "_digits", _NON_DIGIT.sub("", self.value))
+        # Zero-argument super() does not work in a slots=True dataclass
+        ValueObject.__post_init__(self)
 
     def validate(self) -> None:
         """Validate phone number format."""
@@ -21,8 +30,7 @@ class PhoneNumber(ValueObject):
         if not self.country_code:
             raise ValueError("Country code cannot be empty")
 
-        # Remove all non-digit characters for validation
-        digits_only = re.sub(r"\D", "", self.value)
+        digits_only = self._digits
 
         if len(digits_only) < 10:
             raise ValueError("Phone number must have at least 10 digits")
@@ -34,14 +42,14 @@ class PhoneNumber(ValueObject):
         if not self.country_code.startswith("+"):
             raise ValueError("Country code must start with +")
 
-        country_digits = re.sub(r"\D", "", self.country_code)
+        country_digits = _NON_DIGIT.sub("", self.country_code)
         if not country_digits:
             raise ValueError("Country code must contain digits")
 
     @property
     def formatted(self) -> str:
         """Get formatted phone number."""
-        digits_only = re.sub(r"\D", "", self.value)
+        digits_only = self._digits
 
         if len(digits_only) == 10 and self.country_code == "+1":
             # US format: (xxx) xxx-xxxx
@@ -52,7 +60,7 @@ class PhoneNumber(ValueObject):
     @property
     def digits_only(self) -> str:
         """Get only the digits from the phone number."""
-        return re.sub(r"\D", "", self.value)
+        return self._digits
 
     def __str__(self) -> str:
         return self.formatted
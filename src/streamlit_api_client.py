@@ -67,11 +67,13 @@ class APIClient:
         email_contains: str | None = None,
         is_active: bool | None = None,
         limit: int = 50,
-        offset: int = 0,
-    ) -> list[dict[str, Any]] | None:
-        """Search customers with filters."""
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None] | None:
+        """Search customers with filters; returns the page and the cursor for the next one, if any."""
         try:
-            params: dict[str, Any] = {"limit": limit, "offset": offset}
+            params: dict[str, Any] = {"limit": limit}
+            if cursor:
+                params["cursor"] = cursor
             if name_contains:
                 params["name_contains"] = name_contains
             if email_contains:
@@ -81,7 +83,7 @@ class APIClient:
 
             response = self.session.get(f"{self.base_url}/api/v1/customers/search", params=params)
             response.raise_for_status()
-            return response.json()
+            return response.json(), response.headers.get("X-Next-Cursor")
         except requests.RequestException as e:
             st.error(f"Failed to search customers: {str(e)}")
             return None
@@ -208,15 +208,17 @@ with tab3:
             elif status_filter == "Inactive Only":
                 is_active = False
 
-            results = api.search_customers(
+            page = api.search_customers(
                 name_contains=name_search if name_search else None,
                 email_contains=email_search if email_search else None,
                 is_active=is_active,
                 limit=max_results,
             )
+            results, next_cursor = page if page else ([], None)
 
             if results:
-                st.success(f"Found {len(results)} customer(s)")
+                more = " (more available)" if next_cursor else ""
+                st.success(f"Found {len(results)} customer(s){more}")
                 st.session_state.search_results = results
             else:
                 st.info("No customers match your search criteria")
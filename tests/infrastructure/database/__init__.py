@@ -0,0 +1 @@
+"""Tests for database infrastructure components."""
@@ -0,0 +1,225 @@
+"""Tests for the PostgreSQL customer repository's session read cache and bulk saves."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from asyncpg.exceptions import UniqueViolationError
+from sqlalchemy.exc import IntegrityError
+
+from src.domain.entities.customer import Customer
+from src.infrastructure.database.models import CustomerModel
+from src.infrastructure.database.repositories.customer_repository_impl import (
+    _COPY_THRESHOLD,
+    PostgresCustomerRepository,
+)
+from src.shared_kernel import CustomerId, Email, ResourceAlreadyExistsError
+
+
+def _model(row: tuple | None) -> CustomerModel | None:
+    if row is None:
+        return None
+    keys = ("id", "name", "email", "is_active", "preferences", "created_at", "updated_at")
+    return CustomerModel(**dict(zip(keys, row, strict=True)))
+
+
+def _session_returning(row: tuple | None) -> AsyncMock:
+    result = MagicMock()
+    result.one_or_none.return_value = row
+    session = AsyncMock()
+    session.add = MagicMock()
+    session.execute.return_value = result
+    session.get.return_value = _model(row)
+    return session
+
+
+def _integrity_error(constraint_name: str) -> IntegrityError:
+    """Build the error SQLAlchemy raises for a constraint violation reported by asyncpg."""
+    violation = UniqueViolationError("duplicate key value violates unique constraint")
+    violation.constraint_name = constraint_name
+    adapted = Exception("IntegrityError")
+    adapted.__cause__ = violation
+    return IntegrityError("INSERT INTO customers ...", {}, adapted)
+
+
+def _row(customer_id, email: str = "john@example.com") -> tuple:
+    now = datetime.now(UTC)
+    return (customer_id, "John Doe", email, True, {}, now, now)
+
+
+@pytest.mark.asyncio
+class TestPostgresCustomerRepositoryCache:
+    async def test_find_by_id_hits_database_once(self):
+        """Test that repeated lookups within a session reuse the first result"""
+        customer_id = uuid4()
+        session = _session_returning(_row(customer_id))
+        repo = PostgresCustomerRepository(session)
+
+        first = await repo.find_by_id(customer_id)
+        second = await repo.find_by_id(customer_id)
+
+        assert first is second
+        session.get.assert_awaited_once()
+
+    async def test_find_by_id_uses_primary_key_get(self):
+        """Test that a cache miss is served by a primary-key get rather than a SELECT statement"""
+        customer_id = uuid4()
+        session = _session_returning(_row(customer_id))
+        repo = PostgresCustomerRepository(session)
+
+        customer = await repo.find_by_id(customer_id)
+
+        assert customer.id == customer_id
+        assert customer.email == Email("john@example.com")
+        session.get.assert_awaited_once_with(CustomerModel, customer_id)
+        session.execute.assert_not_awaited()
+
+    async def test_find_by_email_uses_cached_customer(self):
+        """Test that an email lookup is served from customers already loaded by id"""
+        customer_id = uuid4()
+        session = _session_returning(_row(customer_id))
+        repo = PostgresCustomerRepository(session)
+
+        by_id = await repo.find_by_id(customer_id)
+        by_email = await repo.find_by_email("john@example.com")
+
+        assert by_email is by_id
+        session.get.assert_awaited_once()
+        session.execute.assert_not_awaited()
+
+    async def test_missing_customer_is_not_cached(self):
+        """Test that misses always go back to the database"""
+        session = _session_returning(None)
+        repo = PostgresCustomerRepository(session)
+        customer_id = uuid4()
+
+        assert await repo.find_by_id(customer_id) is None
+        assert await repo.find_by_id(customer_id) is None
+        assert session.get.await_count == 2
+
+    async def test_save_replaces_cached_customer(self):
+        """Test that saving a customer refreshes the cached entry"""
+        customer_id = uuid4()
+        session = _session_returning(_row(customer_id))
+        repo = PostgresCustomerRepository(session)
+        await repo.find_by_id(customer_id)
+
+        updated = Customer.create(customer_id=CustomerId(customer_id), name="Johnny", email=Email("john@example.com"))
+        await repo.save(updated)
+
+        assert await repo.find_by_id(customer_id) is updated
+        assert await repo.find_by_email("john@example.com") is updated
+        session.get.assert_awaited_once()
+        session.execute.assert_not_awaited()
+
+    async def test_email_conflict_is_reported_as_duplicate(self):
+        """Test that a violation of the unique email constraint becomes ResourceAlreadyExistsError"""
+        session = _session_returning(None)
+        session.commit.side_effect = _integrity_error("customers_email_key")
+        repo = PostgresCustomerRepository(session)
+        customer = Customer.create(customer_id=CustomerId(uuid4()), name="John Doe", email=Email("john@example.com"))
+
+        with pytest.raises(ResourceAlreadyExistsError):
+            await repo.save(customer)
+        session.rollback.assert_awaited_once()
+
+    async def test_other_constraint_violation_is_reraised(self):
+        """Test that a primary key clash is not mistaken for a duplicate email"""
+        session = _session_returning(None)
+        session.commit.side_effect = _integrity_error("customers_pkey")
+        repo = PostgresCustomerRepository(session)
+        customer = Customer.create(customer_id=CustomerId(uuid4()), name="John Doe", email=Email("john@example.com"))
+
+        with pytest.raises(IntegrityError):
+            await repo.save(customer)
+        session.rollback.assert_awaited_once()
+
+    async def test_rows_share_email_value_object(self):
+        """Test that rows with the same email reuse one validated Email instance"""
+        first_id, second_id = uuid4(), uuid4()
+        session = _session_returning(_row(first_id))
+        repo = PostgresCustomerRepository(session)
+        first = await repo.find_by_id(first_id)
+
+        session.get.return_value = _model(_row(second_id))
+        second = await repo.find_by_id(second_id)
+
+        assert first is not second
+        assert first.email is second.email
+
+
+def _customers(count: int) -> list[Customer]:
+    return [
+        Customer.create(customer_id=CustomerId(uuid4()), name=f"Customer {i}", email=Email(f"c{i}@example.com"))
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+class TestPostgresCustomerRepositorySaveMany:
+    async def test_small_batch_uses_single_insert(self):
+        """Test that a small batch is written with one executemany INSERT"""
+        session = _session_returning(None)
+        repo = PostgresCustomerRepository(session)
+
+        await repo.save_many(_customers(3))
+
+        session.execute.assert_awaited_once()
+        params = session.execute.await_args.args[1]
+        assert [row["email"] for row in params] == ["c0@example.com", "c1@example.com", "c2@example.com"]
+        session.commit.assert_awaited_once()
+
+    async def test_large_batch_uses_copy(self):
+        """Test that a large batch is streamed with COPY and JSON pre-serialized"""
+        session = _session_returning(None)
+        driver_connection = AsyncMock()
+        raw_connection = MagicMock(driver_connection=driver_connection)
+        connection = AsyncMock()
+        connection.get_raw_connection.return_value = raw_connection
+        session.connection.return_value = connection
+        repo = PostgresCustomerRepository(session)
+
+        await repo.save_many(_customers(_COPY_THRESHOLD))
+
+        session.execute.assert_not_awaited()
+        kwargs = driver_connection.copy_records_to_table.await_args.kwargs
+        assert kwargs["columns"][:3] == ["id", "name", "email"]
+        assert len(kwargs["records"]) == _COPY_THRESHOLD
+        assert kwargs["records"][0][4] == "{}"
+        session.commit.assert_awaited_once()
+
+    async def test_empty_batch_skips_database(self):
+        """Test that saving no customers does not touch the session"""
+        session = _session_returning(None)
+        repo = PostgresCustomerRepository(session)
+
+        assert await repo.save_many([]) == []
+        session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+class TestPostgresCustomerRepositorySearch:
+    async def test_look_ahead_row_sets_next_cursor(self):
+        """Test that the extra fetched row is dropped and becomes the next-page signal"""
+        rows = [_row(uuid4(), f"c{i}@example.com") for i in range(3)]
+        session = _session_returning(None)
+        session.execute.return_value = rows
+        repo = PostgresCustomerRepository(session)
+
+        customers, next_cursor = await repo.search(limit=2)
+
+        assert [customer.id for customer in customers] == [rows[0][0], rows[1][0]]
+        assert next_cursor == (customers[-1].created_at, customers[-1].id)
+
+    async def test_last_page_has_no_cursor(self):
+        """Test that a short page returns every row and no cursor"""
+        rows = [_row(uuid4(), f"c{i}@example.com") for i in range(2)]
+        session = _session_returning(None)
+        session.execute.return_value = rows
+        repo = PostgresCustomerRepository(session)
+
+        customers, next_cursor = await repo.search(limit=2)
+
+        assert len(customers) == 2
+        assert next_cursor is None
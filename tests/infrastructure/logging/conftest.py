@@ -0,0 +1,15 @@
+"""Shared fixtures for logging infrastructure tests."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from src.infrastructure.logging.config import reset_log_config_cache
+
+
+@pytest.fixture(autouse=True)
+def _reset_log_config_cache() -> Iterator[None]:  # pyright: ignore[reportUnusedFunction]
+    """Ensure each test starts with a fresh environment detection."""
+    reset_log_config_cache()
+    yield
+    reset_log_config_cache()
@@ -1,6 +1,8 @@
 """Tests for logging configuration module."""
 
+import logging
 import os
+from dataclasses import FrozenInstanceError
 from typing import Any
 from unittest.mock import patch
 
@@ -11,8 +13,11 @@ from src.infrastructure.logging.config import (
     LogConfig,
     LogFormat,
     LogLevel,
+    _parse_bool,
     get_log_config,
+    reset_log_config_cache,
 )
+from src.infrastructure.logging.logger import configure_logging
 
 
 class TestLogConfig:
@@ -84,6 +89,44 @@ class TestLogConfig:
         with pytest.raises(ValueError):
             LogConfig(sampling_rate=1.1)
 
+    def test_enum_fields_stored_as_values(self):
+        """Test that enum members and raw strings are both stored as plain values."""
+        config = LogConfig(level=LogLevel.DEBUG, format="text", environment=Environment.PRODUCTION)
+
+        assert config.level == "DEBUG"
+        assert type(config.level) is str
+        assert config.format == "text"
+        assert config.environment == "production"
+
+        with pytest.raises(ValueError):
+            LogConfig(level="LOUD")
+
+    def test_configuration_is_immutable(self):
+        """Test that a resolved configuration cannot be modified."""
+        config = LogConfig()
+
+        with pytest.raises(FrozenInstanceError):
+            config.level = "DEBUG"  # type: ignore[misc]
+
+
+class TestParseBool:
+    """Test boolean parsing of environment variable values."""
+
+    @pytest.mark.parametrize("value", ["true", "TRUE", " yes ", "1", "on", "Enabled"])
+    def test_truthy_values(self, value: str):
+        """Test that truthy spellings parse as True regardless of case and padding."""
+        assert _parse_bool(value) is True
+
+    @pytest.mark.parametrize("value", ["false", "0", "no", "off", "", "maybe"])
+    def test_other_values_are_false(self, value: str):
+        """Test that anything outside the truthy set parses as False."""
+        assert _parse_bool(value, default=True) is False
+
+    def test_missing_value_uses_default(self):
+        """Test that an unset variable falls back to the default."""
+        assert _parse_bool(None) is False
+        assert _parse_bool(None, default=True) is True
+
 
 class TestGetLogConfig:
     """Test get_log_config function with environment variables."""
@@ -157,6 +200,7 @@ class TestGetLogConfig:
             assert config.format == LogFormat.CLOUDWATCH
             assert config.cloudwatch_enabled is False  # Lambda logs automatically
             assert config.include_process_info is False
+            assert config.async_logging is False  # Process may freeze before a listener drains
 
     def test_ecs_environment_detection(self):
         """Test automatic ECS environment detection."""
@@ -170,6 +214,14 @@ class TestGetLogConfig:
 
             assert config.cloudwatch_enabled is True
             assert config.format == LogFormat.JSON
+            assert config.async_logging is True
+
+    def test_empty_aws_indicator_is_local(self):
+        """Test that an empty AWS indicator does not count as running in AWS."""
+        with patch.dict(os.environ, {"AWS_REGION": ""}, clear=True):
+            config = get_log_config()
+
+            assert config.environment == Environment.LOCAL
 
     @patch("src.infrastructure.logging.config._is_running_locally")
     def test_boolean_environment_parsing(self, mock_is_local: Any) -> None:
@@ -180,6 +232,7 @@ class TestGetLogConfig:
         # Test various truthy values
         truthy_values = ["true", "True", "TRUE", "1", "yes", "Yes"]
         for value in truthy_values:
+            reset_log_config_cache()
             with patch.dict(os.environ, {"CLOUDWATCH_ENABLED": value}, clear=True):
                 config = get_log_config()
                 assert config.cloudwatch_enabled is True, f"Failed for value: {value}"
@@ -187,6 +240,7 @@ class TestGetLogConfig:
         # Test various falsy values
         falsy_values = ["false", "False", "FALSE", "0", "no", "No", ""]
         for value in falsy_values:
+            reset_log_config_cache()
             with patch.dict(os.environ, {"CLOUDWATCH_ENABLED": value}, clear=True):
                 config = get_log_config()
                 assert config.cloudwatch_enabled is False, f"Failed for value: {value}"
@@ -219,18 +273,56 @@ class TestGetLogConfig:
         ):
             get_log_config()
 
+        reset_log_config_cache()
         with (
             patch.dict(os.environ, {"LOG_FORMAT": "invalid"}, clear=True),
             pytest.raises(ValueError, match="'invalid' is not a valid LogFormat"),
         ):
             get_log_config()
 
+        reset_log_config_cache()
         with (
             patch.dict(os.environ, {"ENVIRONMENT": "invalid"}, clear=True),
             pytest.raises(ValueError, match="'invalid' is not a valid Environment"),
         ):
             get_log_config()
 
+    def test_config_is_cached(self):
+        """Test that configuration is built once and reused."""
+        with patch.dict(os.environ, {"LOG_LEVEL": "WARNING"}, clear=True):
+            first = get_log_config()
+
+        with patch.dict(os.environ, {"LOG_LEVEL": "ERROR"}, clear=True):
+            second = get_log_config()
+
+        assert second is first
+        assert second.level == LogLevel.WARNING
+
+    def test_reset_log_config_cache(self):
+        """Test that resetting the cache forces re-detection."""
+        with patch.dict(os.environ, {"LOG_LEVEL": "WARNING"}, clear=True):
+            first = get_log_config()
+
+        reset_log_config_cache()
+
+        with patch.dict(os.environ, {"LOG_LEVEL": "ERROR"}, clear=True):
+            second = get_log_config()
+
+        assert second is not first
+        assert second.level == LogLevel.ERROR
+
+    def test_detection_logged_by_configure_logging(self):
+        """Test that environment detection is logged once handlers exist, not while loading the config."""
+        detection_logger = logging.getLogger("infrastructure.logging")
+        with patch.dict(os.environ, {}, clear=True), patch.object(detection_logger, "info") as mock_info:
+            get_log_config()
+            mock_info.assert_not_called()
+
+            configure_logging()
+
+        mock_info.assert_called_once()
+        assert mock_info.call_args.args[0].startswith("Local environment detected")
+
 
 class TestLogConfigIntegration:
     """Integration tests for log configuration."""
@@ -1,7 +1,10 @@
 """Tests for correlation ID management."""
 
+import io
+import json
+import logging
 from typing import Any
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock
 
 import pytest
 from starlette.applications import Starlette
@@ -10,10 +13,20 @@ from starlette.responses import Response
 
 from src.infrastructure.logging.correlation import (
     CorrelationContext,
+    CorrelationFilter,
     CorrelationMiddleware,
+    LambdaContextFilter,
     correlation_id_var,
     get_correlation_id,
+    lambda_request_id_var,
 )
+from src.infrastructure.logging.formatters import CloudWatchFormatter
+
+
+def _request(headers: dict[str, str]) -> Request:
+    """Build a real Starlette request carrying the given headers."""
+    raw = [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()]
+    return Request({"type": "http", "headers": raw})
 
 
 class TestCorrelationContext:
@@ -38,14 +51,14 @@ class TestCorrelationContext:
 
         # Should generate unique IDs
         assert id1 != id2
-        assert len(id1) == 36  # UUID format
-        assert len(id2) == 36
+        assert len(id1) == 32  # 128-bit hex
+        assert len(id2) == 32
+        int(id1, 16)  # Valid hex
 
     def test_extract_from_request_standard_headers(self):
         """Test extracting correlation ID from standard headers."""
-        # Mock request with X-Correlation-ID header
-        request = Mock(spec=Request)
-        request.headers = {"X-Correlation-ID": "test-id-1"}
+        # Request with X-Correlation-ID header
+        request = _request({"X-Correlation-ID": "test-id-1"})
 
         correlation_id = CorrelationContext.extract_from_request(request)
         assert correlation_id == "test-id-1"
@@ -53,33 +66,32 @@ class TestCorrelationContext:
     def test_extract_from_request_multiple_headers(self):
         """Test extraction priority from multiple header types."""
         # Test X-Request-ID when X-Correlation-ID is not present
-        request = Mock(spec=Request)
-        request.headers = {"X-Request-ID": "test-id-2"}
+        request = _request({"X-Request-ID": "test-id-2"})
 
         correlation_id = CorrelationContext.extract_from_request(request)
         assert correlation_id == "test-id-2"
 
         # Test that X-Correlation-ID takes priority
-        request.headers = {
-            "X-Correlation-ID": "primary-id",
-            "X-Request-ID": "secondary-id",
-        }
+        request = _request(
+            {
+                "X-Correlation-ID": "primary-id",
+                "X-Request-ID": "secondary-id",
+            }
+        )
 
         correlation_id = CorrelationContext.extract_from_request(request)
         assert correlation_id == "primary-id"
 
     def test_extract_from_request_aws_headers(self):
         """Test extracting from AWS-specific headers."""
-        request = Mock(spec=Request)
-        request.headers = {"X-Amzn-Trace-Id": "aws-trace-id"}
+        request = _request({"X-Amzn-Trace-Id": "aws-trace-id"})
 
         correlation_id = CorrelationContext.extract_from_request(request)
         assert correlation_id == "aws-trace-id"
 
     def test_extract_from_request_no_headers(self):
         """Test extraction when no relevant headers are present."""
-        request = Mock(spec=Request)
-        request.headers = {"User-Agent": "test", "Content-Type": "application/json"}
+        request = _request({"User-Agent": "test", "Content-Type": "application/json"})
 
         correlation_id = CorrelationContext.extract_from_request(request)
         assert correlation_id is None
@@ -94,6 +106,81 @@ class TestCorrelationContext:
         assert response.headers["X-Correlation-ID"] == test_id
 
 
+class TestCorrelationFilter:
+    """Test CorrelationFilter functionality."""
+
+    def _record(self) -> logging.LogRecord:
+        return logging.LogRecord(
+            name="test", level=logging.INFO, pathname="/test.py", lineno=1, msg="msg", args=(), exc_info=None
+        )
+
+    def test_stamps_current_correlation_id(self):
+        """Test that the filter copies the context correlation ID onto the record."""
+        record = self._record()
+        token = correlation_id_var.set("filter-123")
+        try:
+            assert CorrelationFilter().filter(record) is True
+        finally:
+            correlation_id_var.reset(token)
+
+        assert record.correlation_id == "filter-123"
+
+    def test_keeps_existing_stamp(self):
+        """Test that a record stamped by an earlier handler is not read again."""
+        record = self._record()
+        record.correlation_id = "first-handler"
+
+        token = correlation_id_var.set("other")
+        try:
+            CorrelationFilter().filter(record)
+        finally:
+            correlation_id_var.reset(token)
+
+        assert record.correlation_id == "first-handler"
+
+
+class TestLambdaContextFilter:
+    """Test LambdaContextFilter functionality."""
+
+    def _record(self) -> logging.LogRecord:
+        return logging.LogRecord(
+            name="test", level=logging.INFO, pathname="/test.py", lineno=1, msg="msg", args=(), exc_info=None
+        )
+
+    def test_stamps_current_request_id(self):
+        """Test that the filter copies the invocation's request ID onto the record."""
+        record = self._record()
+        token = lambda_request_id_var.set("req-123")
+        try:
+            assert LambdaContextFilter().filter(record) is True
+        finally:
+            lambda_request_id_var.reset(token)
+
+        assert record.aws_request_id == "req-123"
+
+    def test_stamps_empty_id_outside_invocation(self):
+        """Test that the attribute is always present so formatters need not probe for it."""
+        record = self._record()
+        LambdaContextFilter().filter(record)
+        assert record.aws_request_id == ""
+
+    def test_keeps_explicit_request_id(self):
+        """Test that an aws_request_id passed in extra is not overwritten by the context variable."""
+        stream = io.StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(CloudWatchFormatter())
+        handler.addFilter(LambdaContextFilter())
+        logger = logging.getLogger("test.lambda_context_filter")
+        logger.addHandler(handler)
+        logger.propagate = False
+        try:
+            logger.warning("completed", extra={"aws_request_id": "req-123"})
+        finally:
+            logger.removeHandler(handler)
+
+        assert json.loads(stream.getvalue())["@requestId"] == "req-123"
+
+
 class TestCorrelationMiddleware:
     """Test CorrelationMiddleware functionality."""
 
@@ -125,7 +212,7 @@ class TestCorrelationMiddleware:
         response = client.get("/test")
 
         assert response.status_code == 200
-        assert len(response.text) == 36  # UUID format
+        assert len(response.text) == 32  # 128-bit hex
         assert "X-Correlation-ID" in response.headers
         assert response.headers["X-Correlation-ID"] == response.text
 
@@ -145,21 +232,18 @@ class TestCorrelationMiddleware:
     @pytest.mark.asyncio
     async def test_middleware_sets_request_state(self):
         """Test that middleware sets correlation ID in request state."""
-        # Create mock request and call_next
-        request = Mock(spec=Request)
-        request.headers = {}
-        request.state = Mock()
+        seen_state: dict[str, Any] = {}
 
-        call_next = AsyncMock()
-        call_next.return_value = Response()
+        async def inner_app(scope: Any, receive: Any, send: Any) -> None:
+            seen_state["correlation_id"] = Request(scope).state.correlation_id
+            await Response()(scope, receive, send)
 
-        middleware = CorrelationMiddleware(Mock())
+        middleware = CorrelationMiddleware(inner_app)
 
-        await middleware.dispatch(request, call_next)
+        await middleware({"type": "http", "headers": []}, AsyncMock(), AsyncMock())
 
         # Verify correlation ID was set in request state
-        assert hasattr(request.state, "correlation_id")
-        assert len(request.state.correlation_id) == 36  # UUID format
+        assert len(seen_state["correlation_id"]) == 32  # 128-bit hex
 
     @pytest.mark.asyncio
     async def test_middleware_context_isolation(self):
@@ -209,7 +293,7 @@ class TestGetCorrelationId:
 
         # Should generate and return new ID
         assert result is not None
-        assert len(result) == 36  # UUID format
+        assert len(result) == 32  # 128-bit hex
 
         # Should also set it in context
         assert CorrelationContext.get() == result
@@ -276,21 +360,25 @@ class TestCorrelationIntegration:
 
     def test_multiple_header_priority(self):
         """Test header priority order for correlation ID extraction."""
-        request = Mock(spec=Request)
-
         # Test all headers present - should use highest priority
-        request.headers = {
-            "X-Correlation-ID": "priority-1",
-            "X-Request-ID": "priority-2",
-            "X-Trace-ID": "priority-3",
-            "X-Amzn-Trace-Id": "priority-4",
+        headers = {
             "AWS-Request-ID": "priority-5",
+            "X-Amzn-Trace-Id": "priority-4",
+            "X-Trace-ID": "priority-3",
+            "X-Request-ID": "priority-2",
+            "X-Correlation-ID": "priority-1",
         }
 
-        correlation_id = CorrelationContext.extract_from_request(request)
+        correlation_id = CorrelationContext.extract_from_request(_request(headers))
         assert correlation_id == "priority-1"
 
         # Remove highest priority, should fall back
-        del request.headers["X-Correlation-ID"]
-        correlation_id = CorrelationContext.extract_from_request(request)
+        del headers["X-Correlation-ID"]
+        correlation_id = CorrelationContext.extract_from_request(_request(headers))
         assert correlation_id == "priority-2"
+
+    def test_empty_header_is_skipped(self):
+        """Test that an empty higher-priority header does not shadow a lower one."""
+        request = _request({"X-Correlation-ID": "", "X-Request-ID": "fallback-id"})
+
+        assert CorrelationContext.extract_from_request(request) == "fallback-id"
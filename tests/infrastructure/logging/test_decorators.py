@@ -0,0 +1,185 @@
+"""Tests for logging decorators."""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.logging.decorators import log_async_execution, log_execution, log_performance
+from src.infrastructure.logging.logger import get_logger
+
+
+def _set_level(name: str, level: int) -> logging.Logger:
+    """Set a decorated function's logger level (looking it up first configures it, as the first call would)."""
+    logger = get_logger(name)
+    logger.setLevel(level)
+    return logger
+
+
+class TestLogExecution:
+    """Test log_execution decorator."""
+
+    def test_logs_entry_and_completion(self):
+        """Test that entry and completion are logged at the configured level."""
+
+        @log_execution(logger_name="test.decorators.enabled")
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        logger = _set_level("test.decorators.enabled", logging.DEBUG)
+
+        with patch.object(logger, "log") as mock_log:
+            assert add(1, 2) == 3
+
+        levels = [call.args[0] for call in mock_log.call_args_list]
+        messages = [call.args[1] for call in mock_log.call_args_list]
+        assert levels == [logging.INFO, logging.INFO]
+        assert messages == ["Executing add", "Completed add"]
+        assert "execution_time_ms" in mock_log.call_args.kwargs["extra"]
+
+    def test_disabled_level_skips_logging(self):
+        """Test that nothing is built or logged when the level is filtered out."""
+
+        @log_execution(logger_name="test.decorators.disabled")
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        logger = _set_level("test.decorators.disabled", logging.WARNING)
+
+        with patch.object(logger, "log") as mock_log, patch("time.perf_counter_ns") as mock_clock:
+            assert add(1, 2) == 3
+
+        mock_log.assert_not_called()
+        mock_clock.assert_not_called()
+
+    def test_disabled_level_still_logs_errors(self):
+        """Test that failures are reported even when execution logging is filtered out."""
+
+        @log_execution(logger_name="test.decorators.disabled_error")
+        def fail() -> None:
+            raise RuntimeError("boom")
+
+        logger = _set_level("test.decorators.disabled_error", logging.WARNING)
+
+        with patch.object(logger, "error") as mock_error, pytest.raises(RuntimeError):
+            fail()
+
+        mock_error.assert_called_once()
+        assert mock_error.call_args.kwargs["extra"]["error"] == "boom"
+
+    def test_logger_resolved_on_first_call(self):
+        """Test that the logger is looked up when the function first runs, not when it is decorated."""
+        with patch("src.infrastructure.logging.decorators.get_logger") as mock_get_logger:
+
+            @log_execution(logger_name="test.decorators.deferred")
+            def noop() -> None:
+                return None
+
+            mock_get_logger.assert_not_called()
+            noop()
+            noop()
+
+        mock_get_logger.assert_called_once_with("test.decorators.deferred")
+
+    def test_unknown_level_rejected(self):
+        """Test that an unknown level name fails at decoration time."""
+        with pytest.raises(ValueError, match="Unknown log level"):
+            log_execution(log_level="LOUD")
+
+    def test_level_name_is_case_insensitive(self):
+        """Test that lowercase level names resolve to the same numeric level."""
+
+        @log_execution(logger_name="test.decorators.lowercase", log_level="warning")
+        def add(a, b):
+            return a + b
+
+        logger = _set_level("test.decorators.lowercase", logging.DEBUG)
+
+        with patch.object(logger, "log") as mock_log:
+            add(1, 2)
+
+        assert mock_log.call_args_list[0].args[0] == logging.WARNING
+
+
+class TestLogPerformance:
+    """Test log_performance decorator."""
+
+    def test_slow_call_is_logged(self):
+        """Test that calls over the threshold are logged."""
+
+        @log_performance(threshold_ms=0, logger_name="test.decorators.slow")
+        def work() -> str:
+            return "done"
+
+        logger = _set_level("test.decorators.slow", logging.DEBUG)
+
+        with patch.object(logger, "log") as mock_log:
+            assert work() == "done"
+
+        assert mock_log.call_args.args[0] == logging.WARNING
+        assert mock_log.call_args.kwargs["extra"]["function"] == "work"
+
+    def test_threshold_compared_in_nanoseconds(self):
+        """Test that only calls strictly over the threshold are logged, with millisecond timings."""
+
+        @log_performance(threshold_ms=10, logger_name="test.decorators.threshold")
+        def work() -> str:
+            return "done"
+
+        logger = _set_level("test.decorators.threshold", logging.DEBUG)
+
+        with patch.object(logger, "log") as mock_log, patch("time.perf_counter_ns", side_effect=[0, 10_000_000]):
+            work()
+        mock_log.assert_not_called()
+
+        with patch.object(logger, "log") as mock_log, patch("time.perf_counter_ns", side_effect=[0, 15_250_000]):
+            work()
+        assert mock_log.call_args.kwargs["extra"]["execution_time_ms"] == 15.25
+
+    def test_disabled_level_skips_timing(self):
+        """Test that no timing is taken when slow calls could not be logged."""
+
+        @log_performance(threshold_ms=0, logger_name="test.decorators.slow_disabled")
+        def work() -> str:
+            return "done"
+
+        _set_level("test.decorators.slow_disabled", logging.ERROR)
+
+        with patch("time.perf_counter_ns") as mock_clock:
+            assert work() == "done"
+
+        mock_clock.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestLogAsyncExecution:
+    """Test log_async_execution decorator."""
+
+    async def test_logs_entry_and_completion(self):
+        """Test that async entry and completion are logged."""
+
+        @log_async_execution(logger_name="test.decorators.async")
+        async def fetch() -> int:
+            return 42
+
+        logger = _set_level("test.decorators.async", logging.DEBUG)
+
+        with patch.object(logger, "log") as mock_log:
+            assert await fetch() == 42
+
+        messages = [call.args[1] for call in mock_log.call_args_list]
+        assert messages == ["Executing async fetch", "Completed async fetch"]
+
+    async def test_disabled_level_skips_logging(self):
+        """Test that the async fast path returns without logging."""
+
+        @log_async_execution(logger_name="test.decorators.async_disabled")
+        async def fetch() -> int:
+            return 42
+
+        logger = _set_level("test.decorators.async_disabled", logging.WARNING)
+
+        with patch.object(logger, "log") as mock_log:
+            assert await fetch() == 42
+
+        mock_log.assert_not_called()
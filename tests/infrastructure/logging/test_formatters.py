@@ -3,6 +3,8 @@
 import json
 import logging
 import sys
+import traceback
+from datetime import UTC, datetime
 from typing import Any
 from unittest.mock import patch
 
@@ -11,6 +13,9 @@ from src.infrastructure.logging.formatters import (
     CloudWatchFormatter,
     ConsoleFormatter,
     StructuredFormatter,
+    _format_traceback,
+    _iso_timestamp,
+    _local_timestamp,
 )
 
 
@@ -126,6 +131,63 @@ class TestStructuredFormatter:
         assert parsed["extra"]["duration_ms"] == 250.5
         assert parsed["extra"]["metadata"] == {"key": "value"}
 
+    def test_unserializable_extra_fields_are_stringified(self):
+        """Test that extras the JSON encoder cannot handle are logged via str()."""
+        formatter = StructuredFormatter()
+
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="/test.py",
+            lineno=1,
+            msg="Test with odd extras",
+            args=(),
+            exc_info=None,
+        )
+        record.payload = object()
+        record.counts = {1: "one"}
+
+        parsed = json.loads(formatter.format(record))
+
+        assert parsed["extra"]["payload"].startswith("<object object")
+        assert parsed["extra"]["counts"] == {"1": "one"}
+
+    def test_nested_unserializable_value_keeps_its_container(self):
+        """Test that only the value the encoder rejects is stringified, not the whole extra."""
+        formatter = StructuredFormatter()
+
+        record = logging.makeLogRecord({"msg": "Nested"})
+        record.request = {"path": "/items", "handler": object()}
+
+        parsed = json.loads(formatter.format(record))
+
+        assert parsed["extra"]["request"]["path"] == "/items"
+        assert parsed["extra"]["request"]["handler"].startswith("<object object")
+
+    def test_oversized_int_extra_is_logged(self):
+        """Test that an integer beyond 64 bits falls back to the json module instead of dropping the record."""
+        formatter = StructuredFormatter(include_hostname=False)
+
+        record = logging.makeLogRecord({"msg": "Big number"})
+        record.total = 2**70
+
+        parsed = json.loads(formatter.format(record))
+
+        assert parsed["message"] == "Big number"
+        assert parsed["extra"]["total"] == 2**70
+        assert parsed["service"] == "clean-py"
+
+    def test_tuple_dict_keys_are_stringified(self):
+        """Test that dict keys neither encoder accepts, such as tuples, are logged via str()."""
+        formatter = StructuredFormatter()
+
+        record = logging.makeLogRecord({"msg": "Tuple keys"})
+        record.grid = {(0, 1): "cell", "nested": {("a",): [1, 2]}}
+
+        parsed = json.loads(formatter.format(record))
+
+        assert parsed["extra"]["grid"] == {"(0, 1)": "cell", "nested": {"('a',)": [1, 2]}}
+
     def test_hostname_inclusion(self):
         """Test hostname inclusion when enabled."""
         formatter = StructuredFormatter(include_hostname=True)
@@ -183,6 +245,54 @@ class TestStructuredFormatter:
 
         assert "process" not in parsed
 
+    def test_static_fields_are_encoded_once(self):
+        """Test that the pre-encoded service fields are merged into a single valid object."""
+        formatter = StructuredFormatter(service_name='svc "quoted"', environment="test", include_hostname=False)
+
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="/test.py",
+            lineno=1,
+            msg="Static fields",
+            args=(),
+            exc_info=None,
+        )
+
+        formatted = formatter.format(record)
+        parsed = json.loads(formatted)
+
+        assert formatted.startswith('{"timestamp"')
+        assert formatted.count('"service"') == 1
+        assert parsed["service"] == 'svc "quoted"'
+        assert parsed["environment"] == "test"
+        assert "hostname" not in parsed
+
+    def test_stamped_correlation_id_is_used(self):
+        """Test that a correlation ID stamped on the record wins over the context lookup."""
+        formatter = StructuredFormatter()
+
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname="/test.py", lineno=1, msg="Stamped", args=(), exc_info=None
+        )
+        record.correlation_id = "stamped-123"
+
+        with patch.object(CorrelationContext, "get", return_value="context-456") as mock_get:
+            parsed = json.loads(formatter.format(record))
+
+        assert parsed["correlation_id"] == "stamped-123"
+        assert "extra" not in parsed
+        mock_get.assert_not_called()
+
+    def test_standard_record_attributes_are_not_extras(self):
+        """Test that every attribute the running Python puts on a record is treated as reserved."""
+        formatter = StructuredFormatter()
+
+        record = logging.makeLogRecord({"msg": "Plain"})
+        parsed = json.loads(formatter.format(record))
+
+        assert "extra" not in parsed
+
 
 class TestCloudWatchFormatter:
     """Test CloudWatchFormatter functionality."""
@@ -277,6 +387,19 @@ class TestCloudWatchFormatter:
 
         assert parsed["@requestId"] == "lambda-request-123"
 
+    def test_empty_request_id_omitted(self):
+        """Test that the empty ID stamped outside an invocation is not emitted."""
+        formatter = CloudWatchFormatter()
+
+        record = logging.LogRecord(
+            name="test", level=logging.INFO, pathname="/test.py", lineno=1, msg="No invocation", args=(), exc_info=None
+        )
+        record.aws_request_id = ""
+
+        parsed = json.loads(formatter.format(record))
+
+        assert "@requestId" not in parsed
+
     def test_custom_fields_handling(self):
         """Test handling of custom fields in CloudWatch format."""
         formatter = CloudWatchFormatter()
@@ -303,6 +426,33 @@ class TestCloudWatchFormatter:
         assert parsed["metric_duration"] == 150.5
         assert parsed["custom_operation"] == "process_payment"
 
+    def test_plain_record_escapes_strings(self):
+        """Test that the direct-assembly path emits valid JSON for awkward messages."""
+        formatter = CloudWatchFormatter(service_name="svc", environment="prod")
+
+        record = logging.LogRecord(
+            name="test.logger",
+            level=logging.INFO,
+            pathname="/test.py",
+            lineno=1,
+            msg='quote " backslash \\ newline \n café',
+            args=(),
+            exc_info=None,
+        )
+
+        with patch.object(CorrelationContext, "get", return_value='abc"123'):
+            parsed = json.loads(formatter.format(record))
+
+        assert parsed == {
+            "@timestamp": parsed["@timestamp"],
+            "@level": "INFO",
+            "@logger": "test.logger",
+            "@message": 'quote " backslash \\ newline \n café',
+            "@correlationId": 'abc"123',
+            "service": "svc",
+            "env": "prod",
+        }
+
 
 class TestConsoleFormatter:
     """Test ConsoleFormatter functionality."""
@@ -427,10 +577,9 @@ class TestConsoleFormatter:
 
     def test_color_codes_mapping(self):
         """Test that different log levels use appropriate colors."""
-        formatter = ConsoleFormatter(use_colors=True)
-
         # Mock isatty to return True for color support
         with patch("sys.stderr.isatty", return_value=True):
+            formatter = ConsoleFormatter(use_colors=True)
             levels_and_colors = [
                 (logging.DEBUG, "\033[36m"),  # Cyan
                 (logging.INFO, "\033[32m"),  # Green
@@ -447,3 +596,81 @@ class TestConsoleFormatter:
 
                 formatted = formatter.format(record)
                 assert expected_color in formatted, f"Color not found for level {level}"
+
+    def test_custom_level_is_uncolored(self):
+        """Test that level names without a color still get a padded label."""
+        with patch("sys.stderr.isatty", return_value=True):
+            formatter = ConsoleFormatter(use_colors=True)
+
+        record = logging.LogRecord(
+            name="test", level=25, pathname="/test.py", lineno=1, msg="Custom level", args=(), exc_info=None
+        )
+        record.levelname = "NOTICE"
+
+        formatted = formatter.format(record)
+
+        assert "| NOTICE   |" in formatted
+        assert "\033[" not in formatted
+
+
+class TestTracebackCache:
+    """Test that formatted tracebacks are shared between formatters."""
+
+    def test_traceback_formatted_once_across_formatters(self):
+        """Test that several formatters handling one exception walk the traceback once."""
+        try:
+            raise ValueError("shared failure")
+        except ValueError:
+            exc_info = sys.exc_info()
+
+        record = logging.LogRecord(
+            name="test", level=logging.ERROR, pathname="/test.py", lineno=1, msg="Boom", args=(), exc_info=exc_info
+        )
+
+        with patch(
+            "src.infrastructure.logging.formatters.traceback.format_exception", wraps=traceback.format_exception
+        ) as spy:
+            structured = json.loads(StructuredFormatter().format(record))
+            cloudwatch = json.loads(CloudWatchFormatter().format(record))
+            console = ConsoleFormatter(use_colors=False).format(record)
+
+        spy.assert_called_once()
+        assert "".join(structured["exception"]["traceback"]) == cloudwatch["@exception"]["stack"]
+        assert cloudwatch["@exception"]["stack"] in console
+
+    def test_reraised_exception_is_formatted_again(self):
+        """Test that a new traceback for the same exception is not served from the cache."""
+        error = ValueError("again")
+        try:
+            raise error
+        except ValueError:
+            first = _format_traceback(sys.exc_info())
+        try:
+            raise error
+        except ValueError:
+            second_info = sys.exc_info()
+
+        assert _format_traceback(second_info) is not first
+
+
+class TestTimestampFormatting:
+    """Test the cached timestamp helpers shared by the formatters."""
+
+    def test_iso_timestamp_matches_datetime(self):
+        """Test that the cached ISO timestamp matches datetime's own formatting."""
+        created = 1_700_000_000.250125
+
+        expected = datetime.fromtimestamp(created, tz=UTC).isoformat()
+        assert _iso_timestamp(created) == expected
+        # Second call within the same second is served from the cache
+        assert _iso_timestamp(created + 0.5) == expected.replace(".250125", ".750125")
+
+    def test_iso_timestamp_keeps_microseconds_on_whole_seconds(self):
+        """Test that whole seconds still carry a fractional part, unlike isoformat()."""
+        assert _iso_timestamp(1_700_000_001.0) == "2023-11-14T22:13:21.000000+00:00"
+
+    def test_local_timestamp_matches_strftime(self):
+        """Test that the console timestamp matches local strftime output."""
+        created = 1_700_000_000.9
+
+        assert _local_timestamp(created) == datetime.fromtimestamp(created).strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,234 @@
+"""Tests for log handlers."""
+
+import io
+import logging
+import sys
+from datetime import timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from src.infrastructure.logging.config import LogConfig
+from src.infrastructure.logging.handlers import (
+    BufferingHandler,
+    SamplingHandler,
+    get_cloudwatch_handler,
+    get_console_handler,
+    get_queue_handler,
+    retarget_queue_handler,
+    stop_queue_handler,
+)
+
+
+def _record(message: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord(
+        name="test", level=level, pathname="/test.py", lineno=1, msg=message, args=(), exc_info=None
+    )
+
+
+class TestBufferingHandler:
+    """Test BufferingHandler functionality."""
+
+    def test_records_are_held_until_buffer_is_full(self):
+        """Test that nothing reaches the wrapped handler before the buffer fills."""
+        target = MagicMock(spec=logging.Handler)
+        handler = BufferingHandler(target, buffer_size=3)
+
+        handler.handle(_record("one"))
+        handler.handle(_record("two"))
+        target.emit.assert_not_called()
+
+        handler.handle(_record("three"))
+        assert [call.args[0].msg for call in target.emit.call_args_list] == ["one", "two", "three"]
+        target.flush.assert_called_once()
+
+    def test_flush_level_triggers_immediate_flush(self):
+        """Test that a record at the flush level flushes the whole buffer."""
+        target = MagicMock(spec=logging.Handler)
+        handler = BufferingHandler(target, buffer_size=100)
+
+        handler.handle(_record("context"))
+        handler.handle(_record("failure", logging.ERROR))
+
+        assert target.emit.call_count == 2
+        assert len(handler.buffer) == 0
+
+    def test_batch_capable_handler_receives_one_batch(self):
+        """Test that a wrapped handler with emit_batch gets all records in one call."""
+        target = MagicMock(spec=logging.Handler)
+        target.emit_batch = MagicMock()
+        handler = BufferingHandler(target, buffer_size=2)
+
+        handler.handle(_record("one"))
+        handler.handle(_record("two"))
+
+        target.emit_batch.assert_called_once()
+        assert [record.msg for record in target.emit_batch.call_args.args[0]] == ["one", "two"]
+        target.emit.assert_not_called()
+
+    def test_stream_handler_batch_is_written_once(self):
+        """Test that a plain StreamHandler receives the batch as a single write."""
+        stream = MagicMock(wraps=io.StringIO())
+        handler = BufferingHandler(logging.StreamHandler(stream), buffer_size=2)
+
+        handler.handle(_record("one"))
+        handler.handle(_record("two"))
+
+        stream.write.assert_called_once_with("one\ntwo\n")
+
+    def test_close_flushes_remaining_records(self):
+        """Test that closing the handler drains the buffer."""
+        target = MagicMock(spec=logging.Handler)
+        handler = BufferingHandler(target, buffer_size=100)
+
+        handler.handle(_record("pending"))
+        handler.close()
+
+        target.emit.assert_called_once()
+
+
+class TestQueueHandler:
+    """Test get_queue_handler functionality."""
+
+    def test_records_reach_every_handler_unformatted(self):
+        """Test that listener-side handlers receive the record with arguments merged and exc_info intact."""
+        first, second = MagicMock(level=logging.NOTSET), MagicMock(level=logging.NOTSET)
+        handler = get_queue_handler([first, second])
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                name="test",
+                level=logging.ERROR,
+                pathname="/test.py",
+                lineno=1,
+                msg="failed %s",
+                args=("job",),
+                exc_info=sys.exc_info(),
+            )
+        handler.handle(record)
+        stop_queue_handler(handler)
+
+        for target in (first, second):
+            queued = target.handle.call_args.args[0]
+            assert queued.getMessage() == "failed job"
+            assert queued.exc_info[0] is ValueError
+        # The caller's record is left untouched
+        assert record.args == ("job",)
+
+    def test_console_handler_formats_on_listener(self):
+        """Test that a console handler behind the queue writes each record once the listener drains."""
+        stream = io.StringIO()
+        config = LogConfig(level="INFO", format="text", environment="local")
+
+        with patch("src.infrastructure.logging.handlers.sys.stdout", stream):
+            handler = get_queue_handler([get_console_handler(config)])
+        handler.handle(_record("queued message"))
+        stop_queue_handler(handler)
+
+        assert "queued message" in stream.getvalue()
+        assert stream.getvalue().count("\n") == 1
+
+    def test_retarget_swaps_handlers_and_restarts_listener(self):
+        """Test that a retargeted queue handler delivers to the new handlers, even after its listener stopped."""
+        old, new = MagicMock(level=logging.NOTSET), MagicMock(level=logging.NOTSET)
+        handler = get_queue_handler([old])
+        stop_queue_handler(handler)
+
+        retarget_queue_handler(handler, [new])
+        handler.handle(_record("retargeted"))
+        stop_queue_handler(handler)
+
+        old.handle.assert_not_called()
+        assert new.handle.call_args.args[0].getMessage() == "retargeted"
+
+
+class TestSamplingHandler:
+    """Test SamplingHandler functionality."""
+
+    def test_errors_always_emitted(self):
+        """Test that errors bypass sampling."""
+        target = MagicMock(spec=logging.Handler)
+        handler = SamplingHandler(target, sampling_rate=0.0)
+
+        handler.handle(_record("failure", logging.ERROR))
+        handler.handle(_record("noise"))
+
+        assert [call.args[0].msg for call in target.emit.call_args_list] == ["failure"]
+
+    def test_full_rate_skips_random_draw(self):
+        """Test that a sampling rate of 1.0 emits everything without drawing."""
+        target = MagicMock(spec=logging.Handler)
+        handler = SamplingHandler(target, sampling_rate=1.0)
+        handler._random = MagicMock()
+
+        handler.handle(_record("kept"))
+
+        target.emit.assert_called_once()
+        handler._random.assert_not_called()
+
+    def test_records_sampled_against_rate(self):
+        """Test that non-error records are kept when the draw is below the rate."""
+        target = MagicMock(spec=logging.Handler)
+        handler = SamplingHandler(target, sampling_rate=0.5)
+        handler._random = MagicMock(side_effect=[0.2, 0.7])
+
+        handler.handle(_record("kept"))
+        handler.handle(_record("dropped"))
+
+        assert [call.args[0].msg for call in target.emit.call_args_list] == ["kept"]
+
+
+class TestCloudWatchHandler:
+    """Test get_cloudwatch_handler credential probing."""
+
+    def _create(
+        self, client: MagicMock, watchtower: MagicMock | None = None, **config_overrides: Any
+    ) -> logging.Handler | None:
+        boto3 = MagicMock()
+        boto3.client.return_value = client
+        watchtower = watchtower or MagicMock()
+        watchtower.CloudWatchLogHandler.return_value = logging.NullHandler()
+        config = LogConfig(
+            environment="production",
+            cloudwatch_enabled=True,
+            cloudwatch_log_group="/app/logs",
+            **config_overrides,
+        )
+
+        with patch.dict(sys.modules, {"boto3": boto3, "watchtower": watchtower}):
+            return get_cloudwatch_handler(config)
+
+    def test_credentials_not_probed_by_default(self):
+        """Test that creating the handler makes no AWS call unless asked to."""
+        client = MagicMock()
+
+        assert self._create(client) is not None
+        client.describe_log_groups.assert_not_called()
+
+    def test_credentials_probed_when_enabled(self):
+        """Test that the opt-in probe runs before the handler is created."""
+        client = MagicMock()
+
+        assert self._create(client, verify_cloudwatch_credentials=True) is not None
+        client.describe_log_groups.assert_called_once_with(limit=1)
+
+    def test_failed_probe_falls_back(self):
+        """Test that a failing opt-in probe disables the CloudWatch handler."""
+        client = MagicMock()
+        client.describe_log_groups.side_effect = RuntimeError("no credentials")
+
+        assert self._create(client, verify_cloudwatch_credentials=True) is None
+
+    def test_watchtower_batches_in_background(self):
+        """Test that batch size and interval are passed as watchtower's queue settings."""
+        watchtower = MagicMock()
+
+        self._create(MagicMock(), watchtower, cloudwatch_log_stream="api")
+
+        options = watchtower.CloudWatchLogHandler.call_args.kwargs
+        assert options["log_group_name"] == "/app/logs"
+        assert options["log_stream_name"] == "api"
+        assert options["use_queues"] is True
+        assert options["max_batch_count"] == 100
+        assert options["send_interval"] == timedelta(seconds=10)
@@ -0,0 +1,192 @@
+"""Tests for Lambda event helpers."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.infrastructure.logging.correlation import lambda_request_id_var
+from src.infrastructure.logging.lambda_utils import (
+    _extract_correlation_id_from_event,
+    _get_event_source_info,
+    _response_size,
+    lambda_error_logger,
+    lambda_request_logger,
+    lambda_response_logger,
+)
+
+
+def _sqs_event(correlation_id: str | None = None) -> dict:
+    record: dict = {"eventSource": "aws:sqs", "eventSourceARN": "arn:aws:sqs:us-east-1:1:orders"}
+    if correlation_id:
+        record["messageAttributes"] = {"correlationId": {"stringValue": correlation_id}}
+    return {"Records": [record, dict(record)]}
+
+
+def _sns_event(correlation_id: str) -> dict:
+    return {
+        "Records": [
+            {
+                "EventSource": "aws:sns",
+                "Sns": {
+                    "TopicArn": "arn:aws:sns:us-east-1:1:events",
+                    "MessageAttributes": {"correlationId": {"Value": correlation_id}},
+                },
+            }
+        ]
+    }
+
+
+def _context(aws_request_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        aws_request_id=aws_request_id,
+        function_name="orders",
+        function_version="1",
+        memory_limit_in_mb=128,
+        log_group_name="/aws/lambda/orders",
+        log_stream_name="stream",
+        get_remaining_time_in_millis=lambda: 1000,
+    )
+
+
+class TestExtractCorrelationId:
+    """Test correlation ID extraction from Lambda events."""
+
+    def test_api_gateway_header(self):
+        """Test that a correlation header wins over the request context id."""
+        event = {"headers": {"X-Request-ID": "req-1"}, "requestContext": {"requestId": "ctx-1"}}
+
+        assert _extract_correlation_id_from_event(event) == "req-1"
+
+    def test_null_headers_fall_back_to_request_context(self):
+        """Test that API Gateway's null headers do not break extraction."""
+        event = {"headers": None, "requestContext": {"requestId": "ctx-1"}}
+
+        assert _extract_correlation_id_from_event(event) == "ctx-1"
+
+    def test_sqs_message_attribute(self):
+        """Test extraction from the first SQS record."""
+        assert _extract_correlation_id_from_event(_sqs_event("sqs-1")) == "sqs-1"
+        assert _extract_correlation_id_from_event(_sqs_event()) is None
+
+    def test_sns_message_attribute(self):
+        """Test extraction from the first SNS record."""
+        assert _extract_correlation_id_from_event(_sns_event("sns-1")) == "sns-1"
+
+    def test_eventbridge_detail(self):
+        """Test extraction from an EventBridge detail payload."""
+        event = {"source": "app", "detail-type": "OrderCreated", "detail": {"correlationId": "eb-1"}}
+
+        assert _extract_correlation_id_from_event(event) == "eb-1"
+
+    def test_unknown_event(self):
+        """Test that events without a known marker yield no correlation ID."""
+        assert _extract_correlation_id_from_event({"foo": "bar"}) is None
+
+
+class TestGetEventSourceInfo:
+    """Test event source detection."""
+
+    def test_sqs(self):
+        """Test SQS source details."""
+        info = _get_event_source_info(_sqs_event())
+
+        assert info == {"event_source": "sqs", "queue_url": "arn:aws:sqs:us-east-1:1:orders", "message_count": 2}
+
+    def test_sns(self):
+        """Test SNS source details."""
+        info = _get_event_source_info(_sns_event("sns-1"))
+
+        assert info == {"event_source": "sns", "topic_arn": "arn:aws:sns:us-east-1:1:events", "message_count": 1}
+
+    def test_s3(self):
+        """Test S3 source details."""
+        event = {
+            "Records": [
+                {
+                    "eventSource": "aws:s3",
+                    "eventName": "ObjectCreated:Put",
+                    "s3": {"bucket": {"name": "uploads"}, "object": {"key": "a.csv"}},
+                }
+            ]
+        }
+
+        info = _get_event_source_info(event)
+
+        assert info == {
+            "event_source": "s3",
+            "bucket_name": "uploads",
+            "object_key": "a.csv",
+            "event_name": "ObjectCreated:Put",
+        }
+
+    def test_api_gateway(self):
+        """Test API Gateway source details."""
+        event = {"httpMethod": "GET", "path": "/orders", "requestContext": {"requestId": "r", "stage": "prod"}}
+
+        info = _get_event_source_info(event)
+
+        assert info is not None
+        assert info["event_source"] == "api_gateway"
+        assert info["stage"] == "prod"
+
+    def test_eventbridge(self):
+        """Test EventBridge source details."""
+        event = {"source": "app", "detail-type": "OrderCreated", "account": "1", "region": "us-east-1"}
+
+        info = _get_event_source_info(event)
+
+        assert info is not None
+        assert info["event_source"] == "eventbridge"
+        assert info["detail_type"] == "OrderCreated"
+
+    def test_unknown_record_source(self):
+        """Test that records from an unhandled source produce no info."""
+        assert _get_event_source_info({"Records": [{"eventSource": "aws:kinesis"}]}) is None
+
+
+class TestResponseSize:
+    """Test Lambda response size estimation."""
+
+    def test_proxy_response_measures_body_only(self):
+        """Test that API Gateway proxy responses are sized by their body string."""
+        response = {"statusCode": 200, "headers": {"Content-Type": "application/json"}, "body": '{"id": "é"}'}
+
+        assert _response_size(response) == len('{"id": "é"}'.encode())
+
+    def test_plain_dict_is_encoded(self):
+        """Test that other dict responses are sized by their JSON encoding."""
+        assert _response_size({"ok": True}) == len(b'{"ok":true}')
+
+    def test_string_and_other_types(self):
+        """Test string responses are sized directly and other types are skipped."""
+        assert _response_size("héllo") == 6
+        assert _response_size(None) is None
+
+
+@patch("src.infrastructure.logging.lambda_utils.get_logger", return_value=MagicMock())
+class TestInvocationRequestId:
+    """Test that the Lambda request ID is scoped to one invocation."""
+
+    def test_response_ends_invocation(self, _get_logger: MagicMock):
+        """Test that the request ID is set for the invocation and cleared once the response is logged."""
+        lambda_request_logger({}, _context("req-1"))
+        assert lambda_request_id_var.get() == "req-1"
+
+        lambda_response_logger({"ok": True}, _context("req-1"))
+        assert lambda_request_id_var.get() == ""
+
+    def test_error_ends_invocation(self, _get_logger: MagicMock):
+        """Test that logging an error also clears the request ID, and a later response log is harmless."""
+        lambda_request_logger({}, _context("req-1"))
+        lambda_error_logger(RuntimeError("boom"), _context("req-1"))
+        lambda_response_logger({"ok": False}, _context("req-1"))
+
+        assert lambda_request_id_var.get() == ""
+
+    def test_next_invocation_replaces_unfinished_one(self, _get_logger: MagicMock):
+        """Test that an invocation that never logged its response does not leak past the next one."""
+        lambda_request_logger({}, _context("req-1"))
+        lambda_request_logger({}, _context("req-2"))
+        assert lambda_request_id_var.get() == "req-2"
+
+        lambda_response_logger({"ok": True}, _context("req-2"))
+        assert lambda_request_id_var.get() == ""
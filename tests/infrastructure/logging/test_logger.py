@@ -1,10 +1,12 @@
 """Tests for main logging configuration and factory functions."""
 
 import logging
+from logging.handlers import QueueHandler
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
-from src.infrastructure.logging.config import Environment, LogConfig, LogLevel
+from src.infrastructure.logging.config import Environment, LogConfig, LogLevel, reset_log_config_cache
+from src.infrastructure.logging.handlers import stop_queue_listeners
 from src.infrastructure.logging.logger import (
     _configure_third_party_loggers,  # pyright: ignore[reportPrivateUsage]
     configure_logging,
@@ -49,6 +51,35 @@ class TestGetLogger:
         # Should not have added more handlers
         assert len(logger2.handlers) == initial_handler_count
 
+    def test_default_logger_set_up_once(self):
+        """Test that repeated default-config lookups skip configuration after the first."""
+        with patch("src.infrastructure.logging.logger.get_log_config", return_value=LogConfig()) as mock_config:
+            first = get_logger("test.cached")
+            second = get_logger("test.cached")
+
+        assert first is second
+        mock_config.assert_called_once()
+
+    def test_default_logger_cache_cleared_by_configure_and_reset(self):
+        """Test that default-config loggers pick up a new level after reconfiguring or resetting the config."""
+        try:
+            with patch("src.infrastructure.logging.logger.get_log_config", return_value=LogConfig(level=LogLevel.INFO)):
+                logger = get_logger("test.cache.cleared")
+            configure_logging(LogConfig(level=LogLevel.DEBUG))
+            with patch(
+                "src.infrastructure.logging.logger.get_log_config", return_value=LogConfig(level=LogLevel.DEBUG)
+            ):
+                assert get_logger("test.cache.cleared").level == logging.DEBUG
+
+            reset_log_config_cache()
+            with patch(
+                "src.infrastructure.logging.logger.get_log_config", return_value=LogConfig(level=LogLevel.ERROR)
+            ):
+                assert get_logger("test.cache.cleared").level == logging.ERROR
+        finally:
+            logger.handlers.clear()
+            configure_logging(LogConfig())
+
     def test_logger_propagation_disabled(self):
         """Test that logger propagation is disabled."""
         logger = get_logger("test.propagation")
@@ -137,6 +168,43 @@ class TestConfigureLogging:
 
         mock_configure_third_party.assert_called_once_with(config)
 
+    def test_async_logging_routes_through_one_queue(self):
+        """Test that async logging installs a single queue handler shared by default loggers."""
+        root_logger = logging.getLogger()
+        try:
+            configure_logging(LogConfig(environment=Environment.PRODUCTION, async_logging=True))
+
+            assert len(root_logger.handlers) == 1
+            assert isinstance(root_logger.handlers[0], QueueHandler)
+
+            with patch("src.infrastructure.logging.logger.get_log_config", return_value=LogConfig()):
+                logger = get_logger("test.async.shared")
+            assert logger.handlers == root_logger.handlers
+        finally:
+            logging.getLogger("test.async.shared").handlers.clear()
+            configure_logging(LogConfig())
+
+        # Reconfiguring without async logging removes the queue
+        assert not any(isinstance(h, QueueHandler) for h in root_logger.handlers)
+
+    def test_reconfiguring_keeps_shared_queue_delivering(self):
+        """Test that a logger holding the shared queue handler still reaches the new handlers after reconfiguring."""
+        target = MagicMock(level=logging.NOTSET)
+        try:
+            configure_logging(LogConfig(environment=Environment.PRODUCTION, async_logging=True))
+            with patch("src.infrastructure.logging.logger.get_log_config", return_value=LogConfig()):
+                logger = get_logger("test.async.reconfigured")
+
+            with patch("src.infrastructure.logging.logger._build_handlers", return_value=[target]):
+                configure_logging(LogConfig(environment=Environment.PRODUCTION, async_logging=True))
+            logger.info("after reconfigure")
+            stop_queue_listeners()
+        finally:
+            logging.getLogger("test.async.reconfigured").handlers.clear()
+            configure_logging(LogConfig())
+
+        assert target.handle.call_args.args[0].getMessage() == "after reconfigure"
+
 
 class TestConfigureThirdPartyLoggers:
     """Test third-party logger configuration."""
@@ -0,0 +1,187 @@
+"""Tests for request/response logging middleware."""
+
+import logging
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response, StreamingResponse
+from starlette.testclient import TestClient
+
+from src.infrastructure.logging.config import LogConfig
+from src.infrastructure.logging.middleware import LoggingMiddleware
+
+
+def _app(**options: Any) -> Starlette:
+    """Build a Starlette app wrapped in LoggingMiddleware."""
+    app = Starlette()
+
+    @app.route("/items")  # pyright: ignore[reportUntypedFunctionDecorator]
+    async def items(_request: Request) -> Response:  # pyright: ignore[reportUnusedFunction]
+        return PlainTextResponse("ok", headers={"Set-Cookie": "session=secret"})
+
+    @app.route("/missing")  # pyright: ignore[reportUntypedFunctionDecorator]
+    async def missing(_request: Request) -> Response:  # pyright: ignore[reportUnusedFunction]
+        return PlainTextResponse("nope", status_code=404)
+
+    @app.route("/stream")  # pyright: ignore[reportUntypedFunctionDecorator]
+    async def stream(_request: Request) -> Response:  # pyright: ignore[reportUnusedFunction]
+        async def chunks():
+            yield b"a"
+            yield b"b"
+
+        return StreamingResponse(chunks())
+
+    @app.route("/echo", methods=["POST"])  # pyright: ignore[reportUntypedFunctionDecorator]
+    async def echo(request: Request) -> Response:  # pyright: ignore[reportUnusedFunction]
+        return PlainTextResponse(await request.body())
+
+    @app.route("/boom")  # pyright: ignore[reportUntypedFunctionDecorator]
+    async def boom(_request: Request) -> Response:  # pyright: ignore[reportUnusedFunction]
+        raise RuntimeError("boom")
+
+    app.add_middleware(LoggingMiddleware, **options)
+    return app
+
+
+class TestLoggingMiddleware:
+    """Test LoggingMiddleware functionality."""
+
+    @pytest.fixture
+    def logger(self) -> Iterator[MagicMock]:
+        """Replace the middleware's logger; the middleware is built on the first request."""
+        logger = MagicMock()
+        with patch("src.infrastructure.logging.middleware.get_logger", return_value=logger):
+            yield logger
+
+    def test_logs_request_and_response(self, logger: MagicMock):
+        """Test that a request is logged on arrival and on completion with its status."""
+        client = TestClient(_app())
+
+        response = client.get("/items?page=2", headers={"Authorization": "Bearer token"})
+
+        assert response.text == "ok"
+        started = logger.info.call_args
+        assert started.args[0] == "GET /items"
+        assert started.kwargs["extra"]["event_type"] == "request_started"
+        assert started.kwargs["extra"]["query_params"] == {"page": "2"}
+        assert started.kwargs["extra"]["headers"]["authorization"] == "[REDACTED]"
+
+        level, message = logger.log.call_args.args
+        completed = logger.log.call_args.kwargs["extra"]
+        assert (level, message) == (logging.INFO, "GET /items - 200")
+        assert completed["event_type"] == "request_completed"
+        assert completed["status_code"] == 200
+        assert isinstance(completed["duration_us"], int)
+        assert completed["response_size"] == "2"
+        assert completed["response_headers"]["set-cookie"] == "session=secret"
+
+    def test_request_context_read_from_scope(self, logger: MagicMock):
+        """Test that client IP, header fields and an empty query are taken from the raw scope."""
+        client = TestClient(_app())
+
+        client.get("/items", headers={"X-Forwarded-For": "203.0.113.7, 10.0.0.1", "User-Agent": "probe"})
+
+        started = logger.info.call_args.kwargs["extra"]
+        assert started["client_ip"] == "203.0.113.7"
+        assert started["user_agent"] == "probe"
+        assert started["query_params"] == {}
+
+    def test_client_error_logged_as_warning(self, logger: MagicMock):
+        """Test that 4xx responses are logged at WARNING level."""
+        TestClient(_app()).get("/missing")
+
+        assert logger.log.call_args.args[0] == logging.WARNING
+
+    def test_slow_request_logged_as_warning(self, logger: MagicMock):
+        """Test that a request slower than the configured threshold is logged at WARNING level."""
+        with patch(
+            "src.infrastructure.logging.middleware.get_log_config",
+            return_value=LogConfig(slow_request_threshold_ms=-1),
+        ):
+            TestClient(_app()).get("/items")
+
+        assert logger.log.call_args.args[0] == logging.WARNING
+
+    def test_error_body_captured_when_enabled(self, logger: MagicMock):
+        """Test that an error response body is logged while still reaching the client."""
+        response = TestClient(_app(log_response_body=True)).get("/missing")
+
+        assert response.text == "nope"
+        assert logger.log.call_args.kwargs["extra"]["response_body"] == "nope"
+
+    def test_captured_body_is_capped(self, logger: MagicMock):
+        """Test that only max_body_size bytes of the body are kept."""
+        TestClient(_app(log_response_body=True, max_body_size=2)).get("/missing")
+
+        assert logger.log.call_args.kwargs["extra"]["response_body"] == "no[TRUNCATED - 4 bytes]"
+
+    def test_success_body_never_captured(self, logger: MagicMock):
+        """Test that successful responses are not buffered even with body logging on."""
+        TestClient(_app(log_response_body=True)).get("/items")
+
+        assert "response_body" not in logger.log.call_args.kwargs["extra"]
+
+    def test_request_body_captured_when_enabled(self, logger: MagicMock):
+        """Test that a POST body is logged, capped at max_body_size, while the app still reads all of it."""
+        response = TestClient(_app(log_request_body=True, max_body_size=5)).post("/echo", content=b"hello world")
+
+        assert response.text == "hello world"
+        assert logger.log.call_args.kwargs["extra"]["request_body"] == "hello[TRUNCATED - 11 bytes]"
+
+    def test_request_body_not_captured_when_disabled(self, logger: MagicMock):
+        """Test that request bodies are left alone when neither the option nor the config enables them."""
+        with patch(
+            "src.infrastructure.logging.middleware.get_log_config",
+            return_value=LogConfig(log_request_body=False),
+        ):
+            TestClient(_app()).post("/echo", content=b"secret")
+
+        assert "request_body" not in logger.log.call_args.kwargs["extra"]
+
+    def test_streaming_response_passes_through(self, logger: MagicMock):
+        """Test that streamed bodies reach the client unchanged."""
+        response = TestClient(_app()).get("/stream")
+
+        assert response.content == b"ab"
+        assert logger.log.call_args.kwargs["extra"]["status_code"] == 200
+
+    def test_skipped_paths_are_not_logged(self, logger: MagicMock):
+        """Test that configured and health check paths bypass logging."""
+        client = TestClient(_app(skip_paths={"/items"}))
+
+        client.get("/items")
+        client.get("/healthz")
+
+        logger.info.assert_not_called()
+        logger.log.assert_not_called()
+
+    def test_skipped_path_prefixes_are_not_logged(self, logger: MagicMock):
+        """Test that every path under a skipped prefix bypasses logging."""
+        client = TestClient(_app(skip_path_prefixes=("/it", "/miss")))
+
+        client.get("/items")
+        client.get("/missing")
+
+        logger.info.assert_not_called()
+
+    def test_custom_sensitive_headers_are_case_insensitive(self, logger: MagicMock):
+        """Test that caller-supplied sensitive header names are matched regardless of case."""
+        client = TestClient(_app(sensitive_headers={"X-Tenant-Secret"}))
+
+        client.get("/items", headers={"X-Tenant-Secret": "s3cret"})
+
+        assert logger.info.call_args.kwargs["extra"]["headers"]["x-tenant-secret"] == "[REDACTED]"
+
+    def test_errors_are_logged_and_reraised(self, logger: MagicMock):
+        """Test that an exception from the app is logged and propagated."""
+        client = TestClient(_app(), raise_server_exceptions=False)
+
+        response = client.get("/boom")
+
+        assert response.status_code == 500
+        assert logger.error.call_args.kwargs["extra"]["event_type"] == "request_error"
+        assert logger.error.call_args.kwargs["extra"]["error"] == "boom"
@@ -0,0 +1,25 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.presentation import repositories
+from src.presentation.api.v1 import customers, orders
+from src.presentation.main import app
+
+_CACHED_USE_CASES = (
+    customers._create_customer_use_case,
+    customers._search_customers_use_case,
+    orders._create_order_use_case,
+    orders._customer_orders_query,
+)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Test client backed by fresh in-memory repositories for each test"""
+    monkeypatch.setattr(repositories, "_customer_repository", repositories.InMemoryCustomerRepository())
+    monkeypatch.setattr(repositories, "_order_repository", repositories.InMemoryOrderRepository())
+    for use_case in _CACHED_USE_CASES:
+        use_case.cache_clear()
+    yield TestClient(app)
+    for use_case in _CACHED_USE_CASES:
+        use_case.cache_clear()
@@ -0,0 +1,118 @@
+from uuid import UUID, uuid4
+
+from src.presentation.api.v1.customers import NEXT_CURSOR_HEADER
+
+
+def _create(client, name: str = "John Doe", email: str = "john@example.com", **extra) -> dict:
+    response = client.post("/api/v1/customers/", json={"name": name, "email": email, **extra})
+    assert response.status_code == 201
+    return response.json()
+
+
+class TestCreateCustomer:
+    def test_create_returns_customer(self, client):
+        """Test that a created customer is returned with its generated fields"""
+        response = client.post(
+            "/api/v1/customers/",
+            json={"name": "John Doe", "email": "john@example.com", "preferences": {"theme": "dark"}},
+        )
+
+        assert response.status_code == 201
+        body = response.json()
+        assert UUID(body["id"])
+        assert body["name"] == "John Doe"
+        assert body["email"] == "john@example.com"
+        assert body["is_active"] is True
+        assert body["preferences"] == {"theme": "dark"}
+        assert body["created_at"] == body["updated_at"]
+
+    def test_duplicate_email_is_bad_request(self, client):
+        """Test that reusing an email is reported as a 400 with the use case message"""
+        _create(client)
+
+        response = client.post("/api/v1/customers/", json={"name": "Jane Doe", "email": "john@example.com"})
+
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Customer with email john@example.com already exists"}
+
+    def test_invalid_email_is_unprocessable(self, client):
+        """Test that request validation rejects a malformed email"""
+        response = client.post("/api/v1/customers/", json={"name": "John Doe", "email": "not-an-email"})
+
+        assert response.status_code == 422
+
+
+class TestGetCustomer:
+    def test_get_returns_customer(self, client):
+        """Test that a customer can be fetched by ID"""
+        created = _create(client)
+
+        response = client.get(f"/api/v1/customers/{created['id']}")
+
+        assert response.status_code == 200
+        assert response.json() == created
+
+    def test_unknown_customer_is_not_found(self, client):
+        """Test that an unknown ID is a 404"""
+        response = client.get(f"/api/v1/customers/{uuid4()}")
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Customer not found"}
+
+
+class TestListCustomers:
+    def test_list_returns_all_customers(self, client):
+        """Test that every saved customer is listed"""
+        john = _create(client)
+        jane = _create(client, name="Jane Doe", email="jane@example.com")
+
+        response = client.get("/api/v1/customers/")
+
+        assert response.status_code == 200
+        assert response.json() == [john, jane]
+
+    def test_list_is_empty_without_customers(self, client):
+        """Test that an empty repository lists no customers"""
+        response = client.get("/api/v1/customers/")
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+
+class TestSearchCustomers:
+    def test_search_filters_newest_first(self, client):
+        """Test that search applies the filters and orders the matches newest first"""
+        john = _create(client)
+        _create(client, name="Jane Roe", email="jane@example.org")
+        johnny = _create(client, name="Johnny Doe", email="johnny@example.com")
+
+        response = client.get("/api/v1/customers/search", params={"name_contains": "john"})
+
+        assert response.status_code == 200
+        assert [c["id"] for c in response.json()] == [johnny["id"], john["id"]]
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+    def test_search_pages_with_cursor_header(self, client):
+        """Test that the X-Next-Cursor header fetches the following page until results run out"""
+        created = [_create(client, name=f"User {i}", email=f"user{i}@example.com") for i in range(3)]
+
+        first = client.get("/api/v1/customers/search", params={"limit": 2})
+        cursor = first.headers[NEXT_CURSOR_HEADER]
+        second = client.get("/api/v1/customers/search", params={"limit": 2, "cursor": cursor})
+
+        assert first.status_code == second.status_code == 200
+        assert [c["id"] for c in first.json()] == [created[2]["id"], created[1]["id"]]
+        assert [c["id"] for c in second.json()] == [created[0]["id"]]
+        assert NEXT_CURSOR_HEADER not in second.headers
+
+    def test_invalid_cursor_is_bad_request(self, client):
+        """Test that a cursor that does not decode is a 400"""
+        response = client.get("/api/v1/customers/search", params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Invalid cursor"}
+
+    def test_limit_out_of_range_is_unprocessable(self, client):
+        """Test that the page size is bounded"""
+        assert client.get("/api/v1/customers/search", params={"limit": 0}).status_code == 422
+        assert client.get("/api/v1/customers/search", params={"limit": 101}).status_code == 422
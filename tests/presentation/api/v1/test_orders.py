@@ -0,0 +1,101 @@
+from uuid import UUID, uuid4
+
+
+def _create_customer(client, email: str = "john@example.com") -> dict:
+    response = client.post("/api/v1/customers/", json={"name": "John Doe", "email": email})
+    assert response.status_code == 201
+    return response.json()
+
+
+def _create_order(client, customer_id: str, total_amount: str = "5.00") -> dict:
+    response = client.post("/api/v1/orders/", json={"customer_id": customer_id, "total_amount": total_amount})
+    assert response.status_code == 201
+    return response.json()
+
+
+class TestCreateOrder:
+    def test_create_returns_pending_order(self, client):
+        """Test that a created order is returned pending with its amount and details"""
+        customer = _create_customer(client)
+
+        response = client.post(
+            "/api/v1/orders/",
+            json={"customer_id": customer["id"], "total_amount": "99.99", "details": {"product": "Widget"}},
+        )
+
+        assert response.status_code == 201
+        body = response.json()
+        assert UUID(body["id"])
+        assert body["customer_id"] == customer["id"]
+        assert body["total_amount"] == "99.99"
+        assert body["currency"] == "USD"
+        assert body["status"] == "PENDING"
+        assert body["details"] == {"product": "Widget"}
+
+    def test_unknown_customer_is_bad_request(self, client):
+        """Test that ordering for a missing customer is a 400 with the use case message"""
+        customer_id = uuid4()
+
+        response = client.post("/api/v1/orders/", json={"customer_id": str(customer_id), "total_amount": "5.00"})
+
+        assert response.status_code == 400
+        assert response.json() == {"detail": f"Customer with ID {customer_id} not found"}
+
+    def test_non_positive_amount_is_unprocessable(self, client):
+        """Test that request validation rejects a zero total"""
+        customer = _create_customer(client)
+
+        response = client.post("/api/v1/orders/", json={"customer_id": customer["id"], "total_amount": "0"})
+
+        assert response.status_code == 422
+
+
+class TestGetOrder:
+    def test_get_returns_order(self, client):
+        """Test that an order can be fetched by ID"""
+        order = _create_order(client, _create_customer(client)["id"])
+
+        response = client.get(f"/api/v1/orders/{order['id']}")
+
+        assert response.status_code == 200
+        assert response.json() == order
+
+    def test_unknown_order_is_not_found(self, client):
+        """Test that an unknown ID is a 404"""
+        response = client.get(f"/api/v1/orders/{uuid4()}")
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Order not found"}
+
+
+class TestListOrders:
+    def test_list_returns_all_orders(self, client):
+        """Test that orders of every customer are listed"""
+        first = _create_order(client, _create_customer(client)["id"])
+        second = _create_order(client, _create_customer(client, "jane@example.com")["id"])
+
+        response = client.get("/api/v1/orders/")
+
+        assert response.status_code == 200
+        assert response.json() == [first, second]
+
+
+class TestCustomerOrders:
+    def test_customer_orders_newest_first(self, client):
+        """Test that only the customer's own orders are returned, newest first"""
+        customer_id = _create_customer(client)["id"]
+        older = _create_order(client, customer_id, "5.00")
+        newer = _create_order(client, customer_id, "7.50")
+        _create_order(client, _create_customer(client, "jane@example.com")["id"])
+
+        response = client.get(f"/api/v1/orders/customer/{customer_id}")
+
+        assert response.status_code == 200
+        assert response.json() == [newer, older]
+
+    def test_customer_without_orders_is_empty(self, client):
+        """Test that a customer with no orders gets an empty list"""
+        response = client.get(f"/api/v1/orders/customer/{uuid4()}")
+
+        assert response.status_code == 200
+        assert response.json() == []
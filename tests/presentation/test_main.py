@@ -0,0 +1,47 @@
+"""Tests for the FastAPI application wiring."""
+
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from src.presentation.main import app
+
+client = TestClient(app)
+
+
+class TestApiV1Mount:
+    """Test the versioned API mounted at /api/v1."""
+
+    def test_routes_are_served_under_prefix(self):
+        """Test that customer and order routes answer under /api/v1 only."""
+        assert client.get("/api/v1/customers/").status_code == 200
+        assert client.get("/api/v1/orders/").status_code == 200
+        assert client.get("/customers/").status_code == 404
+
+    def test_api_schema_lists_v1_routes(self):
+        """Test that the v1 docs describe the customer and order routes, and the root docs only the app's own."""
+        v1_paths = client.get("/api/v1/openapi.json").json()["paths"]
+        root_paths = client.get("/openapi.json").json()["paths"]
+
+        assert {"/customers/", "/customers/{customer_id}", "/orders/", "/orders/customer/{customer_id}"} <= set(
+            v1_paths
+        )
+        assert set(root_paths) == {"/health", "/"}
+        assert client.get("/api/v1/docs").status_code == 200
+
+    def test_value_error_is_reported_as_bad_request(self):
+        """Test that a ValueError raised below the endpoints becomes a 400 with its message."""
+        response = client.post("/api/v1/customers/", json={"name": "   ", "email": f"{uuid4().hex}@example.com"})
+
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Customer name cannot be empty"}
+
+
+class TestCors:
+    """Test cross-origin settings."""
+
+    def test_next_cursor_header_is_exposed(self):
+        """Test that browser clients may read the search cursor header."""
+        response = client.get("/api/v1/customers/search", headers={"Origin": "http://localhost:8501"})
+
+        assert response.headers["access-control-expose-headers"] == "X-Next-Cursor"
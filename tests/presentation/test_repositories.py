@@ -0,0 +1,114 @@
+from dataclasses import replace
+from datetime import UTC, datetime
+
+import pytest
+
+from src.domain.entities.customer import Customer
+from src.presentation.repositories import InMemoryCustomerRepository
+from src.shared_kernel import CustomerId, Email, ResourceAlreadyExistsError, uuid7
+
+
+def _customer(email: str, created_at: datetime | None = None) -> Customer:
+    now = created_at or datetime.now(UTC)
+    customer_id = CustomerId(uuid7())
+    return Customer(
+        id=customer_id.value,
+        customer_id=customer_id,
+        name="John Doe",
+        email=Email(email),
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.mark.asyncio
+class TestInMemoryCustomerRepository:
+    async def test_save_reindexes_changed_email(self):
+        """Test that saving a customer with a new email moves it in the email index"""
+        repo = InMemoryCustomerRepository()
+        customer = await repo.save(_customer("old@example.com"))
+
+        updated = await repo.save(replace(customer, email=Email("new@example.com")))
+
+        assert await repo.find_by_email("old@example.com") is None
+        assert await repo.find_by_email("new@example.com") is updated
+        assert await repo.find_by_id(customer.id) is updated
+
+        # The released email can be taken by another customer
+        await repo.save(_customer("old@example.com"))
+
+    async def test_search_matches_changed_email(self):
+        """Test that the search filters follow an email change"""
+        repo = InMemoryCustomerRepository()
+        customer = await repo.save(_customer("old@example.com"))
+        await repo.save(replace(customer, email=Email("new@example.com")))
+
+        old_matches, _ = await repo.search(email_contains="OLD")
+        new_matches, _ = await repo.search(email_contains="NEW")
+
+        assert old_matches == []
+        assert [c.id for c in new_matches] == [customer.id]
+
+    async def test_save_rejects_duplicate_email(self):
+        """Test that a new customer cannot take an email already in use"""
+        repo = InMemoryCustomerRepository()
+        await repo.save(_customer("john@example.com"))
+
+        with pytest.raises(ResourceAlreadyExistsError):
+            await repo.save(_customer("john@example.com"))
+
+    async def test_update_rejects_duplicate_email(self):
+        """Test that an update to another customer's email is rejected and leaves the indexes intact"""
+        repo = InMemoryCustomerRepository()
+        john = await repo.save(_customer("john@example.com"))
+        jane = await repo.save(_customer("jane@example.com"))
+
+        with pytest.raises(ResourceAlreadyExistsError):
+            await repo.save(replace(jane, email=Email("john@example.com")))
+
+        assert await repo.find_by_email("john@example.com") is john
+        assert await repo.find_by_email("jane@example.com") is jane
+        assert await repo.find_by_id(jane.id) is jane
+
+    async def test_save_same_customer_keeps_email(self):
+        """Test that re-saving a customer under its own email is not a conflict"""
+        repo = InMemoryCustomerRepository()
+        customer = await repo.save(_customer("john@example.com"))
+
+        saved = await repo.save(customer.deactivate())
+
+        assert saved.is_active is False
+        assert await repo.find_by_email("john@example.com") is saved
+
+    async def test_search_pages_across_created_at_ties(self):
+        """Test that keyset pages split customers sharing a created_at without gaps or repeats"""
+        repo = InMemoryCustomerRepository()
+        created_at = datetime(2024, 1, 1, tzinfo=UTC)
+        customers = [await repo.save(_customer(f"user{i}@example.com", created_at)) for i in range(5)]
+
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            page, cursor = await repo.search(limit=2, cursor=cursor)
+            seen.extend(c.id for c in page)
+            pages += 1
+            if cursor is None:
+                break
+
+        assert pages == 3
+        assert seen == sorted((c.id for c in customers), reverse=True)
+
+    async def test_search_last_full_page_has_no_cursor(self):
+        """Test that a page that exactly exhausts the matches returns no cursor"""
+        repo = InMemoryCustomerRepository()
+        created_at = datetime(2024, 1, 1, tzinfo=UTC)
+        for i in range(4):
+            await repo.save(_customer(f"user{i}@example.com", created_at))
+
+        first, cursor = await repo.search(limit=2)
+        second, last_cursor = await repo.search(limit=2, cursor=cursor)
+
+        assert len(first) == len(second) == 2
+        assert cursor == (first[-1].created_at, first[-1].id)
+        assert last_cursor is None
@@ -1,5 +1,5 @@
+from dataclasses import FrozenInstanceError
 from unittest.mock import AsyncMock
-from uuid import uuid4
 
 import pytest
 
@@ -7,8 +7,7 @@ from src.application.use_cases.commands.create_customer import (
     CreateCustomerCommand,
     CreateCustomerUseCase,
 )
-from src.domain.entities.customer import Customer
-from src.shared_kernel import CustomerId, Email
+from src.shared_kernel import ResourceAlreadyExistsError
 
 
 @pytest.mark.asyncio
@@ -17,7 +16,6 @@ class TestCreateCustomerUseCase:
         """Test successful customer creation"""
         # Mock repository
         mock_repo = AsyncMock()
-        mock_repo.find_by_email.return_value = None  # No existing customer
         mock_repo.save.side_effect = lambda c: c  # Return saved customer
 
         # Create use case
@@ -34,22 +32,15 @@ class TestCreateCustomerUseCase:
         assert result.preferences == {"theme": "dark"}
         assert result.is_active is True
 
-        # Verify repository interactions
-        mock_repo.find_by_email.assert_called_once_with("john@example.com")
+        # Verify repository interactions (no pre-insert lookup)
+        mock_repo.find_by_email.assert_not_called()
         mock_repo.save.assert_called_once()
 
     async def test_create_customer_duplicate_email(self):
         """Test customer creation with duplicate email"""
-        # Mock repository with existing customer
-        existing_customer = Customer.create(
-            customer_id=CustomerId(uuid4()),
-            name="Existing User",
-            email=Email("john@example.com"),
-            preferences={},
-        )
-
+        # Mock repository rejecting the duplicate on save
         mock_repo = AsyncMock()
-        mock_repo.find_by_email.return_value = existing_customer
+        mock_repo.save.side_effect = ResourceAlreadyExistsError("Customer", "email", "john@example.com")
 
         # Create use case
         use_case = CreateCustomerUseCase(mock_repo)
@@ -60,14 +51,13 @@ class TestCreateCustomerUseCase:
         with pytest.raises(ValueError, match="already exists"):
             await use_case.execute(command)
 
-        # Verify repository called but save was not
-        mock_repo.find_by_email.assert_called_once_with("john@example.com")
-        mock_repo.save.assert_not_called()
+        # Verify the duplicate was detected by save, not a separate lookup
+        mock_repo.find_by_email.assert_not_called()
+        mock_repo.save.assert_called_once()
 
     async def test_create_customer_with_empty_preferences(self):
         """Test customer creation with no preferences"""
         mock_repo = AsyncMock()
-        mock_repo.find_by_email.return_value = None
         mock_repo.save.side_effect = lambda c: c
 
         use_case = CreateCustomerUseCase(mock_repo)
@@ -81,3 +71,13 @@ class TestCreateCustomerUseCase:
         result = await use_case.execute(command)
 
         assert result.preferences == {}  # Should default to empty dict
+
+
+class TestCreateCustomerCommand:
+    def test_command_is_immutable_and_slotted(self):
+        """Test that commands are frozen records without a per-instance __dict__"""
+        command = CreateCustomerCommand(name="John Doe", email="john@example.com")
+
+        assert not hasattr(command, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            command.name = "Jane Doe"  # type: ignore[misc]
@@ -0,0 +1,111 @@
+from decimal import Decimal
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.use_cases.commands.create_order import CreateOrderCommand
+from src.application.use_cases.commands.create_orders_batch import (
+    CreateOrdersBatchCommand,
+    CreateOrdersBatchUseCase,
+)
+from src.domain.entities.customer import Customer
+from src.domain.entities.order import OrderStatus
+from src.shared_kernel import CustomerId, Email
+
+
+def _customer(name: str, email: str) -> Customer:
+    return Customer.create(customer_id=CustomerId(uuid4()), name=name, email=Email(email))
+
+
+@pytest.mark.asyncio
+class TestCreateOrdersBatchUseCase:
+    async def test_create_orders_batch_success(self):
+        """Test that a batch loads customers once and saves all orders together"""
+        alice = _customer("Alice", "alice@example.com")
+        bob = _customer("Bob", "bob@example.com")
+
+        mock_customer_repo = AsyncMock()
+        mock_customer_repo.find_by_ids.return_value = {alice.id: alice, bob.id: bob}
+
+        mock_order_repo = AsyncMock()
+        mock_order_repo.save_many.side_effect = lambda orders: orders
+
+        use_case = CreateOrdersBatchUseCase(mock_order_repo, mock_customer_repo)
+
+        command = CreateOrdersBatchCommand(
+            orders=[
+                CreateOrderCommand(customer_id=alice.id, total_amount=Decimal("10.00")),
+                CreateOrderCommand(customer_id=bob.id, total_amount=Decimal("20.00")),
+                CreateOrderCommand(customer_id=alice.id, total_amount=Decimal("30.00"), details={"gift": True}),
+            ]
+        )
+
+        result = await use_case.execute(command)
+
+        # Assertions
+        assert [o.total_amount.amount for o in result] == [Decimal("10.00"), Decimal("20.00"), Decimal("30.00")]
+        assert [o.customer_id.value for o in result] == [alice.id, bob.id, alice.id]
+        assert all(o.status == OrderStatus.PENDING for o in result)
+        assert result[2].details == {"gift": True}
+
+        # Verify repository interactions
+        mock_customer_repo.find_by_ids.assert_called_once_with({alice.id, bob.id})
+        mock_customer_repo.find_by_id.assert_not_called()
+        mock_order_repo.save_many.assert_called_once()
+        mock_order_repo.save.assert_not_called()
+
+    async def test_create_orders_batch_customer_not_found(self):
+        """Test that an unknown customer rejects the whole batch"""
+        alice = _customer("Alice", "alice@example.com")
+
+        mock_customer_repo = AsyncMock()
+        mock_customer_repo.find_by_ids.return_value = {alice.id: alice}
+
+        mock_order_repo = AsyncMock()
+
+        use_case = CreateOrdersBatchUseCase(mock_order_repo, mock_customer_repo)
+
+        command = CreateOrdersBatchCommand(
+            orders=[
+                CreateOrderCommand(customer_id=alice.id, total_amount=Decimal("10.00")),
+                CreateOrderCommand(customer_id=uuid4(), total_amount=Decimal("20.00")),
+            ]
+        )
+
+        with pytest.raises(ValueError, match="not found"):
+            await use_case.execute(command)
+
+        mock_order_repo.save_many.assert_not_called()
+
+    async def test_create_orders_batch_inactive_customer(self):
+        """Test that an inactive customer rejects the whole batch"""
+        inactive = _customer("Alice", "alice@example.com").deactivate("Test deactivation")
+
+        mock_customer_repo = AsyncMock()
+        mock_customer_repo.find_by_ids.return_value = {inactive.id: inactive}
+
+        mock_order_repo = AsyncMock()
+
+        use_case = CreateOrdersBatchUseCase(mock_order_repo, mock_customer_repo)
+
+        command = CreateOrdersBatchCommand(
+            orders=[CreateOrderCommand(customer_id=inactive.id, total_amount=Decimal("10.00"))]
+        )
+
+        with pytest.raises(ValueError, match="inactive customer"):
+            await use_case.execute(command)
+
+        mock_order_repo.save_many.assert_not_called()
+
+    async def test_create_orders_batch_empty(self):
+        """Test that an empty batch touches no repository"""
+        mock_customer_repo = AsyncMock()
+        mock_order_repo = AsyncMock()
+
+        use_case = CreateOrdersBatchUseCase(mock_order_repo, mock_customer_repo)
+
+        assert await use_case.execute(CreateOrdersBatchCommand(orders=[])) == []
+
+        mock_customer_repo.find_by_ids.assert_not_called()
+        mock_order_repo.save_many.assert_not_called()
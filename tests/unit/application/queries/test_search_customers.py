@@ -1,5 +1,6 @@
 """Tests for SearchCustomersUseCase."""
 
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
@@ -28,15 +29,16 @@ class TestSearchCustomersQuery:
 
     def test_valid_query_creation(self) -> None:
         """Test creating a valid query object."""
+        cursor = (datetime.now(UTC), uuid4())
         query = SearchCustomersQuery(
-            name_contains="John", email_contains="@example.com", is_active=True, limit=10, offset=0
+            name_contains="John", email_contains="@example.com", is_active=True, limit=10, cursor=cursor
         )
 
         assert query.name_contains == "John"
         assert query.email_contains == "@example.com"
         assert query.is_active is True
         assert query.limit == 10
-        assert query.offset == 0
+        assert query.cursor == cursor
 
     def test_default_values(self) -> None:
         """Test query with default values."""
@@ -46,7 +48,7 @@ class TestSearchCustomersQuery:
         assert query.email_contains is None
         assert query.is_active is None
         assert query.limit == 50
-        assert query.offset == 0
+        assert query.cursor is None
 
     def test_invalid_limit_zero_raises_error(self) -> None:
         """Test that zero limit raises ValueError."""
@@ -63,11 +65,6 @@ class TestSearchCustomersQuery:
         with pytest.raises(ValueError, match="Limit cannot exceed 100"):
             SearchCustomersQuery(limit=101)
 
-    def test_invalid_negative_offset_raises_error(self) -> None:
-        """Test that negative offset raises ValueError."""
-        with pytest.raises(ValueError, match="Offset cannot be negative"):
-            SearchCustomersQuery(offset=-1)
-
 
 @pytest.mark.asyncio
 class TestSearchCustomersUseCase:
@@ -78,23 +75,26 @@ class TestSearchCustomersUseCase:
     ) -> None:
         """Test that execute calls repository with correct parameters."""
         # Arrange
+        cursor = (datetime.now(UTC), uuid4())
         query = SearchCustomersQuery(
-            name_contains="John", email_contains="@example.com", is_active=True, limit=10, offset=5
+            name_contains="John", email_contains="@example.com", is_active=True, limit=10, cursor=cursor
         )
         expected_customers = [
             Customer.create(
                 customer_id=CustomerId(uuid4()), name="John Doe", email=Email("john@example.com"), preferences={}
             )
         ]
-        mock_customer_repository.search.return_value = expected_customers
+        next_cursor = (expected_customers[0].created_at, expected_customers[0].id)
+        mock_customer_repository.search.return_value = (expected_customers, next_cursor)
 
         # Act
-        result = await search_customers_use_case.execute(query)
+        result, result_cursor = await search_customers_use_case.execute(query)
 
         # Assert
         assert result == expected_customers
+        assert result_cursor == next_cursor
         mock_customer_repository.search.assert_called_once_with(
-            name_contains="John", email_contains="@example.com", is_active=True, limit=10, offset=5
+            name_contains="John", email_contains="@example.com", is_active=True, limit=10, cursor=cursor
         )
 
     async def test_execute_with_default_query(
@@ -104,15 +104,16 @@ class TestSearchCustomersUseCase:
         # Arrange
         query = SearchCustomersQuery()
         expected_customers = []
-        mock_customer_repository.search.return_value = expected_customers
+        mock_customer_repository.search.return_value = (expected_customers, None)
 
         # Act
-        result = await search_customers_use_case.execute(query)
+        result, next_cursor = await search_customers_use_case.execute(query)
 
         # Assert
         assert result == expected_customers
+        assert next_cursor is None
         mock_customer_repository.search.assert_called_once_with(
-            name_contains=None, email_contains=None, is_active=None, limit=50, offset=0
+            name_contains=None, email_contains=None, is_active=None, limit=50, cursor=None
         )
 
     async def test_execute_returns_filtered_customers(
@@ -135,10 +136,10 @@ class TestSearchCustomersUseCase:
                 preferences={"theme": "light"},
             ),
         ]
-        mock_customer_repository.search.return_value = expected_customers
+        mock_customer_repository.search.return_value = (expected_customers, None)
 
         # Act
-        result = await search_customers_use_case.execute(query)
+        result, _ = await search_customers_use_case.execute(query)
 
         # Assert
         assert len(result) == 2
@@ -151,13 +152,14 @@ class TestSearchCustomersUseCase:
         """Test that execute returns empty list when no customers match."""
         # Arrange
         query = SearchCustomersQuery(name_contains="NonexistentName")
-        mock_customer_repository.search.return_value = []
+        mock_customer_repository.search.return_value = ([], None)
 
         # Act
-        result = await search_customers_use_case.execute(query)
+        result, next_cursor = await search_customers_use_case.execute(query)
 
         # Assert
         assert result == []
+        assert next_cursor is None
         mock_customer_repository.search.assert_called_once_with(
-            name_contains="NonexistentName", email_contains=None, is_active=None, limit=50, offset=0
+            name_contains="NonexistentName", email_contains=None, is_active=None, limit=50, cursor=None
         )
@@ -1,7 +1,10 @@
+from unittest.mock import patch
 from uuid import uuid4
 
+import pytest
+
 from src.domain.entities.customer import Customer, CustomerCreated, CustomerDeactivated
-from src.shared_kernel import Address, CustomerId, Email
+from src.shared_kernel import Address, CustomerId, Email, PhoneNumber
 
 
 class TestCustomer:
@@ -29,6 +32,56 @@ class TestCustomer:
         assert isinstance(events[0], CustomerCreated)
         assert events[0].customer_id == customer_id
         assert events[0].customer_name == "John Doe"
+        assert events[0].customer_email == "john@example.com"
+
+    def test_customer_creation_uses_single_timestamp(self):
+        """Test that creation timestamps match the creation event"""
+        customer = Customer.create(customer_id=CustomerId(uuid4()), name="John Doe", email=Email("john@example.com"))
+
+        events = customer.collect_domain_events()
+        assert customer.created_at == customer.updated_at
+        assert events[0].occurred_at == customer.created_at
+
+    def test_customer_uses_slots(self):
+        """Test that customer instances carry no per-instance __dict__"""
+        customer = Customer.create(customer_id=CustomerId(uuid4()), name="John Doe", email=Email("john@example.com"))
+
+        assert not hasattr(customer, "__dict__")
+        assert customer.id == customer.customer_id.value
+
+    def test_validation_cannot_be_skipped_by_constructor(self):
+        """Test that the constructor always validates and has no flag to skip it"""
+        customer_id = CustomerId(uuid4())
+
+        with pytest.raises(ValueError, match="name cannot be empty"):
+            Customer(id=uuid4(), customer_id=customer_id, name="  ", email=Email("john@example.com"))
+        with pytest.raises(TypeError):
+            Customer(  # type: ignore[call-arg]
+                id=uuid4(), customer_id=customer_id, name="  ", email=Email("john@example.com"), _validated=True
+            )
+
+    def test_update_skips_revalidation_and_keeps_events_apart(self):
+        """Test that successors are not revalidated and do not share the pending event queue"""
+        customer = Customer.create(customer_id=CustomerId(uuid4()), name="John Doe", email=Email("john@example.com"))
+
+        with patch.object(Customer, "_validate_business_rules") as mock_validate:
+            updated = customer.update_phone(PhoneNumber("555-123-4567"))
+
+        mock_validate.assert_not_called()
+        assert updated.phone == PhoneNumber("555-123-4567")
+        assert customer.phone is None
+        assert updated.collect_domain_events() == []
+        assert len(customer.collect_domain_events()) == 1
+
+    def test_customer_without_preferences_shares_empty_mapping(self):
+        """Test that customers created without preferences share one read-only empty mapping"""
+        first = Customer.create(customer_id=CustomerId(uuid4()), name="John Doe", email=Email("john@example.com"))
+        second = Customer.create(customer_id=CustomerId(uuid4()), name="Jane Doe", email=Email("jane@example.com"))
+
+        assert first.preferences == {}
+        assert first.preferences is second.preferences
+        with pytest.raises(TypeError):
+            first.preferences["theme"] = "dark"  # type: ignore[index]
 
     def test_customer_creation_with_address_and_phone(self):
         """Test creating a customer with address and phone"""
@@ -74,6 +127,7 @@ class TestCustomer:
         assert isinstance(events[0], CustomerDeactivated)
         assert events[0].customer_id == customer_id
         assert events[0].reason == "Business closure"
+        assert events[0].occurred_at == deactivated.updated_at
 
     def test_customer_deactivate_already_inactive_raises_error(self):
         """Test that deactivating an inactive customer raises error"""
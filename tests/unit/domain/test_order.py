@@ -1,4 +1,5 @@
 from decimal import Decimal
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -39,6 +40,7 @@ class TestOrder:
         assert isinstance(events[0], OrderCreated)
         assert events[0].order_id == order_id
         assert events[0].customer_id == customer_id
+        assert events[0].occurred_at == order.created_at == order.updated_at
 
     def test_order_creation_with_zero_amount_raises_error(self):
         """Test that creating order with zero amount raises error"""
@@ -110,6 +112,7 @@ class TestOrder:
         assert isinstance(events[0], OrderCancelled)
         assert events[0].order_id == order_id
         assert events[0].reason == "Customer request"
+        assert events[0].occurred_at == cancelled.updated_at
 
     def test_cancel_shipped_order_raises_error(self):
         """Test that cancelling shipped order raises error"""
@@ -172,3 +175,53 @@ class TestOrder:
         confirmed_order = order.confirm()
         with pytest.raises(BusinessRuleViolationError, match="Only pending orders can be confirmed"):
             confirmed_order.confirm()
+
+    def test_status_transition_skips_revalidation(self):
+        """Test that successors of a validated order are not revalidated"""
+        order = Order.create(
+            order_id=OrderId(uuid4()),
+            customer_id=CustomerId(uuid4()),
+            total_amount=Money(Decimal("50.00"), "USD"),
+        )
+
+        with patch.object(Order, "_validate_business_rules") as mock_validate:
+            confirmed_order = order.confirm()
+            cancelled_order = confirmed_order.cancel()
+
+        mock_validate.assert_not_called()
+        assert confirmed_order.id == order.id
+        assert cancelled_order.id == order.id
+        assert cancelled_order.created_at == order.created_at
+
+    def test_domain_event_to_dict(self):
+        """Test that slotted domain events serialize all of their fields"""
+        order_id = OrderId(uuid4())
+        customer_id = CustomerId(uuid4())
+        total_amount = Money(Decimal("50.00"), "USD")
+
+        order = Order.create(order_id=order_id, customer_id=customer_id, total_amount=total_amount)
+        event = order.collect_domain_events()[0]
+
+        assert not hasattr(event, "__dict__")
+        data = event.to_dict()
+        assert data["event_type"] == "OrderCreated"
+        assert data["event_id"] == str(event.event_id)
+        assert data["occurred_at"] == event.occurred_at.isoformat()
+        assert data["order_id"] == order_id
+        assert data["customer_id"] == customer_id
+        assert data["total_amount"] == total_amount
+
+    def test_status_transition_hands_over_pending_events(self):
+        """Test that pending events move to the successor instead of being copied"""
+        order = Order.create(
+            order_id=OrderId(uuid4()),
+            customer_id=CustomerId(uuid4()),
+            total_amount=Money(Decimal("50.00"), "USD"),
+        )
+
+        confirmed_order = order.confirm()
+
+        assert order.collect_domain_events() == []
+        events = confirmed_order.collect_domain_events()
+        assert [type(e) for e in events] == [OrderCreated, OrderStatusChanged]
+        assert confirmed_order.collect_domain_events() == []
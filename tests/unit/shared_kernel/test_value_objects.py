@@ -1,11 +1,12 @@
 """Tests for shared kernel value objects."""
 
 from decimal import Decimal
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 
-from src.shared_kernel import Address, CustomerId, Email, Money, OrderId, PhoneNumber
+from src.shared_kernel import Address, CustomerId, Email, Money, OrderId, PhoneNumber, uuid7
 
 
 class TestEmail:
@@ -35,6 +36,10 @@ class TestEmail:
         with pytest.raises(ValueError, match="Email cannot be empty"):
             Email("")
 
+    def test_email_has_no_instance_dict(self):
+        """Test that value objects are slotted."""
+        assert not hasattr(Email("test@example.com"), "__dict__")
+
 
 class TestMoney:
     """Test cases for Money value object."""
@@ -155,6 +160,15 @@ class TestPhoneNumber:
         with pytest.raises(ValueError, match="cannot have more than 15 digits"):
             PhoneNumber("1234567890123456")  # Too long
 
+    def test_cached_digits_not_part_of_equality(self):
+        """Test that the stored digits do not affect equality, hashing or repr."""
+        phone = PhoneNumber("(555) 123-4567")
+
+        assert phone == PhoneNumber("(555) 123-4567")
+        assert hash(phone) == hash(PhoneNumber("(555) 123-4567"))
+        assert "_digits" not in repr(phone)
+        assert str(phone) == "(555) 123-4567"
+
 
 class TestStronglyTypedIds:
     """Test cases for strongly typed identifiers."""
@@ -184,3 +198,20 @@ class TestStronglyTypedIds:
         # Even with same UUID, they should be different types
         assert not isinstance(customer_id, type(order_id))
         assert customer_id != order_id  # Value objects compare by all attributes
+
+    def test_uuid7_version_and_variant(self):
+        """Test that generated IDs are RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_uuid7_is_time_ordered(self):
+        """Test that IDs generated in later milliseconds sort after earlier ones."""
+        with patch("src.shared_kernel.types.identifiers.time.time_ns", return_value=1_700_000_000_000_000_000):
+            earlier = uuid7()
+        with patch("src.shared_kernel.types.identifiers.time.time_ns", return_value=1_700_000_000_001_000_000):
+            later = uuid7()
+
+        assert earlier < later
+        assert earlier.int >> 80 == 1_700_000_000_000